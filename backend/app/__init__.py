@@ -23,9 +23,21 @@ def create_app(config_override=None):
     app.config.from_object(Config)
     if config_override:
         app.config.update(config_override)
+    from backend.app.utils.db_pool import configure_engine, init_db_pool
+    from backend.app.utils.request_metrics import init_request_metrics
+
+    configure_engine(app)
     db.init_app(app)
+    # Reason: Request hooks go first so their timing covers every other hook
+    with app.app_context():
+        init_db_pool(app, db.engine)
+        init_request_metrics(app, db.engine)
     migrate.init_app(app, db)
     CORS(app)
+
+    from backend.app.utils.serializer import init_serializer
+
+    init_serializer(app)
     # Reason: Import models to register with SQLAlchemy
     # Reason: Import models to register with SQLAlchemy
     import backend.models  # Reason: Only import for registration, not direct usage
@@ -40,6 +52,11 @@ def create_app(config_override=None):
     from backend.app.routes.timeline import bp as timeline_bp
     from backend.app.routes.autosave import bp as autosave_bp
     from backend.app.routes.export import bp as export_bp
+    from backend.app.routes.manuscript_import import bp as import_bp
+    from backend.app.routes.search import bp as search_bp
+    from backend.app.routes.stats import bp as stats_bp
+    from backend.app.routes.health import bp as health_bp
+    from backend.app.routes.metrics import bp as metrics_bp
 
     app.register_blueprint(auth_bp)
     app.register_blueprint(projects_bp)
@@ -50,6 +67,41 @@ def create_app(config_override=None):
     app.register_blueprint(timeline_bp)
     app.register_blueprint(autosave_bp)
     app.register_blueprint(export_bp)
+    app.register_blueprint(import_bp)
+    app.register_blueprint(search_bp)
+    app.register_blueprint(stats_bp)
+    app.register_blueprint(health_bp)
+    app.register_blueprint(metrics_bp)
+
+    from backend.app.cli import autosave_cli, search_cli, stats_cli
+
+    app.cli.add_command(autosave_cli)
+    app.cli.add_command(search_cli)
+    app.cli.add_command(stats_cli)
+
+    from backend.app.utils.token_cache import init_token_cache
+
+    init_token_cache(app)
+
+    from backend.app.utils.ownership import init_ownership_cache
+
+    init_ownership_cache(app)
+
+    from backend.app.services.password_hasher import init_password_hasher
+
+    init_password_hasher(app)
+
+    from backend.app.services.ordering_service import init_rank_rebalancer
+
+    init_rank_rebalancer(app)
+
+    from backend.app.services.autosave_buffer import init_autosave_buffer
+
+    init_autosave_buffer(app)
+
+    from backend.app.services.autosave_compactor import init_autosave_compactor
+
+    init_autosave_compactor(app)
 
     # Add a default root endpoint for API status
     @app.route("/")
@@ -68,6 +120,11 @@ def create_app(config_override=None):
                 "/timeline/<project_id>",
                 "/autosave",
                 "/export/<project_id>",
+                "/import",
+                "/search",
+                "/stats/projects/<project_id>",
+                "/health/pool",
+                "/metrics",
             ],
         }, 200
 
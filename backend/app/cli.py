@@ -0,0 +1,98 @@
+"""
+Flask CLI commands for backend maintenance tasks.
+"""
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from backend.app import db
+from backend.app.services.autosave_compactor import (
+    AutosaveCompactor,
+    parse_retention,
+)
+from backend.app.services.autosave_service import AutosaveService
+from backend.app.services.stats_service import StatsService
+from backend.models import search_index
+from backend.models.autosave_version import AutosaveVersion
+
+autosave_cli = AppGroup("autosave", help="Autosave history maintenance.")
+
+
+@autosave_cli.command("reencode")
+@click.option("--interval", type=int, default=None, help="Keyframe interval.")
+@click.option(
+    "--keyframes-only",
+    is_flag=True,
+    help="Store every version as a full keyframe (before a downgrade).",
+)
+def reencode_command(interval, keyframes_only):
+    """Rewrite autosave history into keyframe + delta chains."""
+    if keyframes_only:
+        interval = 1
+    targets = (
+        db.session.query(AutosaveVersion.scene_id, AutosaveVersion.draft_id)
+        .distinct()
+        .all()
+    )
+    total_rows = total_before = total_after = 0
+    for scene_id, draft_id in targets:
+        # Reason: One transaction per scene/draft keeps locks short
+        rows, before, after = AutosaveService.reencode_history(
+            scene_id, draft_id, interval
+        )
+        db.session.commit()
+        total_rows += rows
+        total_before += before
+        total_after += after
+    click.echo(
+        f"Re-encoded {total_rows} versions across {len(targets)} targets: "
+        f"{total_before} -> {total_after} stored characters"
+    )
+
+
+@autosave_cli.command("compact")
+@click.option(
+    "--retention", default=None, help='Override tiers, e.g. "1h:0,1d:10m,*:1d".'
+)
+@click.option("--batch-size", type=int, default=None, help="Deletes per commit.")
+def compact_command(retention, batch_size):
+    """Thin old autosave history according to AUTOSAVE_RETENTION."""
+    compactor = AutosaveCompactor.from_config(current_app)
+    if retention:
+        try:
+            compactor.tiers = parse_retention(retention)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--retention") from e
+    if batch_size:
+        compactor.batch_size = batch_size
+    result = compactor.compact()
+    click.echo(
+        f"Reclaimed {result['rows_deleted']} versions "
+        f"({result['chars_reclaimed']} stored characters) from "
+        f"{result['chains_rewritten']} chains across {result['targets']} targets"
+    )
+    if result["errors"]:
+        raise click.ClickException(f"{result['errors']} targets failed")
+
+
+search_cli = AppGroup("search", help="Full-text search index maintenance.")
+
+
+@search_cli.command("rebuild")
+def rebuild_search_command():
+    """Recreate the search indexes from the stored scenes, drafts and annotations."""
+    with db.engine.begin() as connection:
+        search_index.rebuild(connection)
+    click.echo(f"Rebuilt search indexes on {db.engine.dialect.name}")
+
+
+stats_cli = AppGroup("stats", help="Word-count statistics maintenance.")
+
+
+@stats_cli.command("rebuild")
+def rebuild_stats_command():
+    """Recount every scene and recompute chapter and project totals."""
+    scenes = StatsService.rebuild()
+    db.session.commit()
+    click.echo(f"Recounted {scenes} scenes")
@@ -6,30 +6,44 @@ from flask import Blueprint, request, jsonify
 from backend.models.annotation import Annotation
 from backend.app import db
 from backend.app.schemas.annotation_schema import AnnotationSchema
-from flask_jwt_extended import jwt_required
+from backend.app.utils.pagination import paginated_response
+from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owned_by, owns
+from backend.app.utils.serializer import ANNOTATION_ENCODER
 
 bp = Blueprint("annotations", __name__, url_prefix="/annotations")
 
 annotation_schema = AnnotationSchema()
-annotations_schema = AnnotationSchema(many=True)
 
 
 @bp.route("/", methods=["GET"])
-@jwt_required()
+@jwt_required
 def get_annotations():
-    """Get all annotations."""
-    annotations = Annotation.query.all()
-    return jsonify(annotations_schema.dump(annotations)), 200
+    """
+    Get the user's annotations ordered by creation, one keyset page at a time.
+    Query params: draft_id, limit, cursor, stream
+    """
+    query = Annotation.query
+    draft_id = request.args.get("draft_id")
+    if draft_id:
+        if not owns("draft", draft_id, request.user_id):
+            return jsonify({"error": "Draft not found"}), 404
+        query = query.filter_by(draft_id=draft_id)
+    else:
+        query = query.filter(owned_by("annotation", request.user_id))
+    return paginated_response(query, Annotation, ANNOTATION_ENCODER, request.args)
 
 
 @bp.route("/", methods=["POST"])
-@jwt_required()
+@jwt_required
 def create_annotation():
     """Create a new annotation."""
     data = request.get_json()
     errors = annotation_schema.validate(data)
     if errors:
         return jsonify(errors), 400
+    if not owns("draft", data["draft_id"], request.user_id):
+        return jsonify({"error": "Draft not found"}), 404
     annotation = Annotation(
         draft_id=data["draft_id"],
         context=data.get("context", ""),
@@ -37,4 +51,4 @@ def create_annotation():
     )
     db.session.add(annotation)
     db.session.commit()
-    return jsonify(annotation_schema.dump(annotation)), 201
+    return ANNOTATION_ENCODER.response(annotation, 201)
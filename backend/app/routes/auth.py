@@ -6,11 +6,19 @@ from flask import Blueprint, request, jsonify
 from backend.models.user import User
 from backend.app import db
 from backend.app.services.auth_service import AuthService
+from backend.app.services.password_hasher import HasherBusy
 import uuid
 
 bp = Blueprint("auth", __name__, url_prefix="/auth")
 
 
+def _busy():
+    """503 response used when the password hashing pool is saturated."""
+    response = jsonify({"error": "Server busy, retry later"})
+    response.headers["Retry-After"] = "1"
+    return response, 503
+
+
 @bp.route("/register", methods=["POST"])
 def register():
     """
@@ -26,6 +34,7 @@ def register():
         201: {"token": "<jwt>"}
         400: {"error": "Validation error"}
         409: {"error": "Email already registered"}
+        503: {"error": "Server busy, retry later"}
     """
     from backend.app.schemas.register_schema import RegisterSchema
 
@@ -39,11 +48,11 @@ def register():
     password = data["password"]
     if db.session.query(User).filter_by(email=email).first():
         return jsonify({"error": "Email already registered"}), 409
-    user = User(
-        id=str(uuid.uuid4()),
-        email=email,
-        password_hash=AuthService.hash_password(password),
-    )
+    try:
+        password_hash = AuthService.hash_password(password)
+    except HasherBusy:
+        return _busy()
+    user = User(id=str(uuid.uuid4()), email=email, password_hash=password_hash)
     db.session.add(user)
     db.session.commit()
     token = AuthService.generate_token(str(user.id))
@@ -65,6 +74,7 @@ def login():
         200: {"token": "<jwt>"}
         400: {"error": "Validation error"}
         401: {"error": "Invalid credentials"}
+        503: {"error": "Server busy, retry later"}
     """
     from backend.app.schemas.auth_schema import LoginSchema
 
@@ -77,8 +87,21 @@ def login():
     email = data["email"]
     password = data["password"]
     user = db.session.query(User).filter_by(email=email).first()
-    if not user or not AuthService.verify_password(password, user.password_hash):
+    try:
+        valid = user is not None and AuthService.verify_password(
+            password, user.password_hash
+        )
+    except HasherBusy:
+        return _busy()
+    if not valid:
         # Reason: Invalid credentials
         return jsonify({"error": "Invalid credentials"}), 401
+    if AuthService.needs_rehash(user.password_hash):
+        # Reason: Upgrade hashes made with an old algorithm or cost; best effort
+        try:
+            user.password_hash = AuthService.hash_password(password)
+            db.session.commit()
+        except HasherBusy:
+            pass
     token = AuthService.generate_token(str(user.id))
     return jsonify({"token": token}), 200
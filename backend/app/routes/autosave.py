@@ -1,19 +1,53 @@
 """
-Autosave route for POST /autosave
+Autosave routes for POST /autosave, POST /autosave/batch, GET /autosave and
+GET /autosave/<version_id>
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.attributes import set_committed_value
 from backend.models.autosave_version import AutosaveVersion
 from backend.app import db
 from backend.app.schemas.autosave_version_schema import AutosaveVersionSchema
-from flask_jwt_extended import jwt_required
+from backend.app.services.autosave_service import AutosaveService
+from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owns, owns_all
+from backend.app.utils.pagination import PaginationError, parse_limit
+from backend.app.utils.serializer import AUTOSAVE_ENCODER, FieldsError
 
 bp = Blueprint("autosave", __name__, url_prefix="/autosave")
 autosave_schema = AutosaveVersionSchema()
+# Reason: Dump metadata only; content is rebuilt separately (never lazy-loaded)
+autosave_meta_schema = AutosaveVersionSchema(exclude=("content",))
+
+
+def _owns_target(scene_id, draft_id) -> bool:
+    """True if the given scene and/or draft belong to the current user."""
+    return all(
+        owns(kind, row_id, request.user_id)
+        for kind, row_id in (("scene", scene_id), ("draft", draft_id))
+        if row_id
+    )
+
+
+def _ack(status, version):
+    """Acknowledge one batch frame with the version that now holds its text."""
+    return {
+        "status": status,
+        "id": version.id,
+        "saved_at": version.saved_at.isoformat(),
+    }
+
+
+def _dump(version, content):
+    """Serialize a version with its rebuilt full content."""
+    data = autosave_meta_schema.dump(version)
+    data["content"] = content
+    return data
 
 
 @bp.route("/", methods=["POST"])
-@jwt_required()
+@jwt_required
 def autosave():
     """Create a new autosave snapshot for a scene or draft."""
     data = request.get_json()
@@ -22,43 +56,166 @@ def autosave():
         return jsonify(errors), 400
     if not data.get("scene_id") and not data.get("draft_id"):
         return jsonify({"error": "scene_id or draft_id required"}), 400
-    # Reason: Server-side deduplication to prevent duplicate autosaves within 30 seconds
-    from datetime import datetime, timedelta
-
-    user_id = None
-    # Get user identity from JWT
-    from flask_jwt_extended import get_jwt_identity
-
-    user_id = get_jwt_identity()
-    # Build query for latest autosave
-    query = AutosaveVersion.query
-    if data.get("scene_id"):
-        query = query.filter_by(scene_id=data["scene_id"])
-    if data.get("draft_id"):
-        query = query.filter_by(draft_id=data["draft_id"])
-    # If user_id is tracked in AutosaveVersion, filter by user_id (not present in current model)
-    # Get latest autosave
-    latest = query.order_by(AutosaveVersion.saved_at.desc()).first()
-    now = datetime.utcnow()
-
-    def seconds_since(ts):
-        if not ts:
-            return None
-        return (now - ts).total_seconds()
-
-    if (
-        latest
-        and latest.content == data["content"]
-        and seconds_since(latest.saved_at) is not None
-        and seconds_since(latest.saved_at) < 30
-    ):
+    if not _owns_target(data.get("scene_id"), data.get("draft_id")):
+        return jsonify({"error": "Scene or draft not found"}), 404
+    buffer = current_app.extensions.get("autosave_buffer")
+    if buffer is not None:
+        # Reason: Coalesce into the write buffer instead of writing per request
+        if not buffer.submit(
+            data["content"],
+            scene_id=data.get("scene_id"),
+            draft_id=data.get("draft_id"),
+        ):
+            return jsonify({"error": "Autosave buffer is full, retry later"}), 503
+        return (
+            jsonify(
+                {
+                    "scene_id": data.get("scene_id"),
+                    "draft_id": data.get("draft_id"),
+                    "content": data["content"],
+                    "queued": True,
+                }
+            ),
+            202,
+        )
+    scene_id, draft_id = data.get("scene_id"), data.get("draft_id")
+    content_hash = AutosaveService.content_hash(data["content"])
+    # Reason: Indexed lookup of the latest version; compares hashes, not text
+    latest = AutosaveService.latest(scene_id, draft_id)
+    if AutosaveService.is_duplicate(latest, content_hash):
         # Reason: Duplicate snapshot within 30 seconds, skip saving
-        return jsonify(autosave_schema.dump(latest)), 200
-    autosave = AutosaveVersion(
-        scene_id=data.get("scene_id"),
-        draft_id=data.get("draft_id"),
-        content=data["content"],
+        return jsonify(_dump(latest, data["content"])), 200
+    # Reason: Store a delta against the latest version instead of a full copy
+    autosave = AutosaveService.save_snapshot(
+        data["content"],
+        scene_id=scene_id,
+        draft_id=draft_id,
+        previous=latest,
+        dedupe=True,
+    )
+    if autosave is None:
+        # Reason: A concurrent request stored the same snapshot first
+        latest = AutosaveService.latest(scene_id, draft_id)
+        return jsonify(_dump(latest, data["content"])), 200
+    return jsonify(_dump(autosave, data["content"])), 201
+
+
+@bp.route("/batch", methods=["POST"])
+@jwt_required
+def autosave_batch():
+    """
+    Store several autosave snapshots in one request.
+    Body: {"frames": [{"scene_id" or "draft_id", "content"}, ...]}, oldest first.
+    Returns one acknowledgement per frame, in order.
+    """
+    frames = (request.get_json(silent=True) or {}).get("frames")
+    if not isinstance(frames, list) or not frames:
+        return jsonify({"error": "frames must be a non-empty list"}), 400
+    max_frames = current_app.config.get("AUTOSAVE_BATCH_MAX_FRAMES", 100)
+    if len(frames) > max_frames:
+        return jsonify({"error": f"At most {max_frames} frames per batch"}), 400
+    # Reason: Authenticate, validate and authorize once for the whole batch
+    errors = autosave_schema.validate(frames, many=True)
+    if errors:
+        return jsonify(errors), 400
+    targets = [(frame.get("scene_id"), frame.get("draft_id")) for frame in frames]
+    if not all(scene_id or draft_id for scene_id, draft_id in targets):
+        return jsonify({"error": "scene_id or draft_id required"}), 400
+    if not (
+        owns_all("scene", [s for s, _ in targets if s], request.user_id)
+        and owns_all("draft", [d for _, d in targets if d], request.user_id)
+    ):
+        return jsonify({"error": "Scene or draft not found"}), 404
+    buffer = current_app.extensions.get("autosave_buffer")
+    if buffer is not None:
+        acks = [
+            (
+                {"status": "queued"}
+                if buffer.submit(frame["content"], scene_id=s, draft_id=d)
+                else {"status": "busy", "error": "Autosave buffer is full"}
+            )
+            for frame, (s, d) in zip(frames, targets)
+        ]
+        return jsonify({"frames": acks}), 202
+    # Reason: One window query finds every target's latest version
+    latest = AutosaveService.latest_for_targets(targets)
+    contents = {}
+    acks = []
+    for frame, target in zip(frames, targets):
+        previous, content = latest.get(target), frame["content"]
+        if AutosaveService.is_duplicate(
+            previous, AutosaveService.content_hash(content)
+        ):
+            acks.append(_ack("duplicate", previous))
+            continue
+        # Reason: Later frames of a target delta against the text already in hand
+        version = AutosaveService.save_snapshot(
+            content,
+            scene_id=target[0],
+            draft_id=target[1],
+            previous=previous,
+            previous_content=contents.get(target),
+            dedupe=True,
+        )
+        if version is None:
+            # Reason: A concurrent request stored the same snapshot first
+            version = AutosaveService.latest(*target)
+            acks.append(_ack("duplicate", version))
+        else:
+            acks.append(_ack("created", version))
+        latest[target], contents[target] = version, content
+    return jsonify({"frames": acks}), 200
+
+
+@bp.route("/", methods=["GET"])
+@jwt_required
+def list_autosaves():
+    """
+    List the versions of one scene or draft, newest first.
+    Query params: scene_id or draft_id, limit, fields (content is only
+    rebuilt when listed in fields or when fields is omitted)
+    """
+    scene_id, draft_id = request.args.get("scene_id"), request.args.get("draft_id")
+    if not scene_id and not draft_id:
+        return jsonify({"error": "scene_id or draft_id required"}), 400
+    try:
+        encoder = AUTOSAVE_ENCODER.select(request.args.get("fields"))
+        limit = parse_limit(request.args.get("limit"))
+    except (FieldsError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+    if not _owns_target(scene_id, draft_id):
+        return jsonify({"error": "Scene or draft not found"}), 404
+    versions = (
+        AutosaveService.target_query(scene_id, draft_id)
+        # Reason: Stored text is rebuilt below, never read from the rows
+        .options(defer(AutosaveVersion.content), defer(AutosaveVersion.delta))
+        .order_by(AutosaveVersion.saved_at.desc(), AutosaveVersion.chain_index.desc())
+        .limit(limit)
+        .all()
     )
-    db.session.add(autosave)
-    db.session.commit()
-    return jsonify(autosave_schema.dump(autosave)), 201
+    if "content" in encoder.fields:
+        contents = AutosaveService.get_contents(versions)
+        for version in versions:
+            # Reason: Populate as if loaded, so the session never sees a change
+            set_committed_value(version, "content", contents[version.id])
+    return encoder.response_many(versions)
+
+
+@bp.route("/buffer", methods=["GET"])
+@jwt_required
+def get_autosave_buffer_stats():
+    """Get write-buffer counters (coalesced, flushed, dropped, pending)."""
+    buffer = current_app.extensions.get("autosave_buffer")
+    if buffer is None:
+        return jsonify({"enabled": False}), 200
+    return jsonify({"enabled": True, **buffer.stats()}), 200
+
+
+@bp.route("/<version_id>", methods=["GET"])
+@jwt_required
+def get_autosave(version_id):
+    """Get one autosave version with its full content rebuilt."""
+    version = db.session.get(AutosaveVersion, version_id)
+    if not version or not _owns_target(version.scene_id, version.draft_id):
+        return jsonify({"error": "Autosave version not found"}), 404
+    return jsonify(_dump(version, AutosaveService.get_content(version))), 200
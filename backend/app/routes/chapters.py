@@ -5,7 +5,12 @@ Chapter routes for GET/POST/PUT /chapters endpoints.
 from flask import Blueprint, request, jsonify
 from backend.models.chapter import Chapter
 from backend.app import db
+from backend.app.utils.etag import collection_state, compute_etag, conditional_response
 from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owns
+from backend.app.utils.rank import encode_position
+from backend.app.utils.reorder import reorder_response
+from backend.app.utils.serializer import CHAPTER_ENCODER, FieldsError
 import uuid
 
 bp = Blueprint("chapters", __name__, url_prefix="/chapters")
@@ -17,30 +22,35 @@ def get_chapters():
     """
     GET /chapters/
     List all chapters for a given project (user must own project).
-    Query param: project_id
+    Query params: project_id, fields (comma-separated, e.g. id,title,rank)
     """
-    user_id = request.user_id  # Reason: Used in future logic, ignore unused warning
     project_id = request.args.get("project_id")
     if not project_id:
         return jsonify({"error": "project_id required"}), 400
-    chapters = db.session.query(Chapter).filter_by(project_id=project_id).all()
-    return (
-        jsonify(
-            [
-                {
-                    "id": str(c.id),
-                    "project_id": str(c.project_id),
-                    "title": c.title,
-                    "order": c.order,
-                    "created_at": c.created_at.isoformat(),
-                    "updated_at": c.updated_at.isoformat() if c.updated_at else None,
-                }
-                for c in chapters
-            ]
-        ),
-        200,
+    if not owns("project", project_id, request.user_id):
+        return jsonify({"error": "Project not found"}), 404
+    try:
+        encoder = CHAPTER_ENCODER.select(request.args.get("fields"))
+    except FieldsError as e:
+        return jsonify({"error": str(e)}), 400
+    etag = compute_etag(
+        "chapters",
+        project_id,
+        encoder.fields,
+        *collection_state(Chapter, Chapter.project_id == project_id),
     )
 
+    def build():
+        chapters = (
+            db.session.query(Chapter)
+            .filter_by(project_id=project_id)
+            .order_by(Chapter.rank, Chapter.created_at, Chapter.id)
+            .all()
+        )
+        return encoder.response_many(chapters)
+
+    return conditional_response(etag, build)
+
 
 @bp.route("/", methods=["POST"])
 @jwt_required
@@ -56,6 +66,8 @@ def create_chapter():
     errors = schema.validate(data)
     if errors:
         return jsonify({"error": "Validation error", "details": errors}), 400
+    if not owns("project", data["project_id"], request.user_id):
+        return jsonify({"error": "Project not found"}), 404
     chapter = Chapter(
         id=str(uuid.uuid4()),
         project_id=data["project_id"],
@@ -64,21 +76,7 @@ def create_chapter():
     )
     db.session.add(chapter)
     db.session.commit()
-    return (
-        jsonify(
-            {
-                "id": str(chapter.id),
-                "project_id": str(chapter.project_id),
-                "title": chapter.title,
-                "order": chapter.order,
-                "created_at": chapter.created_at.isoformat(),
-                "updated_at": (
-                    chapter.updated_at.isoformat() if chapter.updated_at else None
-                ),
-            }
-        ),
-        201,
-    )
+    return CHAPTER_ENCODER.response(chapter, 201)
 
 
 @bp.route("/<chapter_id>", methods=["PUT"])
@@ -95,26 +93,36 @@ def update_chapter(chapter_id):
     errors = schema.validate(data)
     if errors:
         return jsonify({"error": "Validation error", "details": errors}), 400
+    if not owns("chapter", chapter_id, request.user_id):
+        return jsonify({"error": "Chapter not found"}), 404
     chapter = db.session.query(Chapter).filter_by(id=chapter_id).first()
     if not chapter:
         return jsonify({"error": "Chapter not found"}), 404
     if "title" in data:
         chapter.title = data["title"]
     if "order" in data:
+        # Reason: Legacy integer positions map onto the rank ordering
         chapter.order = data["order"]
+        chapter.rank = encode_position(data["order"])
     db.session.commit()
-    return (
-        jsonify(
-            {
-                "id": str(chapter.id),
-                "project_id": str(chapter.project_id),
-                "title": chapter.title,
-                "order": chapter.order,
-                "created_at": chapter.created_at.isoformat(),
-                "updated_at": (
-                    chapter.updated_at.isoformat() if chapter.updated_at else None
-                ),
-            }
-        ),
-        200,
+    return CHAPTER_ENCODER.response(chapter)
+
+
+@bp.route("/reorder", methods=["POST"])
+@jwt_required
+def reorder_chapters():
+    """
+    POST /chapters/reorder
+    Apply a batch of chapter moves in one statement and one transaction.
+
+    Request JSON:
+        {"moves": [{"id": "<uuid>", "after": "<uuid>"}, {"id": "<uuid>", "before": null}]}
+    Response:
+        200: {"items": [{"id", "project_id", "rank"}, ...]}
+        400: {"error": "Validation error"} or {"error": "<invalid move>"}
+    """
+    from backend.app.schemas.reorder_schema import ChapterReorderSchema
+
+    return reorder_response(
+        Chapter, ChapterReorderSchema(), request.get_json(), request.user_id
     )
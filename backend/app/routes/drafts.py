@@ -6,31 +6,45 @@ from flask import Blueprint, request, jsonify
 from backend.models.draft import Draft
 from backend.app import db
 from backend.app.schemas.draft_schema import DraftSchema
-from flask_jwt_extended import jwt_required
+from backend.app.utils.pagination import paginated_response
+from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owned_by, owns
+from backend.app.utils.serializer import DRAFT_ENCODER
 
 bp = Blueprint("drafts", __name__, url_prefix="/drafts")
 
 draft_schema = DraftSchema()
-drafts_schema = DraftSchema(many=True)
 
 
 @bp.route("/", methods=["GET"])
-@jwt_required()
+@jwt_required
 def get_drafts():
-    """Get all drafts."""
-    drafts = Draft.query.all()
-    return jsonify(drafts_schema.dump(drafts)), 200
+    """
+    Get the user's drafts ordered by creation, one keyset page at a time.
+    Query params: scene_id, limit, cursor, stream
+    """
+    query = Draft.query
+    scene_id = request.args.get("scene_id")
+    if scene_id:
+        if not owns("scene", scene_id, request.user_id):
+            return jsonify({"error": "Scene not found"}), 404
+        query = query.filter_by(scene_id=scene_id)
+    else:
+        query = query.filter(owned_by("draft", request.user_id))
+    return paginated_response(query, Draft, DRAFT_ENCODER, request.args)
 
 
 @bp.route("/", methods=["POST"])
-@jwt_required()
+@jwt_required
 def create_draft():
     """Create a new draft."""
     data = request.get_json()
     errors = draft_schema.validate(data)
     if errors:
         return jsonify(errors), 400
+    if not owns("scene", data["scene_id"], request.user_id):
+        return jsonify({"error": "Scene not found"}), 404
     draft = Draft(scene_id=data["scene_id"], content=data.get("content", ""))
     db.session.add(draft)
     db.session.commit()
-    return jsonify(draft_schema.dump(draft)), 201
+    return DRAFT_ENCODER.response(draft, 201)
@@ -0,0 +1,25 @@
+"""
+Operational routes for GET /health/pool
+"""
+
+from flask import Blueprint, current_app, jsonify
+from backend.app import db
+from backend.app.utils.jwt_required import jwt_required
+
+bp = Blueprint("health", __name__, url_prefix="/health")
+
+
+@bp.route("/pool", methods=["GET"])
+@jwt_required
+def pool_stats():
+    """Connection-pool occupancy and checkout wait times for this worker."""
+    stats = current_app.extensions["db_pool"]
+    return (
+        jsonify(
+            {
+                "profile": current_app.config.get("DB_POOL_PROFILE", "default"),
+                **stats.snapshot(db.engine.pool),
+            }
+        ),
+        200,
+    )
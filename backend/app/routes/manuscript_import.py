@@ -0,0 +1,64 @@
+"""
+Import route for POST /import/
+"""
+
+import io
+
+from flask import Blueprint, current_app, request, jsonify
+from backend.app import db
+from backend.app.services.import_service import (
+    ImportService,
+    ManuscriptImportError,
+)
+from backend.app.utils.jwt_required import jwt_required
+from backend.models.chapter import Chapter
+
+bp = Blueprint("import", __name__, url_prefix="/import")
+
+
+@bp.route("/", methods=["POST"])
+@jwt_required
+def import_manuscript():
+    """
+    POST /import/?format=markdown|fountain|text&title=...&project_id=...
+    Import a whole manuscript sent as the raw request body.
+
+    The body is read as a line stream and written with batched multi-row
+    inserts in one transaction; nothing is stored if the import fails.
+    Response:
+        201: {"project_id", "format", "chapters", "scenes", "words",
+              "insert_statements", "rebalancing"}
+        400: {"error": "<invalid format or empty manuscript>"}
+        404: {"error": "Project not found"}
+        413: {"error": "Manuscript too large"}
+    """
+    max_bytes = current_app.config.get("IMPORT_MAX_BYTES")
+    if max_bytes and (request.content_length or 0) > max_bytes:
+        return jsonify({"error": "Manuscript too large"}), 413
+    try:
+        fmt = ImportService.detect_format(
+            request.args.get("format"), request.content_type
+        )
+        lines = io.TextIOWrapper(request.stream, encoding="utf-8", errors="replace")
+        result = ImportService.import_manuscript(
+            lines,
+            fmt,
+            user_id=request.user_id,
+            title=request.args.get("title"),
+            project_id=request.args.get("project_id"),
+            batch_size=current_app.config.get("IMPORT_BATCH_SIZE", 500),
+            rebalance_length=current_app.config.get("RANK_REBALANCE_LENGTH", 32),
+        )
+    except ManuscriptImportError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    except LookupError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 404
+    db.session.commit()
+    rebalancer = current_app.extensions.get("rank_rebalancer")
+    if rebalancer is not None:
+        # Reason: Long appended ranks are renumbered off the request path
+        for project_id in result["rebalancing"]:
+            rebalancer.schedule(Chapter, project_id)
+    return jsonify(result), 201
@@ -0,0 +1,21 @@
+"""
+Prometheus scrape endpoint: GET /metrics
+"""
+
+from flask import Blueprint, Response, current_app, jsonify
+from backend.app import db
+from backend.app.utils.request_metrics import pool_metrics
+
+bp = Blueprint("metrics", __name__)
+
+
+@bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Request, SQL and pool metrics of this worker in Prometheus text format."""
+    registry = current_app.extensions.get("request_metrics")
+    if registry is None:
+        return jsonify({"error": "Metrics are disabled"}), 404
+    extra = pool_metrics(current_app.extensions["db_pool"], db.engine.pool)
+    return Response(
+        registry.render(extra), mimetype="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -5,7 +5,9 @@ Project routes for GET/POST/PUT /projects endpoints.
 from flask import Blueprint, request, jsonify
 from backend.models.project import Project
 from backend.app import db
+from backend.app.utils.etag import collection_state, compute_etag, conditional_response
 from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.serializer import PROJECT_ENCODER, FieldsError
 from backend.app.services.auth_service import (
     AuthService,
 )  # Reason: Used for future permission checks
@@ -20,25 +22,27 @@ def get_projects():
     """
     GET /projects/
     List all projects for the authenticated user.
+    Query param: fields (comma-separated, e.g. id,title)
     """
     user_id = request.user_id
-    projects = db.session.query(Project).filter_by(user_id=user_id).all()
-    return (
-        jsonify(
-            [
-                {
-                    "id": str(p.id),
-                    "title": p.title,
-                    "description": p.description,
-                    "created_at": p.created_at.isoformat(),
-                    "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-                }
-                for p in projects
-            ]
-        ),
-        200,
+    try:
+        encoder = PROJECT_ENCODER.select(request.args.get("fields"))
+    except FieldsError as e:
+        return jsonify({"error": str(e)}), 400
+    # Reason: Revalidate with one aggregate query; rows load only on a miss
+    etag = compute_etag(
+        "projects",
+        user_id,
+        encoder.fields,
+        *collection_state(Project, Project.user_id == user_id),
     )
 
+    def build():
+        projects = db.session.query(Project).filter_by(user_id=user_id).all()
+        return encoder.response_many(projects)
+
+    return conditional_response(etag, build)
+
 
 @bp.route("/", methods=["POST"])
 @jwt_required
@@ -63,20 +67,7 @@ def create_project():
     )
     db.session.add(project)
     db.session.commit()
-    return (
-        jsonify(
-            {
-                "id": str(project.id),
-                "title": project.title,
-                "description": project.description,
-                "created_at": project.created_at.isoformat(),
-                "updated_at": (
-                    project.updated_at.isoformat() if project.updated_at else None
-                ),
-            }
-        ),
-        201,
-    )
+    return PROJECT_ENCODER.response(project, 201)
 
 
 @bp.route("/<project_id>", methods=["PUT"])
@@ -104,17 +95,4 @@ def update_project(project_id):
     if "description" in data:
         project.description = data["description"]
     db.session.commit()
-    return (
-        jsonify(
-            {
-                "id": str(project.id),
-                "title": project.title,
-                "description": project.description,
-                "created_at": project.created_at.isoformat(),
-                "updated_at": (
-                    project.updated_at.isoformat() if project.updated_at else None
-                ),
-            }
-        ),
-        200,
-    )
+    return PROJECT_ENCODER.response(project)
@@ -5,8 +5,16 @@ Routes for GET/POST/PUT /scenes endpoints.
 from flask import Blueprint, request, jsonify
 from backend.models.scene import Scene
 from backend.app import db
-from backend.app.schemas.scene_schema import SceneSchema
+from backend.app.schemas.scene_schema import SceneSchema, ScenePatchSchema
+from backend.app.services.scene_service import SceneService, StaleVersionError
+from backend.app.services.stats_service import StatsService
+from backend.app.utils import text_delta
+from backend.app.utils.etag import collection_state, compute_etag, conditional_response
 from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owns
+from backend.app.utils.rank import encode_position
+from backend.app.utils.reorder import reorder_response
+from backend.app.utils.serializer import SCENE_ENCODER, FieldsError
 import uuid
 
 scenes_bp = Blueprint("scenes", __name__, url_prefix="/scenes")
@@ -20,13 +28,31 @@ def get_scenes():
     chapter_id = request.args.get("chapter_id")
     if not chapter_id:
         return jsonify({"error": "chapter_id required"}), 400
-    scenes = (
-        db.session.query(Scene)
-        .filter_by(chapter_id=chapter_id)
-        .order_by(Scene.order)
-        .all()
+    if not owns("chapter", chapter_id, request.user_id):
+        return jsonify({"error": "Chapter not found"}), 404
+    try:
+        encoder = SCENE_ENCODER.select(request.args.get("fields"))
+    except FieldsError as e:
+        return jsonify({"error": str(e)}), 400
+    etag = compute_etag(
+        "scenes",
+        chapter_id,
+        encoder.fields,
+        *collection_state(Scene, Scene.chapter_id == chapter_id),
     )
-    return jsonify(scene_schema.dump(scenes, many=True)), 200
+
+    def build():
+        # Reason: Scene.content stays unloaded unless ?fields= asks for it
+        scenes = (
+            db.session.query(Scene)
+            .options(*encoder.load_options(Scene))
+            .filter_by(chapter_id=chapter_id)
+            .order_by(Scene.rank, Scene.created_at, Scene.id)
+            .all()
+        )
+        return encoder.response_many(scenes)
+
+    return conditional_response(etag, build)
 
 
 @scenes_bp.route("/", methods=["POST"])
@@ -36,21 +62,25 @@ def create_scene():
     errors = scene_schema.validate(data)
     if errors:
         return jsonify(errors), 400
+    if not owns("chapter", data["chapter_id"], request.user_id):
+        return jsonify({"error": "Chapter not found"}), 404
     scene = Scene(
         id=str(uuid.uuid4()),
         chapter_id=data["chapter_id"],
         title=data["title"],
-        content=data.get("content"),
         order=data["order"],
     )
+    StatsService.set_content(scene, data.get("content"))
     db.session.add(scene)
     db.session.commit()
-    return jsonify(scene_schema.dump(scene)), 201
+    return SCENE_ENCODER.response(scene, 201)
 
 
 @scenes_bp.route("/<scene_id>", methods=["PUT"])
 @jwt_required
 def update_scene(scene_id):
+    if not owns("scene", scene_id, request.user_id):
+        return jsonify({"error": "Scene not found"}), 404
     scene = db.session.query(Scene).filter_by(id=scene_id).first()
     if not scene:
         return jsonify({"error": "Scene not found"}), 404
@@ -60,9 +90,57 @@ def update_scene(scene_id):
         return jsonify(errors), 400
     if "title" in data:
         scene.title = data["title"]
-    if "content" in data:
-        scene.content = data["content"]
+    if "content" in data and data["content"] != scene.content:
+        StatsService.set_content(scene, data["content"])
+        scene.version += 1
     if "order" in data:
+        # Reason: Legacy integer positions map onto the rank ordering
         scene.order = data["order"]
+        scene.rank = encode_position(data["order"])
     db.session.commit()
-    return jsonify(scene_schema.dump(scene)), 200
+    return SCENE_ENCODER.response(scene)
+
+
+@scenes_bp.route("/<scene_id>", methods=["PATCH"])
+@jwt_required
+def patch_scene(scene_id):
+    """
+    Apply text operations to a scene's content.
+    JSON body: {"base_version": n, "ops": [{"retain": n}, {"delete": n},
+    {"insert": "text"}, ...]}. 409 with the current version if the base is stale.
+    """
+    if not owns("scene", scene_id, request.user_id):
+        return jsonify({"error": "Scene not found"}), 404
+    data = request.get_json()
+    errors = ScenePatchSchema().validate(data or {})
+    if errors:
+        return jsonify({"error": "Validation error", "details": errors}), 400
+    try:
+        result = SceneService.apply_patch(
+            scene_id,
+            data["base_version"],
+            text_delta.from_operations(data["ops"]),
+        )
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    except StaleVersionError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e), "version": e.current_version}), 409
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    db.session.commit()
+    return jsonify(result), 200
+
+
+@scenes_bp.route("/reorder", methods=["POST"])
+@jwt_required
+def reorder_scenes():
+    """
+    Apply a batch of scene moves (optionally across chapters) in one
+    statement and one transaction.
+    """
+    from backend.app.schemas.reorder_schema import SceneReorderSchema
+
+    return reorder_response(
+        Scene, SceneReorderSchema(), request.get_json(), request.user_id
+    )
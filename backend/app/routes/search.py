@@ -0,0 +1,34 @@
+"""
+Search route for GET /search
+"""
+
+from flask import Blueprint, jsonify, request
+from backend.app.services.search_service import SearchError, SearchService
+from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owns
+
+bp = Blueprint("search", __name__, url_prefix="/search")
+
+
+@bp.route("/", methods=["GET"], strict_slashes=False)
+@jwt_required
+def search():
+    """
+    Ranked full-text search across a project's scenes, drafts and annotations.
+    Query params: q, project_id, limit (default 20, max 100), types
+    """
+    project_id = request.args.get("project_id")
+    if not project_id:
+        return jsonify({"error": "project_id required"}), 400
+    if not owns("project", project_id, request.user_id):
+        return jsonify({"error": "Project not found"}), 404
+    try:
+        results = SearchService.search(
+            project_id,
+            request.args.get("q"),
+            limit=SearchService.parse_limit(request.args.get("limit")),
+            types=SearchService.parse_types(request.args.get("types")),
+        )
+    except SearchError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"query": request.args.get("q"), "results": results}), 200
@@ -0,0 +1,47 @@
+"""
+Statistics routes for GET /stats/projects|chapters|scenes/<id>
+"""
+
+from flask import Blueprint, jsonify, request
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+from backend.app import db
+from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owns
+from backend.app.utils import text_stats
+from backend.app.utils.text_stats import STAT_FIELDS
+
+bp = Blueprint("stats", __name__, url_prefix="/stats")
+
+
+def _stats_response(kind, model, row_id):
+    """One primary-key lookup of stored figures; 404 if not the user's."""
+    if not owns(kind, row_id, request.user_id):
+        return jsonify({"error": "Not found"}), 404
+    columns = [getattr(model, field) for field in STAT_FIELDS]
+    row = db.session.query(*columns).filter(model.id == row_id).first()
+    if row is None:
+        return jsonify({"error": "Not found"}), 404
+    return jsonify({f"{kind}_id": row_id, **text_stats.of(row)}), 200
+
+
+@bp.route("/projects/<project_id>", methods=["GET"])
+@jwt_required
+def project_stats(project_id):
+    """Word count and writing statistics for a whole project."""
+    return _stats_response("project", Project, project_id)
+
+
+@bp.route("/chapters/<chapter_id>", methods=["GET"])
+@jwt_required
+def chapter_stats(chapter_id):
+    """Word count and writing statistics for one chapter."""
+    return _stats_response("chapter", Chapter, chapter_id)
+
+
+@bp.route("/scenes/<scene_id>", methods=["GET"])
+@jwt_required
+def scene_stats(scene_id):
+    """Word count and writing statistics for one scene."""
+    return _stats_response("scene", Scene, scene_id)
@@ -2,55 +2,44 @@
 Timeline route for GET /timeline/<project_id>
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from backend.models.project import Project
-from backend.models.chapter import Chapter
-from backend.models.scene import Scene
-from flask_jwt_extended import jwt_required
+from backend.app.services.timeline_service import TimelineService
+from backend.app.utils.etag import compute_etag, conditional_response
+from backend.app.utils.jwt_required import jwt_required
+from backend.app.utils.ownership import owns
 
 bp = Blueprint("timeline", __name__, url_prefix="/timeline")
 
 
 @bp.route("/<project_id>", methods=["GET"])
-@jwt_required()
+@jwt_required
 def get_timeline(project_id):
     """Get timeline for a project: chapters and scenes ordered."""
+    if not owns("project", project_id, request.user_id):
+        return jsonify({"error": "Project not found"}), 404
     project = Project.query.filter_by(id=project_id).first()
     if not project:
         return jsonify({"error": "Project not found"}), 404
-    chapters = (
-        Chapter.query.filter_by(project_id=project_id)
-        .order_by(Chapter.created_at)
-        .all()
+    etag = compute_etag(
+        "timeline",
+        project.id,
+        project.title,
+        *TimelineService.tree_state(project_id),
     )
-    timeline = []
-    for chapter in chapters:
-        scenes = (
-            Scene.query.filter_by(chapter_id=chapter.id)
-            .order_by(Scene.created_at)
-            .all()
-        )
-        timeline.append(
-            {
-                "chapter_id": chapter.id,
-                "chapter_title": getattr(chapter, "title", ""),
-                "scenes": [
-                    {
-                        "scene_id": scene.id,
-                        "scene_title": getattr(scene, "title", ""),
-                        "created_at": scene.created_at.isoformat(),
-                    }
-                    for scene in scenes
-                ],
-            }
+
+    def build():
+        # Reason: One joined query for the whole tree instead of one per chapter
+        timeline = TimelineService.build_timeline(project_id)
+        return (
+            jsonify(
+                {
+                    "project_id": project.id,
+                    "project_title": getattr(project, "title", ""),
+                    "timeline": timeline,
+                }
+            ),
+            200,
         )
-    return (
-        jsonify(
-            {
-                "project_id": project.id,
-                "project_title": getattr(project, "title", ""),
-                "timeline": timeline,
-            }
-        ),
-        200,
-    )
+
+    return conditional_response(etag, build)
@@ -11,4 +11,5 @@ class ExportSchema(Schema):
     project_id = fields.Str(required=True)
     export_type = fields.Str(required=True)
     file_path = fields.Str(dump_only=True)
+    cache_hit = fields.Bool(dump_only=True)
     created_at = fields.DateTime(dump_only=True)
@@ -0,0 +1,37 @@
+from marshmallow import Schema, fields, validate
+
+MAX_MOVES = 1000
+
+
+class MoveSchema(Schema):
+    """One move: place `id` after or before a sibling (or at the end)."""
+
+    id = fields.String(required=True)
+    after = fields.String(allow_none=True)
+    before = fields.String(allow_none=True)
+
+
+class SceneMoveSchema(MoveSchema):
+    """Scene move; `chapter_id` moves the scene into another chapter."""
+
+    chapter_id = fields.String(allow_none=True)
+
+
+class ChapterReorderSchema(Schema):
+    """Schema for POST /chapters/reorder."""
+
+    moves = fields.List(
+        fields.Nested(MoveSchema),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_MOVES),
+    )
+
+
+class SceneReorderSchema(Schema):
+    """Schema for POST /scenes/reorder."""
+
+    moves = fields.List(
+        fields.Nested(SceneMoveSchema),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_MOVES),
+    )
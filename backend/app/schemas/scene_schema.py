@@ -2,7 +2,11 @@
 Marshmallow schema for Scene endpoints.
 """
 
-from marshmallow import Schema, fields
+from marshmallow import Schema, ValidationError, fields, validate, validates
+
+from backend.app.utils import text_delta
+
+MAX_PATCH_OPS = 1000
 
 
 class SceneSchema(Schema):
@@ -10,6 +14,27 @@ class SceneSchema(Schema):
     chapter_id = fields.String(required=True)
     title = fields.String(required=True)
     content = fields.String(allow_none=True)
-    order = fields.Integer(required=True)
+    # Reason: Input only; `rank` is the ordering the API returns
+    order = fields.Integer(required=True, load_only=True)
+    rank = fields.String(dump_only=True)
+    version = fields.Integer(dump_only=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
+
+
+class ScenePatchSchema(Schema):
+    """Schema for PATCH /scenes/<id>: text operations against a base version."""
+
+    base_version = fields.Integer(required=True, validate=validate.Range(min=1))
+    ops = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_PATCH_OPS),
+    )
+
+    @validates("ops")
+    def validate_ops(self, value, **kwargs):
+        try:
+            text_delta.from_operations(value)
+        except ValueError as e:
+            raise ValidationError(str(e))
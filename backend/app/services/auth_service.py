@@ -5,7 +5,8 @@ Authentication service for JWT-based user authentication.
 from datetime import datetime, timedelta
 from werkzeug.security import generate_password_hash, check_password_hash
 import jwt
-from flask import current_app
+from flask import current_app, has_app_context
+from backend.app.services.password_hasher import hash_method
 
 
 class AuthService:
@@ -13,15 +14,43 @@ class AuthService:
     Service for handling password hashing and JWT token generation/validation.
     """
 
+    @staticmethod
+    def password_hash_method() -> str:
+        """Werkzeug method string for the configured algorithm and cost."""
+        if not has_app_context():
+            return hash_method()
+        return hash_method(
+            current_app.config.get("PASSWORD_HASH_ALGORITHM", "scrypt"),
+            current_app.config.get("PASSWORD_HASH_COST"),
+        )
+
+    @staticmethod
+    def _run_hashing(fn, *args):
+        """Run a hashing call on the app's bounded pool (inline if none)."""
+        hasher = (
+            current_app.extensions.get("password_hasher") if has_app_context() else None
+        )
+        if hasher is None:
+            return fn(*args)
+        return hasher.run(fn, *args)
+
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password for storing."""
-        return generate_password_hash(password)
+        """Hash a password for storing. Raises HasherBusy when saturated."""
+        return AuthService._run_hashing(
+            generate_password_hash, password, AuthService.password_hash_method()
+        )
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
         """Verify a stored password against one provided by user."""
-        return check_password_hash(password_hash, password)
+        return AuthService._run_hashing(check_password_hash, password_hash, password)
+
+    @staticmethod
+    def needs_rehash(password_hash: str) -> bool:
+        """True if the hash was made with a different algorithm or cost."""
+        method = password_hash.split("$", 1)[0]
+        return method != AuthService.password_hash_method()
 
     @staticmethod
     def generate_token(user_id: str, expires_in: int = 3600) -> str:
@@ -30,17 +59,42 @@ class AuthService:
             "user_id": user_id,
             "exp": datetime.utcnow() + timedelta(seconds=expires_in),
         }
-        secret = current_app.config["SECRET_KEY"]
+        secret = AuthService._secret()
         return jwt.encode(payload, secret, algorithm="HS256")
 
+    @staticmethod
+    def _secret() -> str:
+        """Signing key shared with flask_jwt_extended (JWT_SECRET_KEY or SECRET_KEY)."""
+        return (
+            current_app.config.get("JWT_SECRET_KEY") or current_app.config["SECRET_KEY"]
+        )
+
     @staticmethod
     def decode_token(token: str):
         """Decode JWT token and return payload or None if invalid."""
-        secret = current_app.config["SECRET_KEY"]
+        secret = AuthService._secret()
         try:
             payload = jwt.decode(token, secret, algorithms=["HS256"])
-            return payload
         except jwt.ExpiredSignatureError:
             return None
         except jwt.InvalidTokenError:
             return None
+        # Reason: Accept flask_jwt_extended access tokens (identity in "sub")
+        if "user_id" not in payload:
+            if payload.get("type", "access") != "access" or "sub" not in payload:
+                return None
+            payload["user_id"] = payload["sub"]
+        return payload
+
+    @staticmethod
+    def verify_token(token: str):
+        """Decode a token through the app's verified-token cache when enabled."""
+        cache = current_app.extensions.get("token_cache")
+        if cache is None:
+            return AuthService.decode_token(token)
+        payload = cache.get(token)
+        if payload is None:
+            payload = AuthService.decode_token(token)
+            if payload:
+                cache.put(token, payload)
+        return payload
@@ -0,0 +1,227 @@
+"""
+Write-coalescing buffer for autosave snapshots.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from backend.app import db
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.autosave_version import AutosaveVersion
+
+logger = logging.getLogger(__name__)
+
+
+class PendingSnapshot:
+    """One buffered autosave waiting to be flushed."""
+
+    __slots__ = ("content", "saved_at")
+
+    def __init__(self, content, saved_at):
+        self.content = content
+        self.saved_at = saved_at
+
+
+class AutosaveBuffer:
+    """
+    In-memory autosave ingestion stage.
+
+    Holds the newest snapshot per (scene_id, draft_id) and flushes them to the
+    database in one multi-row INSERT, either every `flush_interval` seconds
+    from a background thread or as soon as `max_pending` targets are waiting.
+    Snapshots replaced before a flush are counted as coalesced; snapshots
+    refused because the buffer is at `capacity`, or discarded on a
+    non-durable shutdown, are counted as dropped.
+    """
+
+    def __init__(
+        self,
+        app,
+        flush_interval=2.0,
+        max_pending=500,
+        capacity=None,
+        flush_on_shutdown=True,
+    ):
+        self.app = app
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.capacity = capacity or max_pending * 4
+        self.flush_on_shutdown = flush_on_shutdown
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.counters = {
+            "submitted": 0,
+            "coalesced": 0,
+            "deduplicated": 0,
+            "flushed": 0,
+            "dropped": 0,
+            "flushes": 0,
+            "flush_errors": 0,
+        }
+        self.last_flush_ms = 0.0
+
+    @classmethod
+    def from_config(cls, app):
+        """Build a buffer from the AUTOSAVE_BUFFER_* config values."""
+        config = app.config
+        return cls(
+            app,
+            flush_interval=float(config.get("AUTOSAVE_BUFFER_FLUSH_INTERVAL", 2.0)),
+            max_pending=int(config.get("AUTOSAVE_BUFFER_MAX_PENDING", 500)),
+            capacity=int(config.get("AUTOSAVE_BUFFER_CAPACITY", 0)) or None,
+            flush_on_shutdown=bool(
+                config.get("AUTOSAVE_BUFFER_FLUSH_ON_SHUTDOWN", True)
+            ),
+        )
+
+    def submit(self, content, scene_id=None, draft_id=None) -> bool:
+        """
+        Buffer a snapshot, replacing any pending one for the same target.
+        Returns False if the snapshot was dropped because the buffer is full.
+        """
+        key = (scene_id, draft_id)
+        snapshot = PendingSnapshot(content, datetime.utcnow())
+        with self._lock:
+            self.counters["submitted"] += 1
+            if key in self._pending:
+                self.counters["coalesced"] += 1
+            elif len(self._pending) >= self.capacity:
+                self.counters["dropped"] += 1
+                self._wakeup.set()
+                return False
+            self._pending[key] = snapshot
+            size = len(self._pending)
+        self._ensure_thread()
+        if size >= self.max_pending:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """Write every pending snapshot now. Returns the number of rows inserted."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            started = time.perf_counter()
+            with self.app.app_context():
+                try:
+                    inserted, deduplicated = self._write(batch)
+                except Exception:
+                    # Reason: Any failure must keep the batch and the flusher alive
+                    db.session.rollback()
+                    logger.exception("Autosave buffer flush failed")
+                    self._requeue(batch)
+                    with self._lock:
+                        self.counters["flush_errors"] += 1
+                    return 0
+            with self._lock:
+                self.counters["flushes"] += 1
+                self.counters["flushed"] += inserted
+                self.counters["deduplicated"] += deduplicated
+                self.last_flush_ms = (time.perf_counter() - started) * 1000
+            return inserted
+
+    def _write(self, batch):
+        """Insert the batch and commit. Returns (inserted, deduplicated)."""
+        latest = AutosaveService.latest_for_targets(batch.keys())
+        rows, deduplicated = [], 0
+        for (scene_id, draft_id), snapshot in batch.items():
+            previous = latest.get((scene_id, draft_id))
+            content_hash = AutosaveService.content_hash(snapshot.content)
+            if AutosaveService.is_duplicate(previous, content_hash, snapshot.saved_at):
+                deduplicated += 1
+                continue
+            try:
+                columns = AutosaveService.encode(snapshot.content, previous)
+            except (LookupError, ValueError):
+                # Reason: A broken delta chain must not block the batch; restart it
+                logger.exception(
+                    "Autosave chain for %s is unreadable; storing a keyframe",
+                    scene_id or draft_id,
+                )
+                columns = AutosaveService.encode(snapshot.content)
+            rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "scene_id": scene_id,
+                    "draft_id": draft_id,
+                    "saved_at": snapshot.saved_at,
+                    **columns,
+                }
+            )
+        if rows:
+            # Reason: One multi-row INSERT and one COMMIT for the whole batch
+            db.session.execute(insert(AutosaveVersion), rows)
+        db.session.commit()
+        return len(rows), deduplicated
+
+    def _requeue(self, batch):
+        """Put back snapshots that were not superseded while flushing."""
+        with self._lock:
+            for key, snapshot in batch.items():
+                self._pending.setdefault(key, snapshot)
+
+    def _ensure_thread(self):
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="autosave-buffer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.flush()
+            except Exception:
+                # Reason: The flusher is the only writer; it must outlive errors
+                logger.exception("Autosave buffer flusher error")
+
+    def close(self):
+        """Stop the flusher thread, flushing synchronously if durable."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+        if self.flush_on_shutdown:
+            self.flush()
+        else:
+            with self._lock:
+                self.counters["dropped"] += len(self._pending)
+                self._pending = {}
+
+    def stats(self) -> dict:
+        """Return the buffer counters and current queue depth."""
+        with self._lock:
+            return {
+                **self.counters,
+                "pending": len(self._pending),
+                "last_flush_ms": round(self.last_flush_ms, 3),
+            }
+
+
+def init_autosave_buffer(app):
+    """Attach an AutosaveBuffer to app when AUTOSAVE_BUFFER_ENABLED is set."""
+    if not app.config.get("AUTOSAVE_BUFFER_ENABLED"):
+        return None
+    buffer = AutosaveBuffer.from_config(app)
+    app.extensions["autosave_buffer"] = buffer
+    atexit.register(buffer.close)
+    return buffer
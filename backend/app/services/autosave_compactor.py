@@ -0,0 +1,319 @@
+"""
+Autosave retention: thin old history into coarser tiers, chain by chain.
+"""
+
+import atexit
+import logging
+import re
+import threading
+from datetime import datetime
+
+from sqlalchemy import delete, or_, text
+
+from backend.app import db
+from backend.app.services.autosave_service import AutosaveService
+from backend.app.utils import text_delta
+from backend.models.autosave_version import AutosaveVersion
+
+logger = logging.getLogger(__name__)
+
+# Reason: Every version for an hour, one per 10 minutes for a day, then daily
+DEFAULT_RETENTION = "1h:0,1d:10m,*:1d"
+DEFAULT_BATCH_SIZE = 200
+DURATION = re.compile(r"^\s*(\d+)\s*([smhd]?)\s*$")
+UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value) -> int:
+    """Seconds in '90', '90s', '10m', '1h' or '7d'."""
+    match = DURATION.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return int(match.group(1)) * UNITS[match.group(2)]
+
+
+def parse_retention(value) -> list:
+    """
+    Parse retention tiers into [(max_age_seconds or None, keep_every_seconds)].
+
+    `value` is "max_age:keep_every,..." youngest tier first, e.g.
+    "1h:0,1d:10m,*:1d": versions younger than an hour are all kept (0),
+    younger than a day one per 10 minutes, older ones (*) one per day.
+    Without a final "*" tier, versions older than the last tier are dropped.
+    A list of (max_age, keep_every) pairs is accepted as is.
+    """
+    if isinstance(value, str):
+        pairs = []
+        for part in value.split(","):
+            if not part.strip():
+                continue
+            age, sep, every = part.partition(":")
+            if not sep:
+                raise ValueError(f"Retention tier needs 'age:interval': {part!r}")
+            pairs.append((age.strip(), every.strip()))
+    else:
+        pairs = list(value)
+    tiers = []
+    for age, every in pairs:
+        max_age = None if age in ("*", None) else parse_duration(age)
+        tiers.append((max_age, parse_duration(every)))
+    if not tiers:
+        raise ValueError("At least one retention tier is required")
+    ages = [max_age for max_age, _ in tiers]
+    bounded = ages[:-1] + ([ages[-1]] if ages[-1] is not None else [])
+    if None in bounded or bounded != sorted(set(bounded)):
+        raise ValueError("Retention tiers must be ordered by age; '*' goes last")
+    return tiers
+
+
+def retained_ids(versions, tiers, now) -> set:
+    """
+    Ids to keep among one target's versions (ordered oldest first).
+
+    Within a thinned tier the newest version of each time bucket survives,
+    so every kept version is the last state of its window. The newest
+    version overall is always kept.
+    """
+    keep, buckets = set(), {}
+    for version in versions:
+        if version.saved_at is None:
+            keep.add(version.id)
+            continue
+        age = (now - version.saved_at).total_seconds()
+        for index, (max_age, every) in enumerate(tiers):
+            if max_age is None or age < max_age:
+                break
+        else:
+            continue
+        if every <= 0:
+            keep.add(version.id)
+        else:
+            epoch = (version.saved_at - datetime(1970, 1, 1)).total_seconds()
+            buckets[(index, int(epoch // every))] = version.id
+    keep.update(buckets.values())
+    if versions:
+        keep.add(versions[-1].id)
+    return keep
+
+
+class AutosaveCompactor:
+    """
+    Deletes autosave versions that fall outside the retention tiers.
+
+    History is rewritten one keyframe chain (at most
+    AUTOSAVE_KEYFRAME_INTERVAL rows) at a time: the chain is rebuilt, its
+    dropped rows deleted and the survivors re-encoded, so every remaining
+    version still rebuilds. Each transaction touches one target and at most
+    `batch_size` deleted rows. A target's newest chain is never touched,
+    since writers extend it. Runs from `flask autosave compact` or, with
+    `interval` > 0, on a background thread.
+    """
+
+    def __init__(self, app, tiers=DEFAULT_RETENTION, batch_size=None, interval=0):
+        self.app = app
+        self.tiers = parse_retention(tiers)
+        self.batch_size = max(1, batch_size or DEFAULT_BATCH_SIZE)
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.counters = {
+            "runs": 0,
+            "targets": 0,
+            "chains_rewritten": 0,
+            "rows_deleted": 0,
+            "chars_reclaimed": 0,
+            "errors": 0,
+        }
+
+    @classmethod
+    def from_config(cls, app):
+        """Build a compactor from the AUTOSAVE_RETENTION* config values."""
+        config = app.config
+        return cls(
+            app,
+            tiers=config.get("AUTOSAVE_RETENTION", DEFAULT_RETENTION),
+            batch_size=int(
+                config.get("AUTOSAVE_COMPACTION_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+            ),
+            interval=float(config.get("AUTOSAVE_COMPACTION_INTERVAL", 0)),
+        )
+
+    def compact(self, now=None) -> dict:
+        """
+        Thin every scene's and draft's history once. Must run inside an app
+        context. Returns this run's counts (rows deleted, bytes reclaimed, ...).
+        """
+        now = now or datetime.utcnow()
+        result = dict.fromkeys(self.counters, 0)
+        result["runs"] = 1
+        targets = (
+            db.session.query(AutosaveVersion.scene_id, AutosaveVersion.draft_id)
+            .distinct()
+            .all()
+        )
+        db.session.commit()
+        for scene_id, draft_id in targets:
+            try:
+                self.compact_target(scene_id, draft_id, now, result)
+            except Exception:
+                # Reason: One unreadable chain must not stop the rest of the run
+                db.session.rollback()
+                result["errors"] += 1
+                logger.exception(
+                    "Autosave compaction failed for %s/%s", scene_id, draft_id
+                )
+            result["targets"] += 1
+        with self._lock:
+            for name, value in result.items():
+                self.counters[name] += value
+        return result
+
+    def compact_target(self, scene_id, draft_id, now, result) -> None:
+        """Thin one target's history, committing every `batch_size` deletes."""
+        if scene_id is None and draft_id is None:
+            return
+        versions = (
+            db.session.query(
+                AutosaveVersion.id,
+                AutosaveVersion.saved_at,
+                AutosaveVersion.keyframe_id,
+            )
+            .filter(*AutosaveService.target_filters(scene_id, draft_id))
+            .order_by(AutosaveVersion.saved_at, AutosaveVersion.chain_index)
+            .all()
+        )
+        keep = retained_ids(versions, self.tiers, now)
+        if len(keep) == len(versions):
+            return
+        chains = {}
+        for version in versions:
+            chains.setdefault(version.keyframe_id or version.id, []).append(version)
+        newest = versions[-1].keyframe_id or versions[-1].id
+        pending = 0
+        locked = False
+        for chain_id, rows in chains.items():
+            drops = {row.id for row in rows if row.id not in keep}
+            if chain_id == newest or not drops:
+                continue
+            if not locked:
+                if not self._lock_target(scene_id, draft_id):
+                    return
+                locked = True
+            deleted, reclaimed = self.rewrite_chain(chain_id, drops)
+            result["chains_rewritten"] += 1
+            result["rows_deleted"] += deleted
+            result["chars_reclaimed"] += reclaimed
+            pending += deleted
+            if pending >= self.batch_size:
+                # Reason: Short transactions; no lock is held across batches
+                db.session.commit()
+                pending, locked = 0, False
+        db.session.commit()
+
+    @staticmethod
+    def _lock_target(scene_id, draft_id) -> bool:
+        """On PostgreSQL, keep two compactors off the same target."""
+        if db.session.get_bind().dialect.name != "postgresql":
+            return True
+        return bool(
+            db.session.execute(
+                text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+                {"key": f"autosave-compact:{scene_id}:{draft_id}"},
+            ).scalar()
+        )
+
+    @staticmethod
+    def rewrite_chain(chain_id, drops) -> tuple:
+        """
+        Delete `drops` from one chain and re-encode the rest as a new chain.
+        Returns (rows deleted, stored characters reclaimed); the caller commits.
+        """
+        chain = (
+            AutosaveVersion.query.filter(
+                or_(
+                    AutosaveVersion.id == chain_id,
+                    AutosaveVersion.keyframe_id == chain_id,
+                )
+            )
+            .order_by(AutosaveVersion.chain_index)
+            .all()
+        )
+        contents, content = {}, ""
+        for version in chain:
+            if version.is_keyframe:
+                content = version.content or ""
+            else:
+                content = text_delta.apply(content, text_delta.loads(version.delta))
+            contents[version.id] = content
+        before = sum(len(v.content or v.delta or "") for v in chain)
+        survivors = [version for version in chain if version.id not in drops]
+        # Reason: Clear chain positions first so the unique constraint never trips
+        for version in survivors:
+            version.keyframe_id = None
+            version.chain_index = 0
+        for version in chain:
+            if version.id in drops:
+                db.session.expunge(version)
+        db.session.flush()
+        db.session.execute(
+            delete(AutosaveVersion).where(AutosaveVersion.id.in_(list(drops))),
+            execution_options={"synchronize_session": False},
+        )
+        previous = previous_content = None
+        for version in survivors:
+            columns = AutosaveService.encode(
+                contents[version.id], previous, previous_content
+            )
+            for name, value in columns.items():
+                setattr(version, name, value)
+            previous, previous_content = version, contents[version.id]
+        db.session.flush()
+        after = sum(len(v.content or v.delta or "") for v in survivors)
+        return len(chain) - len(survivors), before - after
+
+    def start(self):
+        """Run compact() every `interval` seconds on a daemon thread."""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="autosave-compactor", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            with self.app.app_context():
+                try:
+                    self.compact()
+                except Exception:
+                    # Reason: The scheduler must survive a failed run and try again
+                    db.session.rollback()
+                    logger.exception("Autosave compaction run failed")
+                    with self._lock:
+                        self.counters["errors"] += 1
+                finally:
+                    db.session.remove()
+
+    def close(self):
+        """Stop the background thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.counters)
+
+
+def init_autosave_compactor(app):
+    """
+    Attach an AutosaveCompactor to app.extensions; start its scheduler when
+    AUTOSAVE_COMPACTION_INTERVAL is set.
+    """
+    compactor = AutosaveCompactor.from_config(app)
+    app.extensions["autosave_compactor"] = compactor
+    if compactor.interval > 0:
+        compactor.start()
+        atexit.register(compactor.close)
+    return compactor
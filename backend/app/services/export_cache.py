@@ -0,0 +1,137 @@
+"""
+Disk cache for rendered exports under DOCS_EXPORT_PATH.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+CACHE_EXTENSIONS = (".docx", ".pdf")
+
+
+class ExportCache:
+    """
+    Content-addressed cache of rendered exports with LRU eviction.
+
+    Files are named <project_id>_<fingerprint>.<export_type>, so a changed
+    manuscript simply misses. A file's mtime records its last use; entries
+    older than `max_age` seconds are dropped, and the least recently used
+    entries go first once the directory exceeds `max_bytes`.
+    """
+
+    def __init__(self, directory, max_bytes, max_age):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    @classmethod
+    def from_app(cls, app):
+        """Build the cache from config, or return None if it is disabled."""
+        config = app.config
+        if not config.get("EXPORT_CACHE_ENABLED", True):
+            return None
+        return cls(
+            config["DOCS_EXPORT_PATH"],
+            int(config.get("EXPORT_CACHE_MAX_BYTES", 512 * 1024 * 1024)),
+            int(config.get("EXPORT_CACHE_MAX_AGE", 7 * 24 * 3600)),
+        )
+
+    def path(self, project_id, export_type, fingerprint):
+        return os.path.join(self.directory, f"{project_id}_{fingerprint}.{export_type}")
+
+    def get(self, project_id, export_type, fingerprint):
+        """Return the cached file path on a hit, refreshing its LRU stamp."""
+        path = self.path(project_id, export_type, fingerprint)
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                return None
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def open_file(self, project_id, export_type, fingerprint):
+        """
+        Open a cached export for reading, or return None on a miss. Holding
+        the file open keeps it readable if eviction removes it meanwhile.
+        """
+        path = self.get(project_id, export_type, fingerprint)
+        if path is None:
+            return None
+        try:
+            return open(path, "rb")
+        except OSError:
+            return None
+
+    def put(self, project_id, export_type, fingerprint, file_obj):
+        """
+        Store a rendered export and evict old entries. Cache write failures
+        are logged and ignored; the caller still has file_obj.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp:
+                    shutil.copyfileobj(file_obj, tmp)
+                # Reason: Atomic rename, so readers never see a half-written file
+                os.replace(tmp_path, self.path(project_id, export_type, fingerprint))
+            except BaseException:
+                # Reason: Never leave a partial temp file behind in the cache directory
+                self._remove(tmp_path)
+                raise
+        except OSError:
+            logger.exception("Could not write export cache entry")
+            return
+        finally:
+            file_obj.seek(0)
+        self.evict()
+
+    def entries(self):
+        """Return (mtime, size, path) for every cached export."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(CACHE_EXTENSIONS):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Remove expired entries, then LRU entries over the size limit."""
+        now = time.time()
+        removed = 0
+        kept = []
+        for mtime, size, path in sorted(self.entries()):
+            if now - mtime > self.max_age:
+                removed += self._remove(path)
+            else:
+                kept.append((mtime, size, path))
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in kept:
+            if total <= self.max_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+        return removed
+
+    @staticmethod
+    def _remove(path) -> int:
+        try:
+            os.remove(path)
+        except OSError:
+            return 0
+        return 1
@@ -0,0 +1,314 @@
+"""
+Bulk manuscript import: parse Markdown, Fountain or plain text into
+chapters and scenes and write them with batched multi-row inserts.
+"""
+
+import itertools
+import re
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert
+
+from backend.app import db
+from backend.app.services.stats_service import StatsService
+from backend.app.utils import text_stats
+from backend.app.utils.rank import encode_position
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+FORMATS = ("markdown", "fountain", "text")
+CONTENT_TYPES = {
+    "text/markdown": "markdown",
+    "text/x-markdown": "markdown",
+    "text/x-fountain": "fountain",
+    "text/plain": "text",
+}
+DEFAULT_BATCH_SIZE = 500
+TITLE_MAX_LENGTH = 200
+
+MARKDOWN_HEADING = re.compile(r"^(#{1,2})\s+(.*?)\s*#*\s*$")
+FOUNTAIN_SCENE = re.compile(r"^(INT|EXT|EST|INT\./EXT|INT/EXT|I/E)[\. ]", re.I)
+FOUNTAIN_SECTION = re.compile(r"^#(?!#)\s*(.*)$")
+FOUNTAIN_TITLE_KEY = re.compile(r"^[A-Za-z ]+:")
+TEXT_CHAPTER = re.compile(
+    r"^\s*(chapter|part|book)\s+(\d+|[ivxlcdm]+|[a-z]+(-[a-z]+)?)\s*([:.\-]\s*.*)?$",
+    re.I,
+)
+TEXT_SCENE_BREAK = re.compile(r"^\s*(\*\s*\*\s*\*[\s\*]*|#|-{3,}|~{3,})\s*$")
+
+
+class ManuscriptImportError(ValueError):
+    """Raised when a manuscript cannot be imported (bad format, empty)."""
+
+
+def parse_markdown(lines):
+    """'# ' starts a chapter, '## ' a scene; everything else is scene text."""
+    for line in lines:
+        match = MARKDOWN_HEADING.match(line)
+        if match:
+            kind = "chapter" if len(match.group(1)) == 1 else "scene"
+            yield kind, match.group(2)
+        else:
+            yield "line", line
+
+
+def parse_fountain(lines):
+    """
+    Level-1 sections ('# Act One') start chapters, scene headings
+    ('INT. HOUSE - DAY' or forced '.HEADING') start scenes. A leading title
+    page is reported as ("title", value).
+    """
+    lines = iter(lines)
+    first = next((line for line in lines if line.strip()), None)
+    if first is None:
+        return
+    if FOUNTAIN_TITLE_KEY.match(first):
+        # Reason: The title page runs until the first blank line
+        line = first
+        while line is not None and line.strip():
+            key, _, value = line.partition(":")
+            if key.strip().lower() == "title" and value.strip():
+                yield "title", value.strip()
+            line = next(lines, None)
+    else:
+        lines = itertools.chain([first], lines)
+    for line in lines:
+        stripped = line.strip()
+        section = FOUNTAIN_SECTION.match(stripped)
+        if section:
+            yield "chapter", section.group(1)
+        elif stripped.startswith(".") and not stripped.startswith(".."):
+            yield "scene", stripped[1:].strip()
+        elif FOUNTAIN_SCENE.match(stripped):
+            yield "scene", stripped
+        else:
+            yield "line", line
+
+
+def parse_text(lines):
+    """
+    Lines like 'Chapter 3' / 'Part Two' start chapters; separator lines
+    ('***', '* * *', '#', '---', '~~~') start a new scene.
+    """
+    for line in lines:
+        if TEXT_SCENE_BREAK.match(line):
+            yield "scene", None
+        elif len(line) <= TITLE_MAX_LENGTH and TEXT_CHAPTER.match(line):
+            yield "chapter", line.strip()
+        else:
+            yield "line", line
+
+
+PARSERS = {"markdown": parse_markdown, "fountain": parse_fountain, "text": parse_text}
+
+
+class ManuscriptWriter:
+    """
+    Accumulates parsed chapters/scenes and flushes them in multi-row INSERTs.
+
+    Chapters are always flushed before the scenes that reference them, so
+    foreign keys hold at every statement. Nothing is committed here.
+    """
+
+    def __init__(
+        self,
+        project_id,
+        batch_size=DEFAULT_BATCH_SIZE,
+        start_position=0,
+        after_rank=None,
+    ):
+        self.project_id = project_id
+        self.batch_size = batch_size
+        self.chapters = []
+        self.scenes = []
+        self.chapter_count = 0
+        self.scene_count = 0
+        self.word_count = 0
+        self.statements = 0
+        # Reason: Chapter totals are rolled up once, after every scene is written
+        self.chapter_stats = {}
+        self._chapter_id = None
+        self._chapter_position = start_position
+        # Reason: Appends go after the last rank, which moves may have changed
+        self._after_rank = after_rank
+        self.chapter_rank = after_rank
+        self._scene_position = 0
+        self._scene = None
+        self._lines = []
+        # Reason: The timeline orders by created_at; keep import order stable
+        self._clock = datetime.utcnow()
+
+    def _tick(self):
+        self._clock += timedelta(microseconds=1)
+        return self._clock
+
+    def start_chapter(self, title):
+        self.end_scene()
+        self._chapter_position += 1
+        self._scene_position = 0
+        self._chapter_id = str(uuid.uuid4())
+        # Reason: Extending the last rank sorts after it; fixed-width suffixes
+        # keep every appended rank the same length however many chapters come
+        self.chapter_rank = (
+            self._after_rank + encode_position(self.chapter_count + 1)
+            if self._after_rank is not None
+            else encode_position(self._chapter_position)
+        )
+        now = self._tick()
+        self.chapters.append(
+            {
+                "id": self._chapter_id,
+                "project_id": self.project_id,
+                "title": (title or f"Chapter {self._chapter_position}")[
+                    :TITLE_MAX_LENGTH
+                ],
+                "order": self._chapter_position,
+                "rank": self.chapter_rank,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        self.chapter_count += 1
+
+    def start_scene(self, title):
+        self.end_scene()
+        if self._chapter_id is None:
+            self.start_chapter(None)
+        self._scene_position += 1
+        self._scene = (title or f"Scene {self._scene_position}")[:TITLE_MAX_LENGTH]
+
+    def add_line(self, line):
+        if self._scene is None:
+            if not line.strip():
+                return
+            self.start_scene(None)
+        self._lines.append(line.rstrip("\r\n"))
+
+    def end_scene(self):
+        if self._scene is None:
+            return
+        content = "\n".join(self._lines).strip("\n")
+        stats = text_stats.compute(content)
+        self.word_count += stats["word_count"]
+        text_stats.add(self.chapter_stats.setdefault(self._chapter_id, {}), stats)
+        now = self._tick()
+        self.scenes.append(
+            {
+                "id": str(uuid.uuid4()),
+                "chapter_id": self._chapter_id,
+                "title": self._scene,
+                "content": content,
+                "order": self._scene_position,
+                "rank": encode_position(self._scene_position),
+                "created_at": now,
+                "updated_at": now,
+                **stats,
+            }
+        )
+        self.scene_count += 1
+        self._scene, self._lines = None, []
+        if len(self.scenes) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered chapters, then scenes, one multi-row INSERT each."""
+        if self.chapters:
+            db.session.execute(insert(Chapter), self.chapters)
+            self.statements += 1
+            self.chapters = []
+        if self.scenes:
+            db.session.execute(insert(Scene), self.scenes)
+            self.statements += 1
+            self.scenes = []
+
+
+class ImportService:
+    """
+    Service for importing a whole manuscript in one transaction.
+    """
+
+    @staticmethod
+    def detect_format(requested=None, content_type=None) -> str:
+        """Pick the parser from ?format= or the request Content-Type."""
+        if requested:
+            if requested not in FORMATS:
+                raise ManuscriptImportError(
+                    f"Invalid format. Must be one of: {', '.join(FORMATS)}."
+                )
+            return requested
+        mimetype = (content_type or "").split(";")[0].strip().lower()
+        return CONTENT_TYPES.get(mimetype, "text")
+
+    @staticmethod
+    def import_manuscript(
+        lines,
+        fmt,
+        user_id,
+        title=None,
+        project_id=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        rebalance_length=32,
+    ) -> dict:
+        """
+        Parse lines and insert the project, chapters and scenes.
+
+        Creates a new project unless project_id names an existing project of
+        user_id, in which case chapters are appended after its last chapter
+        by rank. Returns the row counts, plus the project under "rebalancing"
+        when appended ranks grew past rebalance_length; the caller commits
+        (or rolls back on ManuscriptImportError).
+        """
+        after_rank = None
+        if project_id:
+            project = (
+                db.session.query(Project)
+                .filter_by(id=project_id, user_id=user_id)
+                .first()
+            )
+            if project is None:
+                raise LookupError("Project not found")
+            after_rank, start = (
+                db.session.query(func.max(Chapter.rank), func.max(Chapter.order))
+                .filter(Chapter.project_id == project_id)
+                .one()
+            )
+            start = start or 0
+        else:
+            project = Project(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                title=(title or "Imported manuscript")[:TITLE_MAX_LENGTH],
+            )
+            db.session.add(project)
+            db.session.flush()
+            start = 0
+        writer = ManuscriptWriter(
+            project.id, batch_size, start_position=start, after_rank=after_rank
+        )
+        for kind, value in PARSERS[fmt](lines):
+            if kind == "line":
+                writer.add_line(value)
+            elif kind == "scene":
+                writer.start_scene(value)
+            elif kind == "chapter":
+                writer.start_chapter(value)
+            elif kind == "title" and not title and not project_id:
+                project.title = value[:TITLE_MAX_LENGTH]
+        writer.end_scene()
+        writer.flush()
+        if writer.chapter_count == 0:
+            raise ManuscriptImportError("Manuscript is empty")
+        StatsService.apply_deltas(writer.chapter_stats, project_id=project.id)
+        return {
+            "project_id": project.id,
+            "format": fmt,
+            "chapters": writer.chapter_count,
+            "scenes": writer.scene_count,
+            "words": writer.word_count,
+            "insert_statements": writer.statements,
+            "rebalancing": (
+                [project.id] if len(writer.chapter_rank) > rebalance_length else []
+            ),
+        }
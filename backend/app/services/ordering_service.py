@@ -0,0 +1,270 @@
+"""
+Rank-based ordering of chapters and scenes: bulk moves and rebalancing.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import case, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.app import db
+from backend.app.services.stats_service import StatsService
+from backend.app.utils.ownership import invalidate_on_commit
+from backend.app.utils.rank import encode_position, rank_between
+from backend.models.chapter import Chapter
+from backend.models.scene import Scene
+
+logger = logging.getLogger(__name__)
+
+# Reason: Ranks must fit the rank column; longer parents are renumbered inline
+RANK_HARD_LIMIT = 255
+PARENT_FIELDS = {Chapter: "project_id", Scene: "chapter_id"}
+PARENT_MODELS = {Scene: Chapter}
+
+
+class ReorderError(Exception):
+    """Raised when a move references unknown rows or invalid neighbours."""
+
+
+class OrderingService:
+    """
+    Applies moves by giving each moved row a rank between its new neighbours.
+
+    A move touches one row; a batch of moves is written with a single UPDATE.
+    Parents whose ranks grow past RANK_REBALANCE_LENGTH are renumbered later
+    by RankRebalancer.
+    """
+
+    @staticmethod
+    def parent_column(model):
+        return getattr(model, PARENT_FIELDS[model])
+
+    @staticmethod
+    def siblings(model, parent_ids, lock=False) -> dict:
+        """Return {parent_id: [[id, rank], ...]} in display order."""
+        parent = OrderingService.parent_column(model)
+        query = (
+            db.session.query(model.id, parent, model.rank)
+            .filter(parent.in_(parent_ids))
+            .order_by(parent, model.rank, model.created_at, model.id)
+        )
+        if lock:
+            query = query.with_for_update()
+        ordering = {parent_id: [] for parent_id in parent_ids}
+        for row_id, parent_id, rank in query:
+            ordering[parent_id].append([row_id, rank])
+        return ordering
+
+    @staticmethod
+    def _write(model, ranks, parents=None, orders=None):
+        """Write new ranks (and optionally parents/orders) in one UPDATE."""
+        values = {"rank": case(ranks, value=model.id)}
+        if parents:
+            values[PARENT_FIELDS[model]] = case(
+                parents, value=model.id, else_=OrderingService.parent_column(model)
+            )
+        if orders:
+            values["order"] = case(orders, value=model.id, else_=model.order)
+        db.session.execute(
+            update(model).where(model.id.in_(list(ranks))).values(**values),
+            execution_options={"synchronize_session": False},
+        )
+
+    @staticmethod
+    def apply_moves(model, moves, rebalance_length=32):
+        """
+        Apply moves in order and write them with a single UPDATE.
+
+        Each move is {"id", "after"?, "before"?, <parent field>?}; with no
+        neighbour the row goes to the end of its (new) parent. Returns
+        (items, long_parents): the changed rows as dicts and the parents whose
+        ranks now exceed rebalance_length. The caller commits.
+        """
+        parent_field = PARENT_FIELDS[model]
+        parent = OrderingService.parent_column(model)
+        ids = {move["id"] for move in moves}
+        current = dict(
+            db.session.query(model.id, parent).filter(model.id.in_(ids)).all()
+        )
+        missing = ids - current.keys()
+        if missing:
+            raise ReorderError(f"Unknown ids: {', '.join(sorted(missing))}")
+        targets = {move[parent_field] for move in moves if move.get(parent_field)}
+        new_parents = targets - set(current.values())
+        if new_parents:
+            if model not in PARENT_MODELS:
+                raise ReorderError(f"{parent_field} cannot be changed")
+            parent_model = PARENT_MODELS[model]
+            found = {
+                row_id
+                for (row_id,) in db.session.query(parent_model.id).filter(
+                    parent_model.id.in_(new_parents)
+                )
+            }
+            if new_parents - found:
+                raise ReorderError(
+                    f"Unknown {parent_field}: {', '.join(sorted(new_parents - found))}"
+                )
+        ordering = OrderingService.siblings(
+            model, set(current.values()) | targets, lock=True
+        )
+        location = dict(current)
+        ranks, parents, renumber = {}, {}, set()
+        for move in moves:
+            row_id = move["id"]
+            source = ordering[location[row_id]]
+            entry = next(item for item in source if item[0] == row_id)
+            source.remove(entry)
+            target_id = move.get(parent_field) or location[row_id]
+            target = ordering[target_id]
+            position = [item[0] for item in target]
+            anchor = move.get("after") or move.get("before")
+            if anchor is not None and anchor not in position:
+                raise ReorderError(f"{anchor} is not a sibling in {target_id}")
+            if move.get("after"):
+                index = position.index(move["after"]) + 1
+            elif move.get("before"):
+                index = position.index(move["before"])
+            else:
+                index = len(target)
+            lower = target[index - 1][1] if index > 0 else None
+            upper = target[index][1] if index < len(target) else None
+            if lower is not None and upper is not None and lower >= upper:
+                # Reason: Legacy rows can share a rank; renumber this parent
+                renumber.add(target_id)
+                entry[1] = lower
+            else:
+                entry[1] = rank_between(lower, upper)
+                if len(entry[1]) > RANK_HARD_LIMIT:
+                    renumber.add(target_id)
+            target.insert(index, entry)
+            ranks[row_id] = entry[1]
+            if target_id != current[row_id]:
+                parents[row_id] = target_id
+            location[row_id] = target_id
+        orders = {}
+        for parent_id in renumber:
+            for position, (row_id, _) in enumerate(ordering[parent_id], start=1):
+                ranks[row_id] = encode_position(position)
+                orders[row_id] = position
+        OrderingService._write(model, ranks, parents, orders)
+        if model is Scene and parents:
+            # Reason: Moved scenes (and their drafts) now belong to another chapter
+            invalidate_on_commit(parents)
+            # Reason: Scenes changing chapter carry their statistics with them
+            StatsService.move_scenes(
+                {
+                    row_id: (current[row_id], target)
+                    for row_id, target in parents.items()
+                }
+            )
+        parent_of = {
+            row_id: parent_id
+            for parent_id, rows in ordering.items()
+            for row_id, _ in rows
+        }
+        items = [
+            {"id": row_id, parent_field: parent_of[row_id], "rank": rank}
+            for row_id, rank in ranks.items()
+        ]
+        long_parents = {
+            parent_id
+            for parent_id in {location[move["id"]] for move in moves}
+            if any(
+                len(ranks.get(i, r)) > rebalance_length for i, r in ordering[parent_id]
+            )
+        }
+        return items, long_parents
+
+    @staticmethod
+    def rebalance(model, parent_id) -> int:
+        """
+        Renumber a parent's children to short, evenly spaced ranks.
+
+        Also rewrites the legacy `order` integers to match. Returns the
+        number of rows changed; the caller commits.
+        """
+        ordering = OrderingService.siblings(model, [parent_id], lock=True)[parent_id]
+        ranks, orders = {}, {}
+        for position, (row_id, rank) in enumerate(ordering, start=1):
+            fresh = encode_position(position)
+            if fresh != rank:
+                ranks[row_id] = fresh
+                orders[row_id] = position
+        if ranks:
+            OrderingService._write(model, ranks, orders=orders)
+        return len(ranks)
+
+
+class RankRebalancer:
+    """
+    Background worker that rebalances parents whose ranks grew too long.
+
+    Requests for a parent already queued are collapsed into one job. With
+    `run_async=False` jobs run inline (tests, single-threaded tools).
+    """
+
+    def __init__(self, app, run_async=True):
+        self.app = app
+        self.run_async = run_async
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="rank-rebalancer")
+            if run_async
+            else None
+        )
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._futures = []
+        self.rebalanced = 0
+
+    def schedule(self, model, parent_id):
+        """Queue a rebalance of parent_id's children of model."""
+        key = (model, parent_id)
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        if self._executor is None:
+            self._run(model, parent_id)
+            return
+        future = self._executor.submit(self._run, model, parent_id)
+        with self._lock:
+            self._futures = [f for f in self._futures if not f.done()] + [future]
+
+    def _run(self, model, parent_id):
+        with self._lock:
+            self._pending.discard((model, parent_id))
+        if self.run_async:
+            with self.app.app_context():
+                self._rebalance(model, parent_id)
+                db.session.remove()
+        else:
+            self._rebalance(model, parent_id)
+
+    def _rebalance(self, model, parent_id):
+        try:
+            changed = OrderingService.rebalance(model, parent_id)
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            logger.exception("Rank rebalance failed for %s", parent_id)
+            return
+        self.rebalanced += changed
+
+    def wait(self):
+        """Block until every queued rebalance has finished."""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.result()
+
+
+def init_rank_rebalancer(app):
+    """Attach a RankRebalancer to app.extensions."""
+    rebalancer = RankRebalancer(
+        app, run_async=app.config.get("RANK_REBALANCE_ASYNC", True)
+    )
+    app.extensions["rank_rebalancer"] = rebalancer
+    return rebalancer
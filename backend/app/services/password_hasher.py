@@ -0,0 +1,111 @@
+"""
+Bounded worker pool for password hashing.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+# Reason: Werkzeug method strings are "<algorithm>:<cost params>"
+DEFAULT_COSTS = {"scrypt": 32768, "pbkdf2": 600000}
+
+
+class HasherBusy(Exception):
+    """Raised when the hashing pool is saturated or a job times out."""
+
+
+def hash_method(algorithm="scrypt", cost=None) -> str:
+    """
+    Build a werkzeug hash method string from an algorithm and cost.
+
+    For scrypt the cost is N (r=8, p=1); for pbkdf2 it is the iteration count.
+    """
+    if algorithm not in DEFAULT_COSTS:
+        raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+    cost = cost or DEFAULT_COSTS[algorithm]
+    if algorithm == "scrypt":
+        return f"scrypt:{cost}:8:1"
+    return f"pbkdf2:sha256:{cost}"
+
+
+class PasswordHasher:
+    """
+    Runs hashing jobs on a fixed-size thread pool with queue-depth limits.
+
+    hashlib's scrypt and pbkdf2 release the GIL, so jobs run in parallel with
+    request handling. At most `workers + max_queue` jobs are admitted at once;
+    anything beyond that is refused with HasherBusy instead of piling up.
+    """
+
+    def __init__(self, workers=2, max_queue=32, timeout=10.0):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hasher"
+        )
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self.counters = {"submitted": 0, "completed": 0, "rejected": 0, "timeouts": 0}
+        self.in_flight = 0
+
+    @classmethod
+    def from_config(cls, app):
+        """Build a pool from the PASSWORD_HASH_* config values."""
+        config = app.config
+        return cls(
+            workers=int(config.get("PASSWORD_HASH_WORKERS", 2)),
+            max_queue=int(config.get("PASSWORD_HASH_MAX_QUEUE", 32)),
+            timeout=float(config.get("PASSWORD_HASH_TIMEOUT", 10.0)),
+        )
+
+    def run(self, fn, *args):
+        """Run fn(*args) on the pool and wait for it; raise HasherBusy if full."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.counters["rejected"] += 1
+            raise HasherBusy("Password hashing queue is full")
+        with self._lock:
+            self.counters["submitted"] += 1
+            self.in_flight += 1
+        try:
+            future = self._executor.submit(fn, *args)
+        except RuntimeError:
+            self._release()
+            raise HasherBusy("Password hashing pool is shut down")
+        future.add_done_callback(lambda _: self._release(completed=True))
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            with self._lock:
+                self.counters["timeouts"] += 1
+            raise HasherBusy("Password hashing timed out")
+
+    def _release(self, completed=False):
+        with self._lock:
+            self.in_flight -= 1
+            if completed:
+                self.counters["completed"] += 1
+        self._slots.release()
+
+    def shutdown(self):
+        """Stop accepting jobs and wait for running ones."""
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """Return pool size, queue limit, in-flight jobs and counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                **self.counters,
+            }
+
+
+def init_password_hasher(app):
+    """Attach a PasswordHasher to app.extensions when enabled in config."""
+    if int(app.config.get("PASSWORD_HASH_WORKERS", 0)) <= 0:
+        return None
+    hasher = PasswordHasher.from_config(app)
+    app.extensions["password_hasher"] = hasher
+    return hasher
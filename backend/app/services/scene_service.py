@@ -0,0 +1,81 @@
+"""
+Scene content edits applied server-side from text operations.
+"""
+
+from sqlalchemy import update
+
+from backend.app import db
+from backend.app.services.stats_service import StatsService
+from backend.app.utils import text_delta, text_stats
+from backend.app.utils.text_stats import STAT_FIELDS
+from backend.models.chapter import Chapter
+from backend.models.scene import Scene
+
+
+class StaleVersionError(Exception):
+    """Raised when a patch's base version is not the scene's current one."""
+
+    def __init__(self, current_version):
+        super().__init__("Stale base version")
+        self.current_version = current_version
+
+
+class SceneService:
+    """
+    Service for patching scene content against a known version.
+    """
+
+    @staticmethod
+    def apply_patch(scene_id, base_version, ops) -> dict:
+        """
+        Apply text operations to a scene written at base_version.
+
+        The write is a conditional UPDATE on (id, version), so two editors
+        patching the same base cannot both win; the loser gets
+        StaleVersionError with the version to rebase onto. Statistics are
+        recounted and the change rolled up to the chapter and project.
+        Raises LookupError
+        for an unknown scene and ValueError when the ops do not fit the text.
+        Returns {"id", "version", "length", "updated_at"}; the caller commits.
+        """
+        row = (
+            db.session.query(
+                Scene.version,
+                Scene.content,
+                Scene.chapter_id,
+                Chapter.project_id,
+                *(getattr(Scene, field) for field in STAT_FIELDS),
+            )
+            .join(Chapter, Chapter.id == Scene.chapter_id)
+            .filter(Scene.id == scene_id)
+            .one_or_none()
+        )
+        if row is None:
+            raise LookupError("Scene not found")
+        if row.version != base_version:
+            raise StaleVersionError(row.version)
+        content = text_delta.apply(row.content, ops)
+        stats = text_stats.compute(content)
+        result = db.session.execute(
+            update(Scene)
+            .where(Scene.id == scene_id, Scene.version == base_version)
+            .values(content=content, version=Scene.version + 1, **stats)
+            .returning(Scene.version, Scene.updated_at),
+            execution_options={"synchronize_session": False},
+        ).one_or_none()
+        if result is None:
+            # Reason: Another patch committed between our read and write
+            current = db.session.query(Scene.version).filter_by(id=scene_id).scalar()
+            raise StaleVersionError(current)
+        StatsService.apply_deltas(
+            {row.chapter_id: text_stats.difference(stats, text_stats.of(row))},
+            project_id=row.project_id,
+        )
+        return {
+            "id": scene_id,
+            "version": result.version,
+            "length": len(content),
+            "updated_at": (
+                result.updated_at.isoformat() if result.updated_at else None
+            ),
+        }
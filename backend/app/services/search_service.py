@@ -0,0 +1,185 @@
+"""
+Ranked full-text search over a project's scenes, drafts and annotations.
+"""
+
+import html
+import re
+
+from sqlalchemy import text
+
+from backend.app import db
+from backend.models.search_index import (
+    LANGUAGE,
+    SEARCH_COLUMNS,
+    VECTOR_COLUMN,
+    document_sql,
+    fts_table,
+)
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+TYPES = ("scene", "draft", "annotation")
+# Reason: Control characters survive html.escape and never occur in prose
+MARK_START, MARK_STOP = "\x02", "\x03"
+SNIPPET_TOKENS = 16
+HEADLINE_OPTIONS = (
+    f"StartSel={MARK_START}, StopSel={MARK_STOP}, "
+    f"MaxWords={SNIPPET_TOKENS}, MinWords=6, MaxFragments=1"
+)
+TERM = re.compile(r'"([^"]+)"|(\w+)', re.UNICODE)
+
+# Per type: source table, its alias, and the joins up to the owning chapter
+SOURCES = {
+    "scene": (
+        "scenes",
+        "s",
+        "s.id AS scene_id, NULL AS draft_id, s.title AS title",
+        "",
+    ),
+    "draft": (
+        "drafts",
+        "d",
+        "d.scene_id AS scene_id, d.id AS draft_id, s.title AS title",
+        "JOIN scenes s ON s.id = d.scene_id",
+    ),
+    "annotation": (
+        "annotations",
+        "a",
+        "d.scene_id AS scene_id, a.draft_id AS draft_id, s.title AS title",
+        "JOIN drafts d ON d.id = a.draft_id JOIN scenes s ON s.id = d.scene_id",
+    ),
+}
+# Reason: A hit in a scene title outweighs one in the body
+WEIGHTS = {"scenes": (2.0, 1.0), "drafts": (1.0,), "annotations": (1.5, 1.0)}
+
+
+class SearchError(ValueError):
+    """Raised for an empty query, bad limit or unknown result type."""
+
+
+def highlight(snippet) -> str:
+    """Escape a snippet for HTML and turn the match markers into <mark>."""
+    return (
+        html.escape(snippet or "")
+        .replace(MARK_START, "<mark>")
+        .replace(MARK_STOP, "</mark>")
+    )
+
+
+class SearchService:
+    """
+    Service for querying the full-text indexes from backend.models.search_index.
+    """
+
+    @staticmethod
+    def terms(q) -> list:
+        """Split a query into words and "quoted phrases"."""
+        return [
+            phrase.strip() or word
+            for phrase, word in TERM.findall(q or "")
+            if (phrase.strip() or word)
+        ]
+
+    @staticmethod
+    def parse_types(value) -> tuple:
+        if not value:
+            return TYPES
+        types = tuple(t.strip() for t in value.split(",") if t.strip())
+        unknown = set(types) - set(TYPES)
+        if unknown or not types:
+            raise SearchError(f"types must be a subset of: {', '.join(TYPES)}")
+        return types
+
+    @staticmethod
+    def parse_limit(value) -> int:
+        if value in (None, ""):
+            return DEFAULT_LIMIT
+        try:
+            limit = int(value)
+        except (TypeError, ValueError) as exc:
+            raise SearchError("limit must be an integer") from exc
+        if limit < 1 or limit > MAX_LIMIT:
+            raise SearchError(f"limit must be between 1 and {MAX_LIMIT}")
+        return limit
+
+    @staticmethod
+    def search(project_id, q, limit=DEFAULT_LIMIT, types=TYPES) -> list:
+        """
+        Return up to `limit` hits across types, best first.
+
+        Each hit is {"type", "id", "scene_id", "draft_id", "title",
+        "snippet", "score"}; snippets are HTML-escaped with <mark> around
+        matched terms. One indexed query per type.
+        """
+        terms = SearchService.terms(q)
+        if not terms:
+            raise SearchError("q must contain at least one word")
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            build = SearchService._postgresql_sql
+            params = {
+                "q": " ".join(f'"{term}"' if " " in term else term for term in terms),
+                "options": HEADLINE_OPTIONS,
+            }
+        elif dialect == "sqlite":
+            build = SearchService._sqlite_sql
+            # Reason: Quote every term so FTS5 operators in user input are inert
+            params = {
+                "q": " ".join('"' + term.replace('"', '""') + '"' for term in terms),
+                "start": MARK_START,
+                "stop": MARK_STOP,
+            }
+        else:
+            raise SearchError(f"Search is not supported on {dialect}")
+        params.update(project_id=project_id, limit=limit)
+        hits = []
+        for kind in types:
+            rows = db.session.execute(text(build(kind)), params).mappings()
+            for row in rows:
+                hits.append(
+                    {
+                        "type": kind,
+                        "id": row["id"],
+                        "scene_id": row["scene_id"],
+                        "draft_id": row["draft_id"],
+                        "title": row["title"],
+                        "snippet": highlight(row["snippet"]),
+                        "score": round(float(row["score"]), 6),
+                    }
+                )
+        hits.sort(key=lambda hit: hit["score"], reverse=True)
+        return hits[:limit]
+
+    @staticmethod
+    def _sqlite_sql(kind) -> str:
+        table, alias, columns, joins = SOURCES[kind]
+        fts = fts_table(table)
+        weights = ", ".join(str(w) for w in WEIGHTS[table])
+        # Reason: bm25() is lower-is-better; negate so every backend sorts desc
+        return (
+            f"SELECT {alias}.id AS id, {columns}, "
+            f"snippet({fts}, -1, :start, :stop, '…', {SNIPPET_TOKENS}) AS snippet, "
+            f"-bm25({fts}, {weights}) AS score "
+            f"FROM {fts} JOIN {table} {alias} ON {alias}.rowid = {fts}.rowid "
+            f"{joins} JOIN chapters c ON c.id = s.chapter_id "
+            f"WHERE {fts} MATCH :q AND c.project_id = :project_id "
+            f"ORDER BY score DESC LIMIT :limit"
+        )
+
+    @staticmethod
+    def _postgresql_sql(kind) -> str:
+        table, alias, columns, joins = SOURCES[kind]
+        vector = f"{alias}.{VECTOR_COLUMN}"
+        # Reason: ts_headline is costly; only run it on the page of hits
+        return (
+            f"SELECT hit.id, hit.scene_id, hit.draft_id, hit.title, hit.score, "
+            f"ts_headline('{LANGUAGE}', hit.document, "
+            f"websearch_to_tsquery('{LANGUAGE}', :q), :options) AS snippet "
+            f"FROM (SELECT {alias}.id AS id, {columns}, "
+            f"{document_sql(SEARCH_COLUMNS[table], alias)} AS document, "
+            f"ts_rank_cd({vector}, query) AS score "
+            f"FROM {table} {alias} {joins} JOIN chapters c ON c.id = s.chapter_id "
+            f"CROSS JOIN websearch_to_tsquery('{LANGUAGE}', :q) AS query "
+            f"WHERE {vector} @@ query AND c.project_id = :project_id "
+            f"ORDER BY score DESC LIMIT :limit) AS hit"
+        )
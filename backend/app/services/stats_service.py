@@ -0,0 +1,183 @@
+"""
+Stored writing statistics: per-scene counts recomputed when content
+changes, rolled up to chapters and projects with delta updates.
+"""
+
+from sqlalchemy import case, func, select, update
+
+from backend.app import db
+from backend.app.utils import text_stats
+from backend.app.utils.text_stats import STAT_FIELDS
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+REBUILD_BATCH_SIZE = 500
+
+
+class StatsService:
+    """
+    Service for keeping scene, chapter and project statistics current.
+
+    Only a scene's own text is ever counted. Chapter and project figures
+    are adjusted by the change in that count (`x = x + delta`), so a
+    one-word edit costs the same in a 10-page story and a 1000-page novel.
+    """
+
+    @staticmethod
+    def set_content(scene, content) -> dict:
+        """
+        Store content and its statistics on an ORM scene; roll up the change.
+
+        Works for new (unflushed) scenes too. Returns the chapter delta;
+        the caller commits.
+        """
+        stats = text_stats.compute(content)
+        delta = text_stats.difference(stats, text_stats.of(scene))
+        scene.content = content
+        for field, value in stats.items():
+            setattr(scene, field, value)
+        StatsService.apply_deltas({scene.chapter_id: delta})
+        return delta
+
+    @staticmethod
+    def apply_deltas(deltas, project_id=None) -> None:
+        """
+        Add {chapter_id: {field: change}} to the chapters and their projects.
+
+        Pass project_id when every chapter belongs to it to skip looking the
+        owners up. At most one UPDATE per table; empty deltas are dropped.
+        The caller commits.
+        """
+        deltas = {chapter_id: delta for chapter_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        StatsService._increment(Chapter, deltas)
+        if project_id is not None:
+            owners = dict.fromkeys(deltas, project_id)
+        elif len(deltas) == 1:
+            # Reason: A single chapter's project is resolved inside the UPDATE
+            ((chapter_id, delta),) = deltas.items()
+            owner = (
+                select(Chapter.project_id)
+                .where(Chapter.id == chapter_id)
+                .scalar_subquery()
+            )
+            StatsService._increment(Project, {owner: delta})
+            return
+        else:
+            owners = dict(
+                db.session.query(Chapter.id, Chapter.project_id).filter(
+                    Chapter.id.in_(list(deltas))
+                )
+            )
+        projects = {}
+        for chapter_id, delta in deltas.items():
+            text_stats.add(projects.setdefault(owners[chapter_id], {}), delta)
+        StatsService._increment(
+            Project,
+            {key: delta for key, delta in projects.items() if any(delta.values())},
+        )
+
+    @staticmethod
+    def _increment(model, deltas) -> None:
+        """UPDATE model SET field = field + delta for each {id: delta}."""
+        if not deltas:
+            return
+        fields = sorted({field for delta in deltas.values() for field in delta})
+        # Reason: Rollups are not edits; keep updated_at (and list ETags) stable
+        values = {"updated_at": model.updated_at}
+        if len(deltas) == 1:
+            ((key, delta),) = deltas.items()
+            condition = model.id == key
+            for field in fields:
+                values[field] = getattr(model, field) + delta.get(field, 0)
+        else:
+            condition = model.id.in_(list(deltas))
+            for field in fields:
+                values[field] = getattr(model, field) + case(
+                    {key: delta.get(field, 0) for key, delta in deltas.items()},
+                    value=model.id,
+                    else_=0,
+                )
+        db.session.execute(
+            update(model).where(condition).values(**values),
+            execution_options={"synchronize_session": False},
+        )
+
+    @staticmethod
+    def move_scenes(moves) -> None:
+        """
+        Move statistics for scenes changing chapter: {scene_id: (old, new)}.
+        The caller commits.
+        """
+        if not moves:
+            return
+        columns = [getattr(Scene, field) for field in STAT_FIELDS]
+        deltas = {}
+        for row in db.session.query(Scene.id, *columns).filter(
+            Scene.id.in_(list(moves))
+        ):
+            stats = text_stats.of(row)
+            source, target = moves[row.id]
+            text_stats.add(
+                deltas.setdefault(source, {}),
+                {field: -value for field, value in stats.items()},
+            )
+            text_stats.add(deltas.setdefault(target, {}), stats)
+        StatsService.apply_deltas(
+            {
+                chapter_id: {f: v for f, v in delta.items() if v}
+                for chapter_id, delta in deltas.items()
+            }
+        )
+
+    @staticmethod
+    def rebuild(batch_size=REBUILD_BATCH_SIZE) -> int:
+        """
+        Recount every scene from its content and recompute all rollups.
+
+        A full scan for backfilling after the migration or repairing drift;
+        request paths never call it. Returns the number of scenes; the
+        caller commits.
+        """
+        scenes, last_id = 0, None
+        while True:
+            query = db.session.query(
+                Scene.id, Scene.content, Scene.updated_at
+            ).order_by(Scene.id)
+            if last_id is not None:
+                query = query.filter(Scene.id > last_id)
+            rows = query.limit(batch_size).all()
+            if not rows:
+                break
+            db.session.execute(
+                update(Scene),
+                [
+                    {
+                        "id": row.id,
+                        "updated_at": row.updated_at,
+                        **text_stats.compute(row.content),
+                    }
+                    for row in rows
+                ],
+            )
+            scenes += len(rows)
+            last_id = rows[-1].id
+        for model, child, parent in (
+            (Chapter, Scene, Scene.chapter_id),
+            (Project, Chapter, Chapter.project_id),
+        ):
+            db.session.execute(
+                update(model).values(
+                    updated_at=model.updated_at,
+                    **{
+                        field: select(func.coalesce(func.sum(getattr(child, field)), 0))
+                        .where(parent == model.id)
+                        .scalar_subquery()
+                        for field in STAT_FIELDS
+                    },
+                ),
+                execution_options={"synchronize_session": False},
+            )
+        return scenes
@@ -0,0 +1,79 @@
+"""
+Timeline service for building a project's chapter/scene tree in bulk.
+"""
+
+from sqlalchemy import distinct, func
+
+from backend.app import db
+from backend.models.chapter import Chapter
+from backend.models.scene import Scene
+
+
+class TimelineService:
+    """
+    Service for loading the chapter/scene timeline of a project.
+    """
+
+    @staticmethod
+    def tree_state(project_id: str) -> tuple:
+        """
+        Return (chapter count, chapter max updated_at, scene count, scene max
+        updated_at) for a project in one aggregate query.
+
+        Any insert, update, move or delete in the tree changes at least one
+        of these values, so they are used for ETags and export fingerprints.
+        """
+        return tuple(
+            db.session.query(
+                func.count(distinct(Chapter.id)),
+                func.max(Chapter.updated_at),
+                func.count(Scene.id),
+                func.max(Scene.updated_at),
+            )
+            .outerjoin(Scene, Scene.chapter_id == Chapter.id)
+            .filter(Chapter.project_id == project_id)
+            .one()
+        )
+
+    @staticmethod
+    def build_timeline(project_id: str) -> list:
+        """
+        Return the ordered chapter/scene tree for a project.
+
+        Loads every chapter with its scenes through a single outer join and
+        groups the rows in Python, so the query count does not grow with the
+        number of chapters.
+        """
+        # Reason: Select only the columns the timeline needs, never Scene.content
+        rows = (
+            db.session.query(
+                Chapter.id,
+                Chapter.title,
+                Scene.id,
+                Scene.title,
+                Scene.created_at,
+            )
+            .outerjoin(Scene, Scene.chapter_id == Chapter.id)
+            .filter(Chapter.project_id == project_id)
+            .order_by(Chapter.created_at, Chapter.id, Scene.created_at, Scene.id)
+            .all()
+        )
+        chapters = {}
+        for chapter_id, chapter_title, scene_id, scene_title, created_at in rows:
+            entry = chapters.get(chapter_id)
+            if entry is None:
+                entry = {
+                    "chapter_id": chapter_id,
+                    "chapter_title": chapter_title or "",
+                    "scenes": [],
+                }
+                chapters[chapter_id] = entry
+            if scene_id is not None:
+                entry["scenes"].append(
+                    {
+                        "scene_id": scene_id,
+                        "scene_title": scene_title or "",
+                        "created_at": created_at.isoformat() if created_at else None,
+                    }
+                )
+        return list(chapters.values())
@@ -0,0 +1,213 @@
+"""
+Connection-pool settings from config, and live pool statistics.
+
+Gunicorn runs one pool per worker process. The DB_POOL_* config values
+decide how big each pool is, and PoolStats reports how full it is and how
+long requests wait to get a connection, so the worker and pool counts can be
+sized from measurements.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+PROFILES = ("default", "pgbouncer")
+WAIT_SAMPLES = 1024
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class PoolStats:
+    """
+    Thread-safe counters for one engine's pool.
+
+    Checkout wait is the time Pool.connect() took: waiting for a free
+    connection, opening a new one, and the pre-ping if enabled. The last
+    `samples` waits are kept for percentiles.
+    """
+
+    def __init__(self, samples=WAIT_SAMPLES):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=samples)
+        self.counters = {
+            "connects": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "invalidated": 0,
+            "timeouts": 0,
+            "wait_seconds_total": 0.0,
+        }
+        self.wait_max = 0.0
+
+    def increment(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def record_wait(self, seconds, timed_out=False):
+        with self._lock:
+            self._waits.append(seconds)
+            self.counters["wait_seconds_total"] += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.counters["timeouts"] += 1
+
+    def listen(self, engine):
+        """Count connects, checkouts, checkins and invalidations on `engine`."""
+        for name, counter in (
+            ("connect", "connects"),
+            ("checkout", "checkouts"),
+            ("checkin", "checkins"),
+            ("invalidate", "invalidated"),
+        ):
+            event.listen(engine, name, self._counter(counter))
+
+    def _counter(self, name):
+        def listener(*args):
+            self.increment(name)
+
+        return listener
+
+    def snapshot(self, pool) -> dict:
+        """Current pool occupancy plus the counters and wait percentiles."""
+        with self._lock:
+            counters = dict(self.counters)
+            waits = sorted(self._waits)
+            wait_max = self.wait_max
+        if isinstance(pool, QueuePool):
+            occupancy = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                # Reason: QueuePool counts overflow from -pool_size upwards
+                "overflow": max(0, pool.overflow()),
+            }
+        else:
+            occupancy = {
+                "size": None,
+                "checked_out": counters["checkouts"] - counters["checkins"],
+                "checked_in": None,
+                "overflow": None,
+            }
+        counters["wait_seconds_total"] = round(counters["wait_seconds_total"], 6)
+        return {
+            "pid": os.getpid(),
+            "pool_class": type(pool).__name__,
+            **occupancy,
+            **counters,
+            "wait_ms_p50": round(_percentile(waits, 0.50) * 1000, 3),
+            "wait_ms_p95": round(_percentile(waits, 0.95) * 1000, 3),
+            "wait_ms_max": round(wait_max * 1000, 3),
+        }
+
+
+def instrumented_pool_class(base, stats):
+    """
+    A subclass of `base` that times every checkout into `stats`. The pool
+    recreates itself from its own class after dispose(), so the timing
+    survives reconnects.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except PoolTimeoutError:
+            stats.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        stats.record_wait(time.perf_counter() - started)
+        return connection
+
+    return type(base.__name__, (base,), {"connect": connect, "stats": stats})
+
+
+def engine_options(config, stats=None) -> dict:
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for the DB_POOL_* config values.
+
+    "default" keeps a QueuePool per process and sets statement_timeout as a
+    connection startup option. "pgbouncer" is for PgBouncer in transaction
+    mode: PgBouncer does the pooling, so the app opens a connection per
+    checkout (NullPool), and sends no startup options, which PgBouncer
+    rejects. The statement timeout is then applied per transaction by
+    init_db_pool(). In-memory SQLite keeps Flask-SQLAlchemy's single shared
+    connection.
+    """
+    profile = config.get("DB_POOL_PROFILE", "default")
+    if profile not in PROFILES:
+        raise ValueError(
+            f"DB_POOL_PROFILE must be one of {', '.join(PROFILES)}: {profile!r}"
+        )
+    url = make_url(config["SQLALCHEMY_DATABASE_URI"])
+    backend = url.get_backend_name()
+    if backend == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    if profile == "pgbouncer":
+        options = {"poolclass": NullPool}
+    else:
+        options = {
+            "poolclass": QueuePool,
+            "pool_size": int(config.get("DB_POOL_SIZE", 5)),
+            "max_overflow": int(config.get("DB_MAX_OVERFLOW", 10)),
+            # Reason: Flask-SQLAlchemy builds the engine with engine_from_config,
+            # which coerces pool_timeout to whole seconds
+            "pool_timeout": int(config.get("DB_POOL_TIMEOUT", 30)),
+            "pool_recycle": int(config.get("DB_POOL_RECYCLE", -1)),
+            "pool_pre_ping": bool(config.get("DB_POOL_PRE_PING", True)),
+        }
+        timeout = int(config.get("DB_STATEMENT_TIMEOUT_MS", 0))
+        if timeout > 0 and backend == "postgresql":
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    if stats is not None:
+        options["poolclass"] = instrumented_pool_class(options["poolclass"], stats)
+    return options
+
+
+def configure_engine(app):
+    """
+    Fill SQLALCHEMY_ENGINE_OPTIONS from the DB_POOL_* values before
+    db.init_app(); keys already in SQLALCHEMY_ENGINE_OPTIONS win.
+    """
+    stats = PoolStats()
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        **engine_options(app.config, stats),
+        **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+    }
+    app.extensions["db_pool"] = stats
+    return stats
+
+
+def init_db_pool(app, engine):
+    """
+    Attach pool statistics to the engine created by db.init_app() and, under
+    the pgbouncer profile, the per-transaction statement timeout.
+    """
+    stats = app.extensions["db_pool"]
+    stats.listen(engine)
+    timeout = int(app.config.get("DB_STATEMENT_TIMEOUT_MS", 0))
+    if (
+        app.config.get("DB_POOL_PROFILE") == "pgbouncer"
+        and timeout > 0
+        and engine.dialect.name == "postgresql"
+    ):
+
+        def set_statement_timeout(conn):
+            # Reason: SET LOCAL ends with the transaction, so it never leaks to
+            # the next client PgBouncer hands this server connection to
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.execute(f"SET LOCAL statement_timeout = {timeout}")
+            finally:
+                cursor.close()
+
+        event.listen(engine, "begin", set_statement_timeout)
+    return stats
@@ -0,0 +1,47 @@
+"""
+Conditional GET helpers: cheap ETags from (row count, max updated_at)
+aggregates and If-None-Match -> 304 handling that skips loading rows.
+"""
+
+import hashlib
+
+from flask import current_app, make_response, request
+from sqlalchemy import func
+
+from backend.app import db
+
+# Reason: Bump when a response representation changes, invalidating old ETags
+REPRESENTATION_VERSION = 1
+
+
+def compute_etag(*parts) -> str:
+    """Hash the state a response depends on into an opaque strong ETag."""
+    raw = "|".join(str(part) for part in (REPRESENTATION_VERSION, *parts))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def collection_state(model, *criteria) -> tuple:
+    """Return (row count, max updated_at) of model rows matching criteria."""
+    return tuple(
+        db.session.query(func.count(model.id), func.max(model.updated_at))
+        .filter(*criteria)
+        .one()
+    )
+
+
+def conditional_response(etag: str, build):
+    """
+    Answer 304 when If-None-Match matches etag; otherwise call build().
+
+    build() returns any Flask view result and is only called on a miss, so
+    an unchanged collection is never loaded or serialized.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(build())
+    response.set_etag(etag)
+    # Reason: Per-user data; clients may store it but must revalidate
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.vary.add("Authorization")
+    return response
@@ -17,7 +17,8 @@ def jwt_required(f):
                 token = auth_header.split(" ")[1]
         if not token:
             return jsonify({"error": "Token is missing"}), 401
-        payload = AuthService.decode_token(token)
+        # Reason: Cached fast path; signature is verified once per token
+        payload = AuthService.verify_token(token)
         if not payload:
             return jsonify({"error": "Token is invalid or expired"}), 401
         request.user_id = payload["user_id"]
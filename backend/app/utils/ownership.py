@@ -0,0 +1,251 @@
+"""
+Cached ownership resolution for access checks on nested rows.
+
+Annotations, drafts, scenes and chapters reach their owner only through
+their parent project. Resolving an id walks that chain with one query that
+joins on primary keys; the result (owner, project and every ancestor id) is
+kept in a bounded in-process cache so an access check is usually one dict
+lookup.
+
+Rows only change parent when scenes are reordered into another chapter.
+Moves are queued with invalidate_on_commit() and dropped from the cache once
+the transaction commits, together with every cached descendant. Other
+worker processes pick the move up when their entries reach
+OWNERSHIP_CACHE_TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from backend.app import db
+from backend.models.annotation import Annotation
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+# Reason: Child to parent, each row pointing at the next by its foreign key
+CHAIN = (
+    ("annotation", Annotation, Annotation.draft_id),
+    ("draft", Draft, Draft.scene_id),
+    ("scene", Scene, Scene.chapter_id),
+    ("chapter", Chapter, Chapter.project_id),
+    ("project", Project, None),
+)
+KINDS = tuple(kind for kind, _, _ in CHAIN)
+_PENDING_KEY = "ownership_invalidations"
+
+
+class Ownership:
+    """Owner of one row, its project and the ids of all its ancestors."""
+
+    __slots__ = ("user_id", "project_id", "ancestors")
+
+    def __init__(self, user_id, project_id, ancestors):
+        self.user_id = user_id
+        self.project_id = project_id
+        self.ancestors = ancestors
+
+
+class OwnershipCache:
+    """
+    LRU cache of (kind, id) -> Ownership with a TTL.
+
+    invalidate() drops the given ids and every entry below them. A lookup
+    that started before an invalidation does not store its result, so a read
+    racing with a move cannot put the old parent back.
+    """
+
+    def __init__(self, maxsize=10000, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_app(cls, app):
+        """Build a cache from app config, or None when disabled."""
+        maxsize = app.config.get("OWNERSHIP_CACHE_SIZE", 0)
+        if maxsize <= 0:
+            return None
+        return cls(maxsize=maxsize, ttl=app.config.get("OWNERSHIP_CACHE_TTL", 60))
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def get(self, key, now=None):
+        """Return the cached Ownership for key, or None if absent or expired."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            ownership, expires_at = entry
+            if now >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return ownership
+
+    def put(self, key, ownership, generation, now=None):
+        """Cache ownership unless an invalidation ran since `generation`."""
+        now = time.time() if now is None else now
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (ownership, now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, row_ids):
+        """Drop the rows with these ids and everything cached beneath them."""
+        row_ids = set(row_ids)
+        if not row_ids:
+            return
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key, (ownership, _) in self._entries.items()
+                if key[1] in row_ids or not row_ids.isdisjoint(ownership.ancestors)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return hit/miss/eviction/invalidation counters and current size."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def _lookup(kind, row_id):
+    """Resolve one row with a single primary-key join up to its project."""
+    links = CHAIN[KINDS.index(kind) :]
+    columns = [parent_id for _, _, parent_id in links[:-1]] + [Project.user_id]
+    query = select(*columns).select_from(links[0][1])
+    for (_, _, parent_id), (_, parent, _) in zip(links, links[1:]):
+        query = query.join(parent, parent.id == parent_id)
+    row = db.session.execute(query.where(links[0][1].id == row_id)).first()
+    if row is None:
+        return None
+    ancestors = tuple(row[:-1])
+    return Ownership(row[-1], ancestors[-1] if ancestors else row_id, ancestors)
+
+
+def resolve(kind, row_id):
+    """Return the Ownership of a project/chapter/scene/draft/annotation, or None."""
+    if not row_id:
+        return None
+    cache = current_app.extensions.get("ownership_cache")
+    if cache is None:
+        return _lookup(kind, row_id)
+    key = (kind, row_id)
+    ownership = cache.get(key)
+    if ownership is None:
+        generation = cache.generation
+        ownership = _lookup(kind, row_id)
+        # Reason: Unknown ids are not cached; they may be created any moment
+        if ownership is not None:
+            cache.put(key, ownership, generation)
+    return ownership
+
+
+def owns(kind, row_id, user_id) -> bool:
+    """True if the row exists and belongs to user_id."""
+    ownership = resolve(kind, row_id)
+    return ownership is not None and ownership.user_id == user_id
+
+
+def owns_all(kind, row_ids, user_id) -> bool:
+    """
+    True if every row exists and belongs to user_id. Cached rows are checked
+    in memory and the rest with one query, so a batch costs at most one query.
+    """
+    cache = current_app.extensions.get("ownership_cache")
+    pending = set()
+    for row_id in set(row_ids):
+        ownership = cache.get((kind, row_id)) if cache is not None else None
+        if ownership is None:
+            pending.add(row_id)
+        elif ownership.user_id != user_id:
+            return False
+    if not pending:
+        return True
+    model = CHAIN[KINDS.index(kind)][1]
+    found = db.session.execute(
+        select(model.id).where(model.id.in_(pending), owned_by(kind, user_id))
+    ).scalars()
+    return set(found) == pending
+
+
+def owned_by(kind, user_id):
+    """
+    Filter criterion for the rows of kind that belong to user_id, for lists
+    not narrowed to one parent: their parent id must be among the user's.
+    """
+    links = CHAIN[KINDS.index(kind) :]
+    if len(links) == 1:
+        return Project.user_id == user_id
+    parent_id, parents = links[0][2], links[1:]
+    query = select(parents[0][1].id)
+    for (_, _, grandparent_id), (_, grandparent, _) in zip(parents, parents[1:]):
+        query = query.join(grandparent, grandparent.id == grandparent_id)
+    return parent_id.in_(query.where(Project.user_id == user_id))
+
+
+def invalidate_on_commit(row_ids):
+    """Drop these rows' cached ownership once the current transaction commits."""
+    db.session.info.setdefault(_PENDING_KEY, set()).update(row_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session):
+    row_ids = session.info.pop(_PENDING_KEY, None)
+    if row_ids and has_app_context():
+        cache = current_app.extensions.get("ownership_cache")
+        if cache is not None:
+            cache.invalidate(row_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def init_ownership_cache(app):
+    """Attach an OwnershipCache to app.extensions when enabled in config."""
+    cache = OwnershipCache.from_app(app)
+    if cache is not None:
+        app.extensions["ownership_cache"] = cache
+    return cache
@@ -0,0 +1,133 @@
+"""
+Keyset pagination and streamed JSON helpers for list endpoints.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from flask import Response, jsonify, stream_with_context
+from sqlalchemy import and_, or_
+
+from backend.app.utils.serializer import FieldsError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_CHUNK_SIZE = 500
+
+
+class PaginationError(ValueError):
+    """Raised when limit or cursor query parameters are invalid."""
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Decode an opaque cursor back into a (created_at, id) tuple."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (ValueError, TypeError) as exc:
+        raise PaginationError("Invalid cursor") from exc
+
+
+def parse_limit(value) -> int:
+    """Parse the limit query parameter, applying the default and maximum."""
+    if value is None or value == "":
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(value)
+    except (TypeError, ValueError) as exc:
+        raise PaginationError("limit must be an integer") from exc
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise PaginationError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+
+def keyset_page(query, model, limit: int, cursor=None):
+    """
+    Return one page of rows ordered by (created_at, id) after the cursor.
+
+    Fetches limit + 1 rows to know whether a next page exists, so no
+    COUNT query is needed. Returns (rows, next_cursor or None).
+    """
+    query = query.order_by(model.created_at, model.id)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                model.created_at > created_at,
+                and_(model.created_at == created_at, model.id > row_id),
+            )
+        )
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return rows, next_cursor
+
+
+def stream_json_array(query, model, encoder, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Stream every row of a query as a JSON array response.
+
+    Rows are fetched through a server-side cursor (yield_per) and dumped one
+    chunk at a time, so worker memory stays flat regardless of table size.
+    """
+    query = query.order_by(model.created_at, model.id).yield_per(chunk_size)
+
+    def generate():
+        yield b"["
+        first = True
+        buffer = []
+        for row in query:
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                # Reason: Encode the chunk as one array and drop its brackets
+                yield (b"" if first else b",") + encoder.dumps_many(buffer)[1:-1]
+                first = False
+                buffer = []
+        if buffer:
+            yield (b"" if first else b",") + encoder.dumps_many(buffer)[1:-1]
+        yield b"]"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+def wants_stream(args) -> bool:
+    """Return True when the request asks for the streamed response mode."""
+    return str(args.get("stream", "")).lower() in ("1", "true", "yes")
+
+
+def paginated_response(query, model, encoder, args):
+    """
+    Build the list response for a keyset-paginated endpoint.
+
+    Returns a streamed JSON array when ?stream=true, otherwise one page as a
+    JSON array with the next page's cursor in the X-Next-Cursor header.
+    ?fields= limits each row to the named fields and leaves large columns
+    outside that set unloaded.
+    """
+    try:
+        encoder = encoder.select(args.get("fields"))
+    except FieldsError as exc:
+        return jsonify({"error": str(exc)}), 400
+    query = query.options(*encoder.load_options(model))
+    if wants_stream(args):
+        return stream_json_array(query, model, encoder), 200
+    try:
+        limit = parse_limit(args.get("limit"))
+        rows, next_cursor = keyset_page(query, model, limit, args.get("cursor"))
+    except PaginationError as exc:
+        return jsonify({"error": str(exc)}), 400
+    response = encoder.response_many(rows)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response, 200
@@ -0,0 +1,58 @@
+"""
+Lexicographic rank keys for ordering siblings (chapters, scenes).
+
+A rank is a string over 0-9a-z; siblings sort by plain string comparison.
+A new rank can always be generated strictly between two neighbours, so
+moving or inserting one row never requires renumbering the others. Ranks
+never end in "0", which guarantees there is room between any two of them.
+"""
+
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(ALPHABET)
+POSITION_WIDTH = 6
+# Reason: Centre the integer range so negative legacy orders still sort first
+POSITION_OFFSET = BASE**POSITION_WIDTH // 2
+MID_DIGIT = ALPHABET[BASE // 2]
+
+
+def encode_position(position: int) -> str:
+    """Map an integer position to a rank that sorts like the integer."""
+    value = position + POSITION_OFFSET
+    if not 0 <= value < BASE**POSITION_WIDTH:
+        raise ValueError(f"Position out of range: {position}")
+    digits = []
+    for _ in range(POSITION_WIDTH):
+        value, digit = divmod(value, BASE)
+        digits.append(ALPHABET[digit])
+    return "".join(reversed(digits)) + MID_DIGIT
+
+
+def rank_between(lower=None, upper=None) -> str:
+    """
+    Return a rank strictly between lower and upper.
+
+    Either bound may be None (open-ended). Raises ValueError if lower is not
+    strictly less than upper.
+    """
+    lower = lower or ""
+    if upper is not None and lower >= upper:
+        raise ValueError(f"Invalid rank bounds: {lower!r} >= {upper!r}")
+    result = []
+    i = 0
+    while True:
+        low = ALPHABET.index(lower[i]) if i < len(lower) else 0
+        high = (
+            ALPHABET.index(upper[i]) if upper is not None and i < len(upper) else BASE
+        )
+        if low == high:
+            result.append(ALPHABET[low])
+            i += 1
+            continue
+        mid = (low + high) // 2
+        if mid > low:
+            result.append(ALPHABET[mid])
+            return "".join(result)
+        # Reason: Adjacent digits; keep low and search above lower's remainder
+        result.append(ALPHABET[low])
+        upper = None
+        i += 1
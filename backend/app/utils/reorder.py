@@ -0,0 +1,53 @@
+"""
+Shared handler for the bulk chapter and scene reorder endpoints.
+"""
+
+from flask import current_app, jsonify
+
+from backend.app import db
+from backend.app.services.ordering_service import OrderingService, ReorderError
+from backend.app.utils.ownership import owns_all
+from backend.models.chapter import Chapter
+from backend.models.scene import Scene
+
+KINDS = {Chapter: "chapter", Scene: "scene"}
+
+
+def reorder_response(model, schema, data, user_id):
+    """
+    Validate a {"moves": [...]} body, apply it in one UPDATE and commit.
+
+    Every moved row, anchor and target chapter must belong to user_id;
+    otherwise nothing is written and the response is 404. Parents whose
+    ranks grew past RANK_REBALANCE_LENGTH are handed to the background
+    rebalancer after the commit.
+    """
+    errors = schema.validate(data or {})
+    if errors:
+        return jsonify({"error": "Validation error", "details": errors}), 400
+    kind = KINDS[model]
+    rows = {
+        row_id
+        for move in data["moves"]
+        for row_id in (move["id"], move.get("after"), move.get("before"))
+        if row_id
+    }
+    chapters = {move["chapter_id"] for move in data["moves"] if move.get("chapter_id")}
+    if not owns_all(kind, rows, user_id) or not owns_all("chapter", chapters, user_id):
+        return jsonify({"error": f"{kind.capitalize()} not found"}), 404
+    try:
+        items, long_parents = OrderingService.apply_moves(
+            model,
+            data["moves"],
+            rebalance_length=current_app.config.get("RANK_REBALANCE_LENGTH", 32),
+        )
+    except ReorderError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    db.session.commit()
+    rebalancer = current_app.extensions.get("rank_rebalancer")
+    if rebalancer is not None:
+        # Reason: Renumber overly long ranks off the request path
+        for parent_id in long_parents:
+            rebalancer.schedule(model, parent_id)
+    return jsonify({"items": items, "rebalancing": sorted(long_parents)}), 200
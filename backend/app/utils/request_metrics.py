@@ -0,0 +1,296 @@
+"""
+Per-endpoint request metrics rendered in the Prometheus text format.
+
+Request hooks record latency, status, request and response sizes, and the
+SQL statements each request ran (counted through engine events), into
+fixed-bucket histograms kept in memory. Recording a request takes one lock
+acquisition and a few additions, and a statement two perf_counter() calls,
+so the hooks can stay on in production.
+"""
+
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import partial
+from threading import Lock
+
+from flask import request
+from sqlalchemy import event
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Reason: The request being served on this thread; None outside requests, so
+# background workers' queries are never attributed to a request
+_current = ContextVar("request_metrics", default=None)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _number(value) -> str:
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set; callers hold the lock."""
+
+    def __init__(self, name, documentation, labelnames, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, labels, value):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self, lines):
+        lines.append(f"# HELP {self.name} {self.documentation}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for labels, series in sorted(self.series.items()):
+            base = _labels(self.labelnames, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{base}}} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{{{base}}} {cumulative}")
+
+
+class Counter:
+    """Monotonic counter per label set; callers hold the lock."""
+
+    def __init__(self, name, documentation, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.series = {}
+
+    def inc(self, labels, value=1):
+        self.series[labels] = self.series.get(labels, 0) + value
+
+    def render(self, lines):
+        lines.append(f"# HELP {self.name} {self.documentation}")
+        lines.append(f"# TYPE {self.name} counter")
+        for labels, value in sorted(self.series.items()):
+            lines.append(
+                f"{self.name}{{{_labels(self.labelnames, labels)}}} {_number(value)}"
+            )
+
+
+class _Request:
+    """What one request has used so far."""
+
+    __slots__ = (
+        "started",
+        "statements",
+        "sql_seconds",
+        "labels",
+        "status",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.sql_seconds = 0.0
+        self.response_bytes = 0
+
+
+class RequestMetrics:
+    """
+    In-process registry of per-endpoint request metrics.
+
+    Endpoints are Flask endpoint names (e.g. "scenes.get_scene"), so label
+    cardinality is bounded by the routes, not by URLs. Each gunicorn worker
+    keeps its own registry.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        endpoint = ("endpoint", "method")
+        self.requests = Counter(
+            "http_requests_total",
+            "Requests by endpoint, method and status code.",
+            ("endpoint", "method", "status"),
+        )
+        self.latency = Histogram(
+            "http_request_duration_seconds",
+            "Request latency in seconds, until the last byte of streamed bodies.",
+            endpoint,
+            LATENCY_BUCKETS,
+        )
+        self.request_size = Histogram(
+            "http_request_size_bytes",
+            "Request body size in bytes.",
+            endpoint,
+            SIZE_BUCKETS,
+        )
+        self.response_size = Histogram(
+            "http_response_size_bytes",
+            "Response body size in bytes.",
+            endpoint,
+            SIZE_BUCKETS,
+        )
+        self.statements = Histogram(
+            "db_statements_per_request",
+            "SQL statements executed per request.",
+            endpoint,
+            STATEMENT_BUCKETS,
+        )
+        self.sql_time = Histogram(
+            "db_statement_seconds_per_request",
+            "Time spent executing SQL per request, in seconds.",
+            endpoint,
+            LATENCY_BUCKETS,
+        )
+
+    def before_request(self):
+        _current.set(_Request())
+
+    def after_request(self, response):
+        current = _current.get()
+        if current is None:
+            return response
+        req = request._get_current_object()
+        current.labels = (req.endpoint or "unmatched", req.method)
+        current.request_bytes = req.content_length or 0
+        current.status = response.status_code
+        length = response.content_length
+        if length is not None or not response.is_streamed:
+            current.response_bytes = length or 0
+            self.finish(current)
+        else:
+            if not response.direct_passthrough:
+                # Reason: Streamed bodies are timed and sized until the server closes them
+                response.response = self._count_bytes(response.response, current)
+            response.call_on_close(partial(self.finish, current))
+        return response
+
+    def finish(self, current):
+        _current.set(None)
+        self.record(current)
+
+    @staticmethod
+    def _count_bytes(body, current):
+        for chunk in body:
+            current.response_bytes += len(chunk)
+            yield chunk
+
+    def record(self, current):
+        duration = time.perf_counter() - current.started
+        labels = current.labels
+        with self._lock:
+            self.requests.inc(labels + (str(current.status),))
+            self.latency.observe(labels, duration)
+            self.request_size.observe(labels, current.request_bytes)
+            self.response_size.observe(labels, current.response_bytes)
+            self.statements.observe(labels, current.statements)
+            self.sql_time.observe(labels, current.sql_seconds)
+
+    def listen(self, engine):
+        """
+        Count the statements and SQL time of the current request on `engine`.
+
+        Uses the dialect's do_execute* events, which run the cursor call
+        themselves: unlike before/after_cursor_execute they live on the
+        dialect, so connections skip building per-connection event dispatch.
+        """
+        dialect = engine.dialect
+
+        def timed(execute):
+            def listener(cursor, statement, *args):
+                current = _current.get()
+                if current is None:
+                    return False
+                started = time.perf_counter()
+                try:
+                    execute(cursor, statement, *args)
+                finally:
+                    current.statements += 1
+                    current.sql_seconds += time.perf_counter() - started
+                return True
+
+            return listener
+
+        event.listen(engine, "do_execute", timed(dialect.do_execute))
+        event.listen(engine, "do_executemany", timed(dialect.do_executemany))
+        event.listen(
+            engine, "do_execute_no_params", timed(dialect.do_execute_no_params)
+        )
+
+    def render(self, extra=()) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for metric in (
+                self.requests,
+                self.latency,
+                self.request_size,
+                self.response_size,
+                self.statements,
+                self.sql_time,
+            ):
+                metric.render(lines)
+        for name, kind, documentation, value in extra:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def pool_metrics(stats, pool) -> list:
+    """(name, type, help, value) rows for the db pool figures of this worker."""
+    snapshot = stats.snapshot(pool)
+    rows = [
+        ("db_pool_size", "gauge", "Persistent connections in the pool.", "size"),
+        (
+            "db_pool_checked_out",
+            "gauge",
+            "Connections currently in use.",
+            "checked_out",
+        ),
+        ("db_pool_overflow", "gauge", "Connections open beyond the size.", "overflow"),
+        ("db_pool_checkouts_total", "counter", "Connection checkouts.", "checkouts"),
+        ("db_pool_timeouts_total", "counter", "Checkouts that timed out.", "timeouts"),
+        (
+            "db_pool_wait_seconds_total",
+            "counter",
+            "Time spent waiting for connections.",
+            "wait_seconds_total",
+        ),
+    ]
+    return [
+        (name, kind, documentation, snapshot[key])
+        for name, kind, documentation, key in rows
+        if snapshot[key] is not None
+    ]
+
+
+def init_request_metrics(app, engine):
+    """
+    Register the request hooks and attach SQL counting to `engine` when
+    METRICS_ENABLED is set; the registry is app.extensions["request_metrics"].
+    """
+    if not app.config.get("METRICS_ENABLED", True):
+        return None
+    metrics = RequestMetrics()
+    metrics.listen(engine)
+    app.before_request(metrics.before_request)
+    app.after_request(metrics.after_request)
+    app.extensions["request_metrics"] = metrics
+    return metrics
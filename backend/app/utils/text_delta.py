@@ -0,0 +1,147 @@
+"""
+Compact text deltas for storing and applying edits between two strings.
+
+A delta is a JSON-serialisable list of operations applied left to right:
+    int > 0  retain that many characters
+    int < 0  delete that many characters
+    str      insert the string
+Any text left after the last operation is retained implicitly.
+
+Clients send the same operations as objects ({"retain": n}, {"delete": n},
+{"insert": "text"}); from_operations() converts them.
+"""
+
+import json
+from difflib import SequenceMatcher
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Length of the common prefix of a and b (binary search on slices)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of a and b, at most limit characters."""
+    lo, hi = 0, min(len(a), len(b), limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _push(ops: list, op) -> None:
+    """Append op, merging it with the previous operation of the same kind."""
+    if ops:
+        last = ops[-1]
+        if isinstance(op, str) and isinstance(last, str):
+            ops[-1] = last + op
+            return
+        if not isinstance(op, str) and not isinstance(last, str):
+            if (op > 0) == (last > 0):
+                ops[-1] = last + op
+                return
+    ops.append(op)
+
+
+def diff(old: str, new: str) -> list:
+    """
+    Return the operations that turn old into new.
+
+    Trims the common prefix and suffix first (the usual shape of an editor
+    autosave), then diffs the changed middle paragraph by paragraph.
+    """
+    old = old or ""
+    new = new or ""
+    prefix = _common_prefix_len(old, new)
+    suffix = _common_suffix_len(old, new, min(len(old), len(new)) - prefix)
+    old_mid = old[prefix : len(old) - suffix]
+    new_mid = new[prefix : len(new) - suffix]
+    ops = []
+    if prefix:
+        _push(ops, prefix)
+    if old_mid and new_mid:
+        old_tokens = old_mid.splitlines(keepends=True)
+        new_tokens = new_mid.splitlines(keepends=True)
+        matcher = SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            removed = sum(len(token) for token in old_tokens[i1:i2])
+            if tag == "equal":
+                _push(ops, removed)
+                continue
+            if removed:
+                _push(ops, -removed)
+            if j2 > j1:
+                _push(ops, "".join(new_tokens[j1:j2]))
+    elif old_mid:
+        _push(ops, -len(old_mid))
+    elif new_mid:
+        _push(ops, new_mid)
+    # Reason: Trailing retains are implicit, drop them to keep deltas compact
+    while ops and not isinstance(ops[-1], str) and ops[-1] > 0:
+        ops.pop()
+    return ops
+
+
+def apply(text: str, ops: list) -> str:
+    """Apply operations to text. Raises ValueError if they do not fit."""
+    text = text or ""
+    out = []
+    pos = 0
+    for op in ops:
+        if isinstance(op, str):
+            out.append(op)
+        elif isinstance(op, int) and not isinstance(op, bool) and op != 0:
+            end = pos + abs(op)
+            if end > len(text):
+                raise ValueError("Delta operation runs past the end of the text")
+            if op > 0:
+                out.append(text[pos:end])
+            pos = end
+        else:
+            raise ValueError(f"Invalid delta operation: {op!r}")
+    out.append(text[pos:])
+    return "".join(out)
+
+
+def from_operations(operations: list) -> list:
+    """
+    Convert [{"retain": n} | {"delete": n} | {"insert": s}, ...] into ops.
+    Raises ValueError for anything else.
+    """
+    ops = []
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict) or len(operation) != 1:
+            raise ValueError(f"Operation {index} must have exactly one key")
+        ((kind, value),) = operation.items()
+        if kind == "insert" and isinstance(value, str) and value:
+            _push(ops, value)
+        elif (
+            kind in ("retain", "delete")
+            and isinstance(value, int)
+            and not isinstance(value, bool)
+            and value > 0
+        ):
+            _push(ops, value if kind == "retain" else -value)
+        else:
+            raise ValueError(f"Invalid operation {index}: {operation!r}")
+    return ops
+
+
+def dumps(ops: list) -> str:
+    """Serialise operations to compact JSON."""
+    return json.dumps(ops, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(raw: str) -> list:
+    """Deserialise operations from JSON."""
+    return json.loads(raw)
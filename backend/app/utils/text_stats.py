@@ -0,0 +1,54 @@
+"""
+Writing statistics for scene text: words, characters, paragraphs and
+dialogue lines.
+
+Definitions match the rest of the backend:
+    words       whitespace-separated tokens (as counted by the importer)
+    characters  len() of the text, whitespace included
+    paragraphs  non-blank lines (each becomes one paragraph on export)
+    dialogue    paragraphs opening with a quotation mark or dialogue dash
+"""
+
+STAT_FIELDS = ("word_count", "char_count", "paragraph_count", "dialogue_count")
+DIALOGUE_OPENERS = ('"', "“", "„", "«", "'", "‘", "‹", "—", "–", "―")
+EMPTY = dict.fromkeys(STAT_FIELDS, 0)
+
+
+def compute(text) -> dict:
+    """Return {field: count} for text (None counts as empty)."""
+    if not text:
+        return dict(EMPTY)
+    paragraphs = dialogue = 0
+    for line in text.splitlines():
+        line = line.lstrip()
+        if line:
+            paragraphs += 1
+            if line.startswith(DIALOGUE_OPENERS):
+                dialogue += 1
+    return {
+        "word_count": len(text.split()),
+        "char_count": len(text),
+        "paragraph_count": paragraphs,
+        "dialogue_count": dialogue,
+    }
+
+
+def of(row) -> dict:
+    """Read the stored statistics off a scene, chapter or project row."""
+    return {field: getattr(row, field) or 0 for field in STAT_FIELDS}
+
+
+def difference(new, old) -> dict:
+    """new - old per field, keeping only the fields that changed."""
+    return {
+        field: new[field] - old[field]
+        for field in STAT_FIELDS
+        if new[field] != old[field]
+    }
+
+
+def add(total, delta) -> dict:
+    """Accumulate delta into total in place and return it."""
+    for field, value in delta.items():
+        total[field] = total.get(field, 0) + value
+    return total
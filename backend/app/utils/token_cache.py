@@ -0,0 +1,97 @@
+"""
+Bounded in-process cache of verified JWT payloads.
+
+Verifying an HS256 signature and parsing the claims is repeated on every
+authenticated request; clients reuse the same token for its whole lifetime,
+so the verified payload is cached keyed by the raw token string.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    """
+    LRU cache of verified token payloads with a TTL capped by the token's exp.
+
+    An entry never outlives the token it was built from: it expires at
+    min(cached_at + ttl, exp), so an expired token is always re-verified
+    (and rejected) by the decoder.
+    """
+
+    def __init__(self, maxsize=4096, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_app(cls, app):
+        """Build a cache from app config, or None when disabled."""
+        maxsize = app.config.get("AUTH_TOKEN_CACHE_SIZE", 0)
+        if maxsize <= 0:
+            return None
+        return cls(maxsize=maxsize, ttl=app.config.get("AUTH_TOKEN_CACHE_TTL", 300))
+
+    def get(self, token, now=None):
+        """Return the cached payload for token, or None if absent or expired."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            payload, expires_at = entry
+            if now >= expires_at:
+                del self._entries[token]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return payload
+
+    def put(self, token, payload, now=None):
+        """Cache a verified payload until min(now + ttl, exp)."""
+        now = time.time() if now is None else now
+        expires_at = now + self.ttl
+        exp = payload.get("exp")
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._entries[token] = (payload, expires_at)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every cached payload (e.g. after rotating SECRET_KEY)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return hit/miss/eviction counters and current size."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def init_token_cache(app):
+    """Attach a TokenCache to app.extensions when enabled in config."""
+    cache = TokenCache.from_app(app)
+    if cache is not None:
+        app.extensions["token_cache"] = cache
+    return cache
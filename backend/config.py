@@ -11,5 +11,80 @@ class Config:
         "DATABASE_URL", "postgresql://writer_user:writer_pass@db:5432/writer_db"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Reason: Pool settings are turned into SQLALCHEMY_ENGINE_OPTIONS at startup;
+    # the "pgbouncer" profile suits a transaction-mode PgBouncer in front of PostgreSQL
+    DB_POOL_PROFILE = os.environ.get("DB_POOL_PROFILE", "default")
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+    # Reason: Seconds before a pooled connection is replaced (-1 = never)
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+    # Reason: PostgreSQL statement_timeout in milliseconds (0 = no limit)
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", "0"))
     CORS_HEADERS = "Content-Type"
+    # Reason: Verified JWT payloads are cached per token (0 disables the cache)
+    AUTH_TOKEN_CACHE_SIZE = int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", "4096"))
+    AUTH_TOKEN_CACHE_TTL = int(os.environ.get("AUTH_TOKEN_CACHE_TTL", "300"))
+    # Reason: Row -> owner lookups for access checks are cached (0 disables the cache)
+    OWNERSHIP_CACHE_SIZE = int(os.environ.get("OWNERSHIP_CACHE_SIZE", "10000"))
+    OWNERSHIP_CACHE_TTL = int(os.environ.get("OWNERSHIP_CACHE_TTL", "60"))
+    # Reason: Password hashing runs on a bounded pool; algorithm is scrypt or pbkdf2
+    PASSWORD_HASH_ALGORITHM = os.environ.get("PASSWORD_HASH_ALGORITHM", "scrypt")
+    # Reason: scrypt N or pbkdf2 iterations; unset uses the algorithm default
+    PASSWORD_HASH_COST = (
+        int(os.environ["PASSWORD_HASH_COST"])
+        if os.environ.get("PASSWORD_HASH_COST")
+        else None
+    )
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_QUEUE = int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", "32"))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get("PASSWORD_HASH_TIMEOUT", "10"))
+    # Reason: Chapter/scene ranks longer than this are renumbered in the background
+    RANK_REBALANCE_LENGTH = int(os.environ.get("RANK_REBALANCE_LENGTH", "32"))
+    RANK_REBALANCE_ASYNC = (
+        os.environ.get("RANK_REBALANCE_ASYNC", "true").lower() == "true"
+    )
+    # Reason: Manuscript imports are inserted in batches within one transaction
+    IMPORT_BATCH_SIZE = int(os.environ.get("IMPORT_BATCH_SIZE", "500"))
+    IMPORT_MAX_BYTES = int(os.environ.get("IMPORT_MAX_BYTES", str(50 * 1024 * 1024)))
     DOCS_EXPORT_PATH = os.environ.get("DOCS_EXPORT_PATH", "/app/exports")
+    # Reason: Autosave history keeps a full keyframe every N versions, deltas between
+    AUTOSAVE_KEYFRAME_INTERVAL = int(os.environ.get("AUTOSAVE_KEYFRAME_INTERVAL", "20"))
+    # Reason: Optional in-memory buffer that coalesces autosaves into batched inserts
+    AUTOSAVE_BUFFER_ENABLED = (
+        os.environ.get("AUTOSAVE_BUFFER_ENABLED", "false").lower() == "true"
+    )
+    AUTOSAVE_BUFFER_FLUSH_INTERVAL = float(
+        os.environ.get("AUTOSAVE_BUFFER_FLUSH_INTERVAL", "2.0")
+    )
+    AUTOSAVE_BUFFER_MAX_PENDING = int(
+        os.environ.get("AUTOSAVE_BUFFER_MAX_PENDING", "500")
+    )
+    AUTOSAVE_BUFFER_CAPACITY = int(os.environ.get("AUTOSAVE_BUFFER_CAPACITY", "0"))
+    AUTOSAVE_BUFFER_FLUSH_ON_SHUTDOWN = (
+        os.environ.get("AUTOSAVE_BUFFER_FLUSH_ON_SHUTDOWN", "true").lower() == "true"
+    )
+    # Reason: Upper bound on the snapshots accepted by one POST /autosave/batch
+    AUTOSAVE_BATCH_MAX_FRAMES = int(os.environ.get("AUTOSAVE_BATCH_MAX_FRAMES", "100"))
+    # Reason: Old autosave history is thinned to "max age:keep one per" tiers
+    AUTOSAVE_RETENTION = os.environ.get("AUTOSAVE_RETENTION", "1h:0,1d:10m,*:1d")
+    # Reason: Seconds between in-process compaction runs (0 = CLI only)
+    AUTOSAVE_COMPACTION_INTERVAL = float(
+        os.environ.get("AUTOSAVE_COMPACTION_INTERVAL", "0")
+    )
+    AUTOSAVE_COMPACTION_BATCH_SIZE = int(
+        os.environ.get("AUTOSAVE_COMPACTION_BATCH_SIZE", "200")
+    )
+    # Reason: Per-endpoint latency, status, size and SQL metrics on GET /metrics
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+    # Reason: Rendered exports are cached on disk, keyed by a content fingerprint
+    EXPORT_CACHE_ENABLED = (
+        os.environ.get("EXPORT_CACHE_ENABLED", "true").lower() == "true"
+    )
+    EXPORT_CACHE_MAX_BYTES = int(
+        os.environ.get("EXPORT_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+    )
+    EXPORT_CACHE_MAX_AGE = int(
+        os.environ.get("EXPORT_CACHE_MAX_AGE", str(7 * 24 * 3600))
+    )
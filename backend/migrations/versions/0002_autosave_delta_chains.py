@@ -0,0 +1,61 @@
+"""autosave delta chains
+
+Existing rows hold full text, so they become keyframes (chain_index 0) as-is.
+Run `flask autosave reencode` afterwards to fold old history into deltas.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 14:15:04.648724
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("autosave_versions", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("delta", sa.Text(), nullable=True))
+        batch_op.add_column(
+            sa.Column("keyframe_id", sa.String(length=36), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("chain_index", sa.Integer(), server_default="0", nullable=False)
+        )
+        batch_op.create_unique_constraint(
+            "uq_autosave_versions_keyframe_chain", ["keyframe_id", "chain_index"]
+        )
+        batch_op.create_foreign_key(
+            "fk_autosave_versions_keyframe_id",
+            "autosave_versions",
+            ["keyframe_id"],
+            ["id"],
+        )
+
+
+def downgrade():
+    # Reason: Delta rows have no full text and would be lost by the downgrade
+    remaining = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT COUNT(*) FROM autosave_versions WHERE delta IS NOT NULL")
+        )
+        .scalar()
+    )
+    if remaining:
+        raise RuntimeError(
+            f"{remaining} delta autosave versions remain; "
+            "run `flask autosave reencode --keyframes-only` first"
+        )
+    with op.batch_alter_table("autosave_versions", schema=None) as batch_op:
+        batch_op.drop_constraint("fk_autosave_versions_keyframe_id", type_="foreignkey")
+        batch_op.drop_constraint("uq_autosave_versions_keyframe_chain", type_="unique")
+        batch_op.drop_column("chain_index")
+        batch_op.drop_column("keyframe_id")
+        batch_op.drop_column("delta")
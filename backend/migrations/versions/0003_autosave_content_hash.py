@@ -0,0 +1,74 @@
+"""autosave content hash
+
+Adds a SHA-256 content hash and (target, saved_at) indexes for the autosave
+dedupe lookup, and backfills the hash of existing keyframes in batches.
+Delta rows written before this revision get their hash from
+`flask autosave reencode`; until then they simply never match a dedupe.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 14:23:09.411956
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+
+def upgrade():
+    with op.batch_alter_table("autosave_versions", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("content_hash", sa.String(length=64), nullable=True)
+        )
+        batch_op.create_index(
+            "ix_autosave_versions_draft_saved_at",
+            ["draft_id", "saved_at"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_autosave_versions_scene_saved_at",
+            ["scene_id", "saved_at"],
+            unique=False,
+        )
+
+    bind = op.get_bind()
+    select_batch = sa.text(
+        "SELECT id, content FROM autosave_versions "
+        "WHERE content_hash IS NULL AND delta IS NULL LIMIT :limit"
+    )
+    update_hash = sa.text(
+        "UPDATE autosave_versions SET content_hash = :content_hash WHERE id = :id"
+    )
+    while True:
+        rows = bind.execute(select_batch, {"limit": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            update_hash,
+            [
+                {
+                    "id": row.id,
+                    "content_hash": hashlib.sha256(
+                        (row.content or "").encode("utf-8")
+                    ).hexdigest(),
+                }
+                for row in rows
+            ],
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("autosave_versions", schema=None) as batch_op:
+        batch_op.drop_index("ix_autosave_versions_scene_saved_at")
+        batch_op.drop_index("ix_autosave_versions_draft_saved_at")
+        batch_op.drop_column("content_hash")
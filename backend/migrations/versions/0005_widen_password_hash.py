@@ -0,0 +1,38 @@
+"""widen password hash
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 15:02:44.118203
+
+scrypt hashes ("scrypt:32768:8:1$<salt>$<128 hex>") are longer than the
+original 128 characters; widen the column so any configured cost fits.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.alter_column(
+            "password_hash",
+            existing_type=sa.String(length=128),
+            type_=sa.String(length=255),
+            existing_nullable=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.alter_column(
+            "password_hash",
+            existing_type=sa.String(length=255),
+            type_=sa.String(length=128),
+            existing_nullable=False,
+        )
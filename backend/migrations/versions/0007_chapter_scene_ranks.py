@@ -0,0 +1,79 @@
+"""chapter scene ranks
+
+Adds a lexicographic `rank` to chapters and scenes and backfills it from
+the legacy integer `order` (same encoding as backend.app.utils.rank), so
+existing manuscripts keep their order. Lists now sort by rank, so the
+(parent, order) indexes are replaced by (parent, rank) ones.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 14:39:23.030241
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+POSITION_WIDTH = 6
+
+
+def encode_position(position):
+    value = position + len(ALPHABET) ** POSITION_WIDTH // 2
+    digits = []
+    for _ in range(POSITION_WIDTH):
+        value, digit = divmod(value, len(ALPHABET))
+        digits.append(ALPHABET[digit])
+    return "".join(reversed(digits)) + ALPHABET[len(ALPHABET) // 2]
+
+
+def backfill(table):
+    bind = op.get_bind()
+    select_batch = sa.text(
+        f'SELECT id, "order" FROM {table} WHERE rank IS NULL LIMIT :limit'
+    )
+    update_rank = sa.text(f"UPDATE {table} SET rank = :rank WHERE id = :id")
+    while True:
+        rows = bind.execute(select_batch, {"limit": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            update_rank,
+            [{"id": row.id, "rank": encode_position(row.order)} for row in rows],
+        )
+
+
+def upgrade():
+    for table, parent in (("chapters", "project"), ("scenes", "chapter")):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column("rank", sa.String(length=255), nullable=True))
+        backfill(table)
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                "rank", existing_type=sa.String(length=255), nullable=False
+            )
+            batch_op.drop_index(f"ix_{table}_{parent}_order")
+            batch_op.create_index(
+                f"ix_{table}_{parent}_rank",
+                [f"{parent}_id", "rank", "created_at", "id"],
+                unique=False,
+            )
+
+
+def downgrade():
+    for table, parent in (("scenes", "chapter"), ("chapters", "project")):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f"ix_{table}_{parent}_rank")
+            batch_op.create_index(
+                f"ix_{table}_{parent}_order",
+                [f"{parent}_id", "order", "created_at", "id"],
+                unique=False,
+            )
+            batch_op.drop_column("rank")
@@ -0,0 +1,92 @@
+"""full text search
+
+Adds full-text indexes over scenes (title, content), drafts (content) and
+annotations (highlight, context), maintained by the database on every
+write:
+
+- PostgreSQL: a stored generated `search_vector` tsvector column with a GIN
+  index.
+- SQLite: an external-content FTS5 table per source table, kept in sync by
+  triggers and filled from the existing rows here.
+
+Same DDL as backend.models.search_index, frozen for this revision.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 15:20:41.512907
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = {
+    "scenes": ("title", "content"),
+    "drafts": ("content",),
+    "annotations": ("highlight", "context"),
+}
+TOKENIZER = "porter unicode61 remove_diacritics 2"
+
+
+def document(columns):
+    return " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for table, columns in SEARCH_COLUMNS.items():
+        if dialect == "postgresql":
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector "
+                f"tsvector GENERATED ALWAYS AS (to_tsvector('english'::regconfig, "
+                f"{document(columns)})) STORED"
+            )
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_search "
+                f"ON {table} USING gin (search_vector)"
+            )
+        elif dialect == "sqlite":
+            fts = f"{table}_fts"
+            names = ", ".join(columns)
+            new = ", ".join(f"new.{column}" for column in columns)
+            old = ", ".join(f"old.{column}" for column in columns)
+            delete = (
+                f"INSERT INTO {fts}({fts}, rowid, {names}) "
+                f"VALUES ('delete', old.rowid, {old});"
+            )
+            insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+            op.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+                f"content='{table}', content_rowid='rowid', tokenize='{TOKENIZER}')"
+            )
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} "
+                f"BEGIN {insert} END"
+            )
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} "
+                f"BEGIN {delete} END"
+            )
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} "
+                f"ON {table} BEGIN {delete} {insert} END"
+            )
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    for table in SEARCH_COLUMNS:
+        if dialect == "postgresql":
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+        elif dialect == "sqlite":
+            fts = f"{table}_fts"
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {fts}")
@@ -16,3 +16,4 @@ from .draft import Draft
 from .annotation import Annotation
 from .autosave_version import AutosaveVersion
 from .export import Export
+from . import search_index
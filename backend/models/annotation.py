@@ -14,6 +14,11 @@ class Annotation(db.Model):
     """
 
     __tablename__ = "annotations"
+    # Reason: Keyset pages order by (created_at, id), optionally per draft
+    __table_args__ = (
+        db.Index("ix_annotations_draft_created_at", "draft_id", "created_at", "id"),
+        db.Index("ix_annotations_created_at", "created_at", "id"),
+    )
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     draft_id = db.Column(db.String(36), db.ForeignKey("drafts.id"), nullable=False)
     context = db.Column(Text)
@@ -2,7 +2,7 @@
 AutosaveVersion model for time-based snapshots of scene or draft content.
 """
 
-from sqlalchemy import DateTime, Text
+from sqlalchemy import DateTime, Integer, String, Text
 import uuid
 from datetime import datetime
 from backend.app import db
@@ -11,11 +11,37 @@ from backend.app import db
 class AutosaveVersion(db.Model):
     """
     AutosaveVersion model for time-based snapshots of scene or draft content.
+
+    Keyframes store the full text in `content`. Delta versions leave `content`
+    empty and store the edit from the previous version in `delta`, pointing at
+    the keyframe that starts their chain (see AutosaveService).
     """
 
     __tablename__ = "autosave_versions"
+    # Reason: Two writers extending the same chain position must not both win
+    __table_args__ = (
+        db.UniqueConstraint(
+            "keyframe_id", "chain_index", name="uq_autosave_versions_keyframe_chain"
+        ),
+        # Reason: Latest-version and dedupe lookups filter by target, newest first
+        db.Index("ix_autosave_versions_scene_saved_at", "scene_id", "saved_at"),
+        db.Index("ix_autosave_versions_draft_saved_at", "draft_id", "saved_at"),
+    )
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     scene_id = db.Column(db.String(36), db.ForeignKey("scenes.id"), nullable=True)
     draft_id = db.Column(db.String(36), db.ForeignKey("drafts.id"), nullable=True)
     content = db.Column(Text)
+    delta = db.Column(Text, nullable=True)
+    keyframe_id = db.Column(
+        db.String(36),
+        db.ForeignKey("autosave_versions.id", name="fk_autosave_versions_keyframe_id"),
+        nullable=True,
+    )
+    chain_index = db.Column(Integer, nullable=False, default=0, server_default="0")
+    # Reason: SHA-256 of the full content, so dedupe never reads the text itself
+    content_hash = db.Column(String(64), nullable=True)
     saved_at = db.Column(DateTime, default=datetime.utcnow)
+
+    @property
+    def is_keyframe(self) -> bool:
+        return self.delta is None
@@ -6,6 +6,11 @@ from sqlalchemy import String, Integer, DateTime
 import uuid
 from datetime import datetime
 from backend.app import db
+from backend.app.utils.rank import encode_position
+
+
+def _default_rank(context):
+    return encode_position(context.get_current_parameters()["order"])
 
 
 class Chapter(db.Model):
@@ -14,9 +19,21 @@ class Chapter(db.Model):
     """
 
     __tablename__ = "chapters"
+    # Reason: Lists and exports order by rank, the timeline by creation time
+    __table_args__ = (
+        db.Index("ix_chapters_project_rank", "project_id", "rank", "created_at", "id"),
+        db.Index("ix_chapters_project_created_at", "project_id", "created_at", "id"),
+    )
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     project_id = db.Column(db.String(36), db.ForeignKey("projects.id"), nullable=False)
     title = db.Column(String(200), nullable=False)
+    # Reason: Totals of the child scenes, kept current by delta updates
+    word_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    char_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    paragraph_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    dialogue_count = db.Column(Integer, nullable=False, default=0, server_default="0")
     order = db.Column(Integer, nullable=False)
+    # Reason: Siblings sort by rank; new ranks default to the legacy integer order
+    rank = db.Column(String(255), nullable=False, default=_default_rank)
     created_at = db.Column(DateTime, default=datetime.utcnow)
     updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -14,6 +14,11 @@ class Draft(db.Model):
     """
 
     __tablename__ = "drafts"
+    # Reason: Keyset pages order by (created_at, id), optionally per scene
+    __table_args__ = (
+        db.Index("ix_drafts_scene_created_at", "scene_id", "created_at", "id"),
+        db.Index("ix_drafts_created_at", "created_at", "id"),
+    )
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     scene_id = db.Column(db.String(36), db.ForeignKey("scenes.id"), nullable=False)
     content = db.Column(Text)
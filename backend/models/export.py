@@ -2,7 +2,7 @@
 Export model for history of user exports.
 """
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import Boolean, DateTime, String
 from datetime import datetime
 import uuid
 from backend.app import db
@@ -19,4 +19,6 @@ class Export(db.Model):
     project_id = db.Column(db.String(36), db.ForeignKey("projects.id"), nullable=False)
     export_type = db.Column(String(10), nullable=False)  # docx or pdf
     file_path = db.Column(String(300), nullable=False)
+    # Reason: Whether the file was served from the export cache
+    cache_hit = db.Column(Boolean, nullable=False, default=False, server_default="0")
     created_at = db.Column(DateTime, default=datetime.utcnow)
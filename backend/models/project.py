@@ -2,7 +2,7 @@
 Project model for books/scripts created by a user.
 """
 
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, Integer, DateTime
 import uuid
 from datetime import datetime
 from backend.app import db
@@ -14,9 +14,18 @@ class Project(db.Model):
     """
 
     __tablename__ = "projects"
+    # Reason: Project lists filter by owner
+    __table_args__ = (
+        db.Index("ix_projects_user_id_created_at", "user_id", "created_at"),
+    )
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey("users.id"), nullable=False)
     title = db.Column(String(200), nullable=False)
     description = db.Column(String(500))
+    # Reason: Totals of the child scenes, kept current by delta updates
+    word_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    char_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    paragraph_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    dialogue_count = db.Column(Integer, nullable=False, default=0, server_default="0")
     created_at = db.Column(DateTime, default=datetime.utcnow)
     updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
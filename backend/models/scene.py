@@ -6,6 +6,11 @@ from sqlalchemy import String, Integer, DateTime, Text
 import uuid
 from datetime import datetime
 from backend.app import db
+from backend.app.utils.rank import encode_position
+
+
+def _default_rank(context):
+    return encode_position(context.get_current_parameters()["order"])
 
 
 class Scene(db.Model):
@@ -14,10 +19,24 @@ class Scene(db.Model):
     """
 
     __tablename__ = "scenes"
+    # Reason: Lists and exports order by rank, the timeline by creation time
+    __table_args__ = (
+        db.Index("ix_scenes_chapter_rank", "chapter_id", "rank", "created_at", "id"),
+        db.Index("ix_scenes_chapter_created_at", "chapter_id", "created_at", "id"),
+    )
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     chapter_id = db.Column(db.String(36), db.ForeignKey("chapters.id"), nullable=False)
     title = db.Column(String(200), nullable=False)
     content = db.Column(Text)
+    # Reason: Bumped on every content change; PATCH edits name the base they apply to
+    version = db.Column(Integer, nullable=False, default=1, server_default="1")
+    # Reason: Statistics are stored so counts never require loading content
+    word_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    char_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    paragraph_count = db.Column(Integer, nullable=False, default=0, server_default="0")
+    dialogue_count = db.Column(Integer, nullable=False, default=0, server_default="0")
     order = db.Column(Integer, nullable=False)
+    # Reason: Siblings sort by rank; new ranks default to the legacy integer order
+    rank = db.Column(String(255), nullable=False, default=_default_rank)
     created_at = db.Column(DateTime, default=datetime.utcnow)
     updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
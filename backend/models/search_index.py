@@ -0,0 +1,129 @@
+"""
+Full-text search indexes for scenes, drafts and annotations.
+
+The database maintains the indexes on every write, whether it comes from
+the ORM, a bulk Core insert/update or raw SQL:
+    PostgreSQL  stored generated tsvector column `search_vector` + GIN index
+    SQLite      external-content FTS5 table kept in sync by triggers
+The DDL is attached to the model tables, so db.create_all() builds it too.
+The column and FTS tables are not mapped; migrations/env.py skips them.
+"""
+
+from sqlalchemy import DDL, event
+
+from backend.models.annotation import Annotation
+from backend.models.draft import Draft
+from backend.models.scene import Scene
+
+LANGUAGE = "english"
+FTS_TOKENIZER = "porter unicode61 remove_diacritics 2"
+
+# Reason: Column order is the FTS5 column order and bm25() weight order
+SEARCH_COLUMNS = {
+    "scenes": ("title", "content"),
+    "drafts": ("content",),
+    "annotations": ("highlight", "context"),
+}
+VECTOR_COLUMN = "search_vector"
+
+
+def fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def document_sql(columns, alias=None) -> str:
+    """SQL concatenating the searchable columns into one text value."""
+    prefix = f"{alias}." if alias else ""
+    return " || ' ' || ".join(f"coalesce({prefix}{column}, '')" for column in columns)
+
+
+def is_search_object(name: str) -> bool:
+    """True for the unmapped search column and FTS5 tables (incl. shadows)."""
+    return name == VECTOR_COLUMN or any(
+        name.startswith(fts_table(table)) for table in SEARCH_COLUMNS
+    )
+
+
+def postgresql_ddl(table: str) -> list:
+    columns = SEARCH_COLUMNS[table]
+    # Reason: A stored vector is ranked without re-parsing the text per hit
+    vector = f"to_tsvector('{LANGUAGE}'::regconfig, {document_sql(columns)})"
+    return [
+        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {VECTOR_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_search "
+        f"ON {table} USING gin ({VECTOR_COLUMN})",
+    ]
+
+
+def sqlite_ddl(table: str) -> list:
+    columns = SEARCH_COLUMNS[table]
+    fts = fts_table(table)
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old});"
+    )
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+        f"content='{table}', content_rowid='rowid', tokenize='{FTS_TOKENIZER}')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} "
+        f"BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} "
+        f"BEGIN {delete} END",
+        # Reason: Rank and timestamp updates leave the index alone
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {table} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+def sqlite_drop_ddl(table: str) -> list:
+    fts = fts_table(table)
+    return [
+        f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ("ai", "ad", "au")
+    ] + [f"DROP TABLE IF EXISTS {fts}"]
+
+
+def install(connection) -> None:
+    """Create any missing search index objects on an existing database."""
+    ddl = {"postgresql": postgresql_ddl, "sqlite": sqlite_ddl}.get(
+        connection.dialect.name
+    )
+    if ddl is None:
+        return
+    for table in SEARCH_COLUMNS:
+        for statement in ddl(table):
+            connection.exec_driver_sql(statement)
+
+
+def rebuild(connection) -> None:
+    """
+    Recreate the SQLite FTS tables from their source rows.
+
+    Needed after a batch migration copies a source table (which drops its
+    triggers and renumbers rowids). PostgreSQL indexes never go stale.
+    """
+    if connection.dialect.name != "sqlite":
+        install(connection)
+        return
+    for table in SEARCH_COLUMNS:
+        for statement in sqlite_drop_ddl(table):
+            connection.exec_driver_sql(statement)
+    install(connection)
+    for table in SEARCH_COLUMNS:
+        fts = fts_table(table)
+        connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+for model in (Scene, Draft, Annotation):
+    table = model.__table__
+    for statement in postgresql_ddl(table.name):
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for statement in sqlite_ddl(table.name):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in sqlite_drop_ddl(table.name):
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
@@ -16,6 +16,6 @@ class User(db.Model):
     __tablename__ = "users"
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     email = db.Column(String(120), unique=True, nullable=False)
-    password_hash = db.Column(String(128), nullable=False)
+    password_hash = db.Column(String(255), nullable=False)
     created_at = db.Column(DateTime, default=datetime.utcnow)
     updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
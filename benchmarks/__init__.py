@@ -0,0 +1,3 @@
+"""
+Benchmarks for the Writer & Screenwriter Tool backend.
+"""
@@ -0,0 +1,65 @@
+"""
+Microbenchmark of per-request authentication overhead.
+
+Measures AuthService token verification with and without the verified-token
+cache, then drives a protected route that does no database work so the
+remaining latency is dominated by the jwt_required decorator.
+
+Usage:
+    python -m benchmarks.bench_auth --iterations 20000 --requests 2000
+"""
+
+import argparse
+import sys
+import time
+
+from backend.app.services.auth_service import AuthService
+from benchmarks.common import auth_header, latency_summary, make_app, report, timed
+
+
+def run_verify(app, iterations):
+    """Return microseconds per verify_token call."""
+    token = auth_header(app)["Authorization"].split(" ")[1]
+    with app.app_context():
+        AuthService.verify_token(token)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            AuthService.verify_token(token)
+        elapsed = time.perf_counter() - started
+    return round(elapsed / iterations * 1e6, 3)
+
+
+def run_requests(app, requests):
+    """Return latency of a protected no-DB route (GET /autosave/buffer)."""
+    client = app.test_client()
+    headers = auth_header(app)
+    samples = []
+    for _ in range(requests):
+        with timed(samples):
+            resp = client.get("/autosave/buffer", headers=headers)
+        assert resp.status_code == 200
+    return latency_summary(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for label, size in (("uncached", 0), ("cached", 4096)):
+        app = make_app(AUTH_TOKEN_CACHE_SIZE=size)
+        results[label] = {
+            "verify_us": run_verify(app, args.iterations),
+            "request": run_requests(app, args.requests),
+        }
+    results["verify_speedup"] = round(
+        results["uncached"]["verify_us"] / results["cached"]["verify_us"], 1
+    )
+    report({"benchmark": "auth", "iterations": args.iterations, **results})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Benchmark of per-save cost: POST /autosave per snapshot vs POST /autosave/batch.
+
+Each mode saves --saves snapshots of a scene that grows by one sentence per
+save, with every --repeat-every-th snapshot unchanged (an idle editor's
+timer firing), and reports microseconds and SQL statements per save. The
+batch mode sends --batch-size snapshots per request. Fails if batching is
+not at least --min-speedup times cheaper per save.
+
+Usage:
+    python -m benchmarks.bench_autosave_batch --saves 500 --batch-size 10
+"""
+
+import argparse
+import sys
+import time
+
+from backend.app import db
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+from benchmarks.common import QueryCounter, auth_header, make_app, report
+
+BASE = "The rain kept falling on the harbour. " * 200
+
+
+def setup():
+    app = make_app(METRICS_ENABLED=False)
+    with app.app_context():
+        db.session.add(Project(id="p", user_id="bench-user", title="Book"))
+        db.session.add(Chapter(id="c", project_id="p", title="C", order=1))
+        for scene_id in ("posts", "batch"):
+            db.session.add(Scene(id=scene_id, chapter_id="c", title="S", order=1))
+        db.session.commit()
+    return app
+
+
+def snapshots(count, repeat_every):
+    content = BASE
+    for i in range(count):
+        if not repeat_every or i % repeat_every:
+            content += f"Sentence {i}. "
+        yield content
+
+
+def run_posts(app, headers, contents, batch_size):
+    client = app.test_client()
+    for content in contents:
+        resp = client.post(
+            "/autosave/",
+            json={"scene_id": "posts", "content": content},
+            headers=headers,
+        )
+        assert resp.status_code in (200, 201)
+
+
+def run_batches(app, headers, contents, batch_size):
+    client = app.test_client()
+    for start in range(0, len(contents), batch_size):
+        frames = [
+            {"scene_id": "batch", "content": content}
+            for content in contents[start : start + batch_size]
+        ]
+        resp = client.post("/autosave/batch", json={"frames": frames}, headers=headers)
+        assert resp.status_code == 200
+
+
+def measure(app, headers, run, contents, batch_size):
+    with app.app_context():
+        engine = db.engine
+    with QueryCounter(engine) as counter:
+        started = time.perf_counter()
+        run(app, headers, contents, batch_size)
+        elapsed = time.perf_counter() - started
+    return {
+        "us_per_save": round(elapsed / len(contents) * 1e6, 1),
+        "statements_per_save": round(len(counter.statements) / len(contents), 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--saves", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--repeat-every", type=int, default=4)
+    parser.add_argument("--min-speedup", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    app = setup()
+    headers = auth_header(app)
+    contents = list(snapshots(args.saves, args.repeat_every))
+    posts = measure(app, headers, run_posts, contents, args.batch_size)
+    batches = measure(app, headers, run_batches, contents, args.batch_size)
+    speedup = round(posts["us_per_save"] / batches["us_per_save"], 2)
+    report(
+        {
+            "benchmark": "autosave_batch",
+            "saves": args.saves,
+            "batch_size": args.batch_size,
+            "post": posts,
+            "batch": batches,
+            "speedup": speedup,
+        }
+    )
+    if speedup < args.min_speedup:
+        print(
+            f"FAIL: batching is only {speedup}x cheaper per save < {args.min_speedup}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark for the write-coalescing autosave buffer.
+
+Replays autosaves from many concurrent editors through the direct
+per-request write path and through AutosaveBuffer, and reports rows
+written, statements issued and throughput for each.
+
+Usage:
+    python -m benchmarks.bench_autosave_buffer --editors 500 --saves 10
+"""
+
+import argparse
+import sys
+import time
+
+from backend.app import db
+from backend.app.services.autosave_buffer import AutosaveBuffer
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.autosave_version import AutosaveVersion
+from benchmarks.common import QueryCounter, make_app, report
+
+
+def workload(editors, saves):
+    """Yield (scene_id, content) in the interleaved order editors would save."""
+    for save in range(saves):
+        for editor in range(editors):
+            yield f"scene-{editor}", f"Scene {editor} draft.\n" * 40 + f"rev {save}\n"
+
+
+def run_direct(args):
+    app = make_app(args.database_uri)
+    with app.app_context():
+        with QueryCounter(db.engine) as counter:
+            started = time.perf_counter()
+            for scene_id, content in workload(args.editors, args.saves):
+                latest = AutosaveService.latest(scene_id=scene_id)
+                AutosaveService.save_snapshot(
+                    content, scene_id=scene_id, previous=latest
+                )
+            elapsed = time.perf_counter() - started
+        rows = AutosaveVersion.query.count()
+    return {"rows": rows, "statements": counter.count, "seconds": elapsed}
+
+
+def run_buffered(args):
+    app = make_app(args.database_uri)
+    buffer = AutosaveBuffer(
+        app, flush_interval=3600, max_pending=args.editors, flush_on_shutdown=True
+    )
+    submitted = 0
+    with app.app_context():
+        with QueryCounter(db.engine) as counter:
+            started = time.perf_counter()
+            for scene_id, content in workload(args.editors, args.saves):
+                buffer.submit(content, scene_id=scene_id)
+                submitted += 1
+                # Reason: Stand in for the timer firing every flush_every saves
+                if submitted % args.flush_every == 0:
+                    buffer.flush()
+            buffer.close()
+            elapsed = time.perf_counter() - started
+        rows = AutosaveVersion.query.count()
+    return {
+        "rows": rows,
+        "statements": counter.count,
+        "seconds": elapsed,
+        "counters": buffer.stats(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--editors", type=int, default=500)
+    parser.add_argument("--saves", type=int, default=10)
+    parser.add_argument("--flush-every", type=int, default=1250)
+    args = parser.parse_args(argv)
+
+    total = args.editors * args.saves
+    direct = run_direct(args)
+    buffered = run_buffered(args)
+    for result in (direct, buffered):
+        result["saves_per_second"] = round(total / result["seconds"], 1)
+        result["seconds"] = round(result["seconds"], 3)
+    report(
+        {
+            "benchmark": "autosave_buffer",
+            "editors": args.editors,
+            "saves_per_editor": args.saves,
+            "direct": direct,
+            "buffered": buffered,
+        }
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
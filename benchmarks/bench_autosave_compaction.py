@@ -0,0 +1,158 @@
+"""
+Benchmark for autosave retention compaction.
+
+Seeds several scenes with a save every 30 seconds over `--days` of history
+(delta-encoded, as the API writes them), runs one compaction pass and
+reports rows and stored characters reclaimed, run time and the longest
+single transaction. Fails if a transaction exceeds --max-transaction-ms or
+a sample of surviving versions no longer rebuilds.
+
+Usage:
+    python -m benchmarks.bench_autosave_compaction --scenes 5 --days 2
+"""
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, func, insert
+
+from backend.app import db
+from backend.app.services.autosave_compactor import AutosaveCompactor
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.autosave_version import AutosaveVersion
+from benchmarks.bench_autosave_storage import simulate_edits
+from benchmarks.common import make_app, report
+
+SAVE_EVERY = timedelta(seconds=30)
+
+
+class _Previous:
+    """Just the chain position AutosaveService.encode() reads."""
+
+    def __init__(self, row):
+        self.id = row["id"]
+        self.keyframe_id = row["keyframe_id"]
+        self.chain_index = row["chain_index"]
+
+
+def seed(app, scenes, days, words, now):
+    """Insert `days` of 30-second autosaves for each scene; returns row count."""
+    saves = int(timedelta(days=days) / SAVE_EVERY)
+    rng = random.Random(7)
+    total = 0
+    with app.app_context():
+        for s in range(scenes):
+            rows, previous, previous_content = [], None, None
+            for i, content in enumerate(simulate_edits(rng, words, saves)):
+                row = {
+                    "id": str(uuid.uuid4()),
+                    "scene_id": f"scene-{s}",
+                    "saved_at": now - SAVE_EVERY * (saves - 1 - i),
+                    **AutosaveService.encode(content, previous, previous_content),
+                }
+                rows.append(row)
+                previous, previous_content = _Previous(row), content
+            db.session.execute(insert(AutosaveVersion), rows)
+            db.session.commit()
+            total += len(rows)
+    return total
+
+
+def stored_characters():
+    return db.session.query(
+        func.coalesce(
+            func.sum(
+                func.length(
+                    func.coalesce(AutosaveVersion.content, AutosaveVersion.delta, "")
+                )
+            ),
+            0,
+        )
+    ).scalar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--scenes", type=int, default=5)
+    parser.add_argument("--days", type=float, default=2)
+    parser.add_argument("--words", type=int, default=3000)
+    parser.add_argument("--retention", default="1h:0,1d:10m,*:1d")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--max-transaction-ms", type=float, default=250.0)
+    args = parser.parse_args(argv)
+
+    now = datetime.utcnow()
+    app = make_app(args.database_uri)
+    rows_before = seed(app, args.scenes, args.days, args.words, now)
+    compactor = AutosaveCompactor(app, args.retention, batch_size=args.batch_size)
+
+    transactions, started = [], []
+
+    def after_begin(session, transaction, connection):
+        started.append(time.perf_counter())
+
+    def after_commit(session):
+        if started:
+            transactions.append(time.perf_counter() - started.pop())
+
+    with app.app_context():
+        chars_before = stored_characters()
+        db.session.commit()
+        session = db.session()
+        event.listen(session, "after_begin", after_begin)
+        event.listen(session, "after_commit", after_commit)
+        run_started = time.perf_counter()
+        result = compactor.compact(now=now)
+        elapsed = time.perf_counter() - run_started
+        event.remove(session, "after_begin", after_begin)
+        event.remove(session, "after_commit", after_commit)
+        rows_after = AutosaveVersion.query.count()
+        chars_after = stored_characters()
+        sample = random.Random(1).sample(
+            AutosaveVersion.query.all(), min(200, rows_after)
+        )
+        broken = 0
+        for version in sample:
+            try:
+                AutosaveService.get_content(version)
+            except (LookupError, IndexError, ValueError):
+                broken += 1
+
+    max_transaction_ms = round(max(transactions, default=0) * 1000, 3)
+    report(
+        {
+            "benchmark": "autosave_compaction",
+            "scenes": args.scenes,
+            "days": args.days,
+            "retention": args.retention,
+            "rows_before": rows_before,
+            "rows_after": rows_after,
+            "rows_reclaimed": result["rows_deleted"],
+            "stored_chars_before": chars_before,
+            "stored_chars_after": chars_after,
+            "chains_rewritten": result["chains_rewritten"],
+            "run_seconds": round(elapsed, 3),
+            "transactions": len(transactions),
+            "max_transaction_ms": max_transaction_ms,
+            "broken_versions_in_sample": broken,
+        }
+    )
+    failures = []
+    if max_transaction_ms > args.max_transaction_ms:
+        failures.append(
+            f"longest transaction {max_transaction_ms} ms > {args.max_transaction_ms}"
+        )
+    if broken:
+        failures.append(f"{broken} sampled versions no longer rebuild")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
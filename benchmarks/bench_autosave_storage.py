@@ -0,0 +1,104 @@
+"""
+Benchmark for delta-encoded autosave storage.
+
+Simulates a writer autosaving a long scene with small edits, then reports
+stored bytes against full copies and the latency of rebuilding versions.
+
+Usage:
+    python -m benchmarks.bench_autosave_storage --words 10000 --saves 240
+"""
+
+import argparse
+import random
+import sys
+
+from backend.app import db
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.autosave_version import AutosaveVersion
+from benchmarks.common import latency_summary, make_app, report, timed
+
+WORDS = "the rain fell on the quiet harbour while she waited for news".split()
+
+
+def simulate_edits(rng, words, saves, paragraph_words=120):
+    """
+    Yield successive versions of a scene, each a few words different.
+
+    Edits cluster in the paragraph under a cursor that drifts through the
+    text, the way a writer types between two autosaves.
+    """
+    paragraphs = [
+        [rng.choice(WORDS) for _ in range(paragraph_words)]
+        for _ in range(max(1, words // paragraph_words))
+    ]
+    cursor = rng.randrange(len(paragraphs))
+    for _ in range(saves):
+        cursor = min(max(cursor + rng.randint(-1, 1), 0), len(paragraphs) - 1)
+        paragraph = paragraphs[cursor]
+        for _ in range(rng.randint(1, 8)):
+            position = rng.randrange(len(paragraph))
+            if rng.random() < 0.7 or len(paragraph) < 2:
+                paragraph.insert(position, rng.choice(WORDS))
+            else:
+                del paragraph[position]
+        yield "\n".join(" ".join(p) for p in paragraphs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--saves", type=int, default=240)
+    parser.add_argument("--keyframe-interval", type=int, default=20)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    app = make_app(args.database_uri, AUTOSAVE_KEYFRAME_INTERVAL=args.keyframe_interval)
+    full_bytes = 0
+    write_samples = []
+    with app.app_context():
+        previous = previous_content = None
+        for content in simulate_edits(rng, args.words, args.saves):
+            full_bytes += len(content.encode())
+            with timed(write_samples):
+                previous = AutosaveService.save_snapshot(
+                    content,
+                    scene_id="bench-scene",
+                    previous=previous,
+                    previous_content=previous_content,
+                )
+            previous_content = content
+        stored_bytes = sum(
+            len((content or delta or "").encode())
+            for content, delta in db.session.query(
+                AutosaveVersion.content, AutosaveVersion.delta
+            )
+        )
+        ids = [row.id for row in db.session.query(AutosaveVersion.id)]
+        read_samples = []
+        for _ in range(args.reads):
+            db.session.expire_all()
+            version = db.session.get(AutosaveVersion, rng.choice(ids))
+            with timed(read_samples):
+                AutosaveService.get_content(version)
+
+    report(
+        {
+            "benchmark": "autosave_storage",
+            "words": args.words,
+            "saves": args.saves,
+            "keyframe_interval": args.keyframe_interval,
+            "full_copy_bytes": full_bytes,
+            "stored_bytes": stored_bytes,
+            "compression_ratio": round(full_bytes / max(stored_bytes, 1), 2),
+            "write_latency": latency_summary(write_samples),
+            "reconstruction_latency": latency_summary(read_samples),
+        }
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Benchmark for conditional GET (ETag / If-None-Match) on the read routes.
+
+Seeds one project, then polls the timeline, chapter and scene lists the way
+an editor tab does: once without a validator and repeatedly with the ETag
+from the first response. Reports bytes on the wire, DB time and latency for
+both, and fails if a revalidation loads rows or returns a body.
+
+Usage:
+    python -m benchmarks.bench_etag --chapters 200 --scenes 25 --iterations 50
+"""
+
+import argparse
+import sys
+
+from backend.app import db
+from benchmarks.bench_timeline import seed
+from benchmarks.common import (
+    QueryCounter,
+    auth_header,
+    latency_summary,
+    make_app,
+    report,
+    timed,
+)
+
+URLS = {
+    "timeline": "/timeline/bench-project",
+    "chapters": "/chapters/?project_id=bench-project",
+    "scenes": "/scenes/?chapter_id=chap-0",
+}
+
+
+def poll(client, engine, url, headers, iterations):
+    """Issue `iterations` GETs and return (last response, stats)."""
+    samples, body_bytes, statements, db_ms = [], 0, 0, 0.0
+    for _ in range(iterations):
+        with QueryCounter(engine) as counter:
+            with timed(samples):
+                resp = client.get(url, headers=headers)
+                data = resp.get_data()
+        body_bytes += len(data)
+        statements += counter.count
+        db_ms += counter.milliseconds
+    return resp, {
+        "status": resp.status_code,
+        "bytes_per_request": body_bytes // iterations,
+        "statements_per_request": statements / iterations,
+        "db_ms_per_request": round(db_ms / iterations, 3),
+        "latency": latency_summary(samples),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--chapters", type=int, default=200)
+    parser.add_argument("--scenes", type=int, default=25)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    app = make_app(args.database_uri)
+    seed(app, args.chapters, args.scenes)
+    headers = auth_header(app)
+    client = app.test_client()
+    with app.app_context():
+        engine = db.engine
+
+    result = {
+        "benchmark": "etag",
+        "chapters": args.chapters,
+        "scenes_per_chapter": args.scenes,
+    }
+    failures = []
+    for name, url in URLS.items():
+        first, full = poll(client, engine, url, headers, args.iterations)
+        conditional = dict(headers, **{"If-None-Match": first.headers["ETag"]})
+        _, revalidated = poll(client, engine, url, conditional, args.iterations)
+        result[name] = {
+            "full": full,
+            "revalidated": revalidated,
+            "bytes_saved_pct": round(
+                100
+                * (1 - revalidated["bytes_per_request"] / full["bytes_per_request"]),
+                1,
+            ),
+            "db_ms_saved_pct": round(
+                100
+                * (1 - revalidated["db_ms_per_request"] / full["db_ms_per_request"]),
+                1,
+            ),
+        }
+        if revalidated["status"] != 304 or revalidated["bytes_per_request"]:
+            failures.append(f"{name}: revalidation did not return an empty 304")
+        if revalidated["statements_per_request"] > full["statements_per_request"]:
+            failures.append(f"{name}: revalidation ran more queries than a full GET")
+    report(result)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
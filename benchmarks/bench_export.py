@@ -0,0 +1,142 @@
+"""
+Benchmark for full-manuscript DOCX/PDF export.
+
+Seeds manuscripts of increasing size into temporary SQLite files, renders
+each one in a fresh subprocess and reports render time, peak traced Python
+allocations and the child's peak RSS against manuscript size.
+
+Usage:
+    python -m benchmarks.bench_export --pages 50 200 500 --types docx pdf
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import insert
+
+from backend.app import create_app, db
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+WORDS_PER_PAGE = 300
+SCENES_PER_CHAPTER = 5
+PAGES_PER_SCENE = 2
+VOCABULARY = "the night was long and the sea kept its secrets close".split()
+
+
+def seed(database_uri, pages, seed_value=11):
+    """Write one project of roughly `pages` pages to database_uri."""
+    rng = random.Random(seed_value)
+    app = create_app({"SQLALCHEMY_DATABASE_URI": database_uri})
+    scenes = max(1, pages // PAGES_PER_SCENE)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="bench-project", user_id="bench-user", title="Bench"))
+        chapters = max(1, scenes // SCENES_PER_CHAPTER)
+        db.session.execute(
+            insert(Chapter),
+            [
+                {
+                    "id": f"chap-{c}",
+                    "project_id": "bench-project",
+                    "title": f"Chapter {c + 1}",
+                    "order": c,
+                }
+                for c in range(chapters)
+            ],
+        )
+        words = WORDS_PER_PAGE * PAGES_PER_SCENE
+        db.session.execute(
+            insert(Scene),
+            [
+                {
+                    "id": f"scene-{s}",
+                    "chapter_id": f"chap-{s % chapters}",
+                    "title": f"Scene {s + 1}",
+                    "content": "\n".join(
+                        " ".join(rng.choice(VOCABULARY) for _ in range(100))
+                        for _ in range(words // 100)
+                    ),
+                    "order": s,
+                }
+                for s in range(scenes)
+            ],
+        )
+        db.session.commit()
+
+
+def render_once(database_uri, export_type):
+    """Render the seeded project and return timing and memory figures."""
+    from backend.app.services.export_service import ExportService
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": database_uri})
+    with app.app_context():
+        project = db.session.get(Project, "bench-project")
+        tracemalloc.start()
+        started = time.perf_counter()
+        file_obj = ExportService.export(project, export_type)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        file_obj.seek(0, os.SEEK_END)
+        size = file_obj.tell()
+        file_obj.close()
+    return {
+        "render_seconds": round(elapsed, 3),
+        "traced_peak_mb": round(peak / 1024 / 1024, 2),
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+        "output_bytes": size,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--types", nargs="+", default=["docx", "pdf"])
+    parser.add_argument("--child", nargs=2, metavar=("DATABASE_URI", "TYPE"))
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(render_once(*args.child)))
+        return 0
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            database_uri = f"sqlite:///{os.path.join(tmp, f'book_{pages}.db')}"
+            seed(database_uri, pages)
+            for export_type in args.types:
+                # Reason: A fresh process per run so peak RSS is not inherited
+                output = subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "benchmarks.bench_export",
+                        "--child",
+                        database_uri,
+                        export_type,
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                result.update({"pages": pages, "export_type": export_type})
+                results.append(result)
+    print(json.dumps({"benchmark": "export", "runs": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Benchmark for bulk manuscript import.
+
+Generates a Markdown manuscript (default 200k words), streams it through
+POST /import/ and reports rows/second and insert statements. For scale it
+also replays the same chapters and scenes the way clients used to create
+them: one ORM insert and commit per row.
+
+Usage:
+    python -m benchmarks.bench_import --words 200000 --chapters 40 --scenes 25
+"""
+
+import argparse
+import random
+import sys
+import time
+import uuid
+
+from backend.app import db
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+from benchmarks.common import QueryCounter, auth_header, make_app, report
+
+VOCABULARY = (
+    "the rain fell on quiet streets while she waited for a letter that never "
+    "came and the city kept its secrets behind shuttered windows"
+).split()
+
+
+def build_manuscript(words, chapters, scenes):
+    """Return (markdown, words_per_scene) for a book of roughly `words` words."""
+    rng = random.Random(42)
+    per_scene = max(1, words // (chapters * scenes))
+    parts = []
+    for c in range(chapters):
+        parts.append(f"# Chapter {c + 1}\n\n")
+        for s in range(scenes):
+            parts.append(f"## Scene {s + 1}\n\n")
+            body = rng.choices(VOCABULARY, k=per_scene)
+            for start in range(0, per_scene, 120):
+                parts.append(" ".join(body[start : start + 120]) + "\n\n")
+    return "".join(parts), per_scene
+
+
+def run_import(args, manuscript):
+    app = make_app(args.database_uri, IMPORT_BATCH_SIZE=args.batch_size)
+    headers = auth_header(app)
+    client = app.test_client()
+    with app.app_context():
+        engine = db.engine
+    with QueryCounter(engine) as counter:
+        started = time.perf_counter()
+        resp = client.post(
+            "/import/?format=markdown&title=Benchmark",
+            data=manuscript.encode("utf-8"),
+            headers=headers,
+        )
+        elapsed = time.perf_counter() - started
+    assert resp.status_code == 201, resp.get_data(as_text=True)
+    result = resp.get_json()
+    rows = result["chapters"] + result["scenes"] + 1
+    return {
+        "rows": rows,
+        "words": result["words"],
+        "statements": counter.count,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1),
+        "words_per_second": round(result["words"] / elapsed, 1),
+    }
+
+
+def run_per_row(args, words_per_scene):
+    """Baseline: one insert + commit per row, as separate POSTs would do."""
+    app = make_app(args.database_uri)
+    content = " ".join(["word"] * words_per_scene)
+    with app.app_context():
+        with QueryCounter(db.engine) as counter:
+            started = time.perf_counter()
+            project = Project(id=str(uuid.uuid4()), user_id="bench", title="Baseline")
+            db.session.add(project)
+            db.session.commit()
+            rows = 1
+            for c in range(args.chapters):
+                chapter = Chapter(project_id=project.id, title=f"C{c}", order=c + 1)
+                db.session.add(chapter)
+                db.session.commit()
+                rows += 1
+                for s in range(args.scenes):
+                    db.session.add(
+                        Scene(
+                            chapter_id=chapter.id,
+                            title=f"S{s}",
+                            content=content,
+                            order=s + 1,
+                        )
+                    )
+                    db.session.commit()
+                    rows += 1
+            elapsed = time.perf_counter() - started
+    return {
+        "rows": rows,
+        "statements": counter.count,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--words", type=int, default=200000)
+    parser.add_argument("--chapters", type=int, default=40)
+    parser.add_argument("--scenes", type=int, default=25)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    manuscript, words_per_scene = build_manuscript(
+        args.words, args.chapters, args.scenes
+    )
+    imported = run_import(args, manuscript)
+    baseline = run_per_row(args, words_per_scene)
+    report(
+        {
+            "benchmark": "import",
+            "manuscript_bytes": len(manuscript.encode("utf-8")),
+            "chapters": args.chapters,
+            "scenes_per_chapter": args.scenes,
+            "bulk_import": imported,
+            "per_row_commits": baseline,
+            "speedup": round(baseline["seconds"] / imported["seconds"], 1),
+        }
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,467 @@
+"""
+Load test across every blueprint with concurrent clients.
+
+Seeds synthetic users, projects, chapters, scenes, drafts, annotations and
+autosaves at a configurable scale (deterministic ids, so runs are
+comparable), then drives each route in turn with --clients concurrent
+clients. Reports per-route p50/p95/p99 latency, errors and throughput as
+JSON tagged with the git commit. Requests run in-process through the Flask
+test client by default; --base-url sends them over HTTP to a running server
+that uses the same DATABASE_URL and SECRET_KEY.
+
+--output writes the result to a file. --compare reads an earlier result and
+fails if any route's p95 regressed by more than --max-regression-pct.
+
+Usage:
+    python -m benchmarks.bench_load --users 20 --clients 8 --requests 50
+    python -m benchmarks.bench_load --routes timeline,autosave --output base.json
+    python -m benchmarks.bench_load --compare base.json
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from backend.app import db
+from backend.app.services.auth_service import AuthService
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.annotation import Annotation
+from backend.models.autosave_version import AutosaveVersion
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+from backend.models.user import User
+from benchmarks.common import latency_summary, make_app, report
+
+PASSWORD = "load-test-password"
+SCENE_TEXT = "The rain kept falling on the harbour. " * 40
+INSERT_BATCH = 1000
+
+
+class Scale:
+    """Rows per parent for the synthetic workspace."""
+
+    def __init__(self, args):
+        self.users = args.users
+        self.projects = args.projects
+        self.chapters = args.chapters
+        self.scenes = args.scenes
+        self.drafts = args.drafts
+        self.annotations = args.annotations
+        self.autosaves = args.autosaves
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+def project_ids(scale, u):
+    return [f"u{u}-p{p}" for p in range(scale.projects)]
+
+
+def chapter_ids(scale, project_id):
+    return [f"{project_id}-c{c}" for c in range(scale.chapters)]
+
+
+def scene_ids(scale, chapter_id):
+    return [f"{chapter_id}-s{s}" for s in range(scale.scenes)]
+
+
+def _flush(rows):
+    for model, batch in rows.items():
+        if batch:
+            db.session.execute(insert(model), batch)
+            batch.clear()
+
+
+def seed(app, scale):
+    """Bulk-insert the workspace; returns row counts per table."""
+    base = datetime(2025, 1, 1)
+    counts = dict.fromkeys(
+        ("users", "projects", "chapters", "scenes", "drafts", "annotations"), 0
+    )
+    counts["autosave_versions"] = 0
+    content_hash = AutosaveService.content_hash(SCENE_TEXT)
+    with app.app_context():
+        password_hash = AuthService.hash_password(PASSWORD)
+        rows = {
+            model: []
+            for model in (
+                User,
+                Project,
+                Chapter,
+                Scene,
+                Draft,
+                Annotation,
+                AutosaveVersion,
+            )
+        }
+        for u in range(scale.users):
+            rows[User].append(
+                {
+                    "id": f"u{u}",
+                    "email": f"load{u}@example.com",
+                    "password_hash": password_hash,
+                }
+            )
+            for pid in project_ids(scale, u):
+                rows[Project].append(
+                    {"id": pid, "user_id": f"u{u}", "title": pid, "created_at": base}
+                )
+                for c, cid in enumerate(chapter_ids(scale, pid)):
+                    rows[Chapter].append(
+                        {
+                            "id": cid,
+                            "project_id": pid,
+                            "title": cid,
+                            "order": c,
+                            "created_at": base + timedelta(minutes=c),
+                        }
+                    )
+                    for s, sid in enumerate(scene_ids(scale, cid)):
+                        at = base + timedelta(minutes=c, seconds=s)
+                        rows[Scene].append(
+                            {
+                                "id": sid,
+                                "chapter_id": cid,
+                                "title": sid,
+                                "content": SCENE_TEXT,
+                                "order": s,
+                                "created_at": at,
+                            }
+                        )
+                        for v in range(scale.autosaves):
+                            rows[AutosaveVersion].append(
+                                {
+                                    "id": f"{sid}-v{v}",
+                                    "scene_id": sid,
+                                    "content": SCENE_TEXT,
+                                    "content_hash": content_hash,
+                                    "saved_at": at + timedelta(seconds=30 * v),
+                                }
+                            )
+                        for d in range(scale.drafts):
+                            did = f"{sid}-d{d}"
+                            rows[Draft].append(
+                                {
+                                    "id": did,
+                                    "scene_id": sid,
+                                    "content": SCENE_TEXT,
+                                    "created_at": at,
+                                }
+                            )
+                            for a in range(scale.annotations):
+                                rows[Annotation].append(
+                                    {
+                                        "id": f"{did}-a{a}",
+                                        "draft_id": did,
+                                        "context": "harbour",
+                                        "highlight": "rain",
+                                        "created_at": at,
+                                    }
+                                )
+                    if sum(len(batch) for batch in rows.values()) >= INSERT_BATCH:
+                        for model, batch in rows.items():
+                            counts[model.__tablename__] += len(batch)
+                        _flush(rows)
+        for model, batch in rows.items():
+            counts[model.__tablename__] += len(batch)
+        _flush(rows)
+        db.session.commit()
+    return counts
+
+
+class Workspace:
+    """The rows one client works on: its user's projects and their children."""
+
+    def __init__(self, scale, client_index, seed_value):
+        self.user = client_index % scale.users
+        self.rng = random.Random(seed_value * 1000 + client_index)
+        self.scale = scale
+        self.email = f"load{self.user}@example.com"
+        self.projects = project_ids(scale, self.user)
+
+    def project(self):
+        return self.rng.choice(self.projects)
+
+    def chapter(self):
+        return self.rng.choice(chapter_ids(self.scale, self.project()))
+
+    def scene(self):
+        return self.rng.choice(scene_ids(self.scale, self.chapter()))
+
+    def draft(self):
+        return f"{self.scene()}-d{self.rng.randrange(self.scale.drafts)}"
+
+
+# Reason: route name -> request builders; each returns (method, path, json body)
+SCENARIOS = {
+    "auth": {
+        "login": lambda w: (
+            "POST",
+            "/auth/login",
+            {"email": w.email, "password": PASSWORD},
+        ),
+    },
+    "projects": {
+        "list": lambda w: ("GET", "/projects/", None),
+        "update": lambda w: ("PUT", f"/projects/{w.project()}", {"title": "Renamed"}),
+    },
+    "chapters": {
+        "list": lambda w: ("GET", f"/chapters/?project_id={w.project()}", None),
+        "update": lambda w: ("PUT", f"/chapters/{w.chapter()}", {"title": "Renamed"}),
+    },
+    "scenes": {
+        "list": lambda w: ("GET", f"/scenes/?chapter_id={w.chapter()}", None),
+        "update": lambda w: (
+            "PUT",
+            f"/scenes/{w.scene()}",
+            {"content": SCENE_TEXT + f"Edit {w.rng.random()}."},
+        ),
+    },
+    "drafts": {
+        "list": lambda w: ("GET", f"/drafts/?scene_id={w.scene()}", None),
+        "create": lambda w: (
+            "POST",
+            "/drafts/",
+            {"scene_id": w.scene(), "content": SCENE_TEXT},
+        ),
+    },
+    "annotations": {
+        "list": lambda w: ("GET", f"/annotations/?draft_id={w.draft()}", None),
+        "create": lambda w: (
+            "POST",
+            "/annotations/",
+            {"draft_id": w.draft(), "context": "harbour", "highlight": "rain"},
+        ),
+    },
+    "timeline": {
+        "get": lambda w: ("GET", f"/timeline/{w.project()}", None),
+    },
+    "autosave": {
+        "save": lambda w: (
+            "POST",
+            "/autosave/",
+            {"scene_id": w.scene(), "content": SCENE_TEXT + f"{w.rng.random()}"},
+        ),
+        "history": lambda w: (
+            "GET",
+            f"/autosave/?scene_id={w.scene()}&fields=id,saved_at",
+            None,
+        ),
+    },
+    "export": {
+        "docx": lambda w: ("POST", f"/export/{w.project()}", {"export_type": "docx"}),
+    },
+}
+
+
+class InProcessClient:
+    """Flask test client speaking the same interface as HttpClient."""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, body, headers):
+        resp = self.client.open(path, method=method, json=body, headers=headers)
+        resp.get_data()
+        return resp.status_code
+
+
+class HttpClient:
+    """Plain urllib client for a server started separately (e.g. gunicorn)."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+
+    def request(self, method, path, body, headers):
+        data = None
+        headers = dict(headers)
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        req = urllib.request.Request(
+            self.base_url + path, data=data, method=method, headers=headers
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=60) as resp:
+                resp.read()
+                return resp.status
+        except urllib.error.HTTPError as exc:
+            exc.read()
+            return exc.code
+
+
+def run_operation(make_client, tokens, scenario, clients, requests, seed_value):
+    """Run one operation with `clients` threads; returns its result row."""
+    samples, statuses = [], []
+
+    def worker(index):
+        client = make_client()
+        workspace = Workspace(scenario["scale"], index, seed_value)
+        headers = {"Authorization": f"Bearer {tokens[workspace.user]}"}
+        local_samples, local_statuses = [], []
+        for _ in range(requests):
+            method, path, body = scenario["build"](workspace)
+            started = time.perf_counter()
+            status = client.request(method, path, body, headers)
+            local_samples.append((time.perf_counter() - started) * 1000)
+            local_statuses.append(status)
+        return local_samples, local_statuses
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for local_samples, local_statuses in pool.map(worker, range(clients)):
+            samples.extend(local_samples)
+            statuses.extend(local_statuses)
+    elapsed = time.perf_counter() - started
+    return {
+        **latency_summary(samples),
+        "errors": sum(1 for status in statuses if status >= 400),
+        "throughput_rps": round(len(samples) / elapsed, 1),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(result, baseline, max_regression_pct):
+    """Add p95 change per route; return the routes that regressed."""
+    regressions = []
+    for name, row in result["routes"].items():
+        before = baseline.get("routes", {}).get(name)
+        if not before or not before.get("p95_ms"):
+            continue
+        change = (row["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+        row["p95_change_pct"] = round(change, 1)
+        if change > max_regression_pct:
+            regressions.append(f"{name} p95 {before['p95_ms']} -> {row['p95_ms']} ms")
+    result["baseline_commit"] = baseline.get("commit")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri")
+    parser.add_argument("--base-url")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--projects", type=int, default=3)
+    parser.add_argument("--chapters", type=int, default=10)
+    parser.add_argument("--scenes", type=int, default=10)
+    parser.add_argument("--drafts", type=int, default=1)
+    parser.add_argument("--annotations", type=int, default=2)
+    parser.add_argument("--autosaves", type=int, default=3)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--export-requests", type=int, default=3)
+    parser.add_argument("--routes", default=",".join(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    parser.add_argument("--max-regression-pct", type=float, default=25.0)
+    args = parser.parse_args(argv)
+
+    routes = [name.strip() for name in args.routes.split(",") if name.strip()]
+    unknown = set(routes) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown routes: {', '.join(sorted(unknown))}")
+    if args.base_url and not args.database_uri:
+        parser.error("--base-url needs --database-uri: the server's (empty) database")
+    scale = Scale(args)
+    path = None
+    database_uri = args.database_uri
+    if not database_uri:
+        # Reason: Threads need a shared database; in-memory SQLite is one connection
+        handle, path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        database_uri = f"sqlite:///{path}"
+    export_dir = tempfile.mkdtemp(prefix="bench-load-exports-")
+    app = make_app(
+        database_uri,
+        DOCS_EXPORT_PATH=export_dir,
+        RANK_REBALANCE_ASYNC=False,
+        METRICS_ENABLED=False,
+    )
+    seeded_at = time.perf_counter()
+    rows = seed(app, scale)
+    seed_seconds = round(time.perf_counter() - seeded_at, 3)
+    with app.app_context():
+        tokens = [AuthService.generate_token(f"u{u}") for u in range(scale.users)]
+
+    if args.base_url:
+        make_client = lambda: HttpClient(args.base_url)  # noqa: E731
+    else:
+        make_client = lambda: InProcessClient(app)  # noqa: E731
+
+    results = {}
+    for route in routes:
+        requests = args.export_requests if route == "export" else args.requests
+        for operation, build in SCENARIOS[route].items():
+            results[f"{route}.{operation}"] = run_operation(
+                make_client,
+                tokens,
+                {"scale": scale, "build": build},
+                args.clients,
+                requests,
+                args.seed,
+            )
+
+    result = {
+        "benchmark": "load",
+        "commit": git_commit(),
+        "database": database_uri.split(":", 1)[0],
+        "target": args.base_url or "in-process",
+        "scale": scale.as_dict(),
+        "rows": rows,
+        "seed_seconds": seed_seconds,
+        "clients": args.clients,
+        "requests_per_client": args.requests,
+        "routes": results,
+    }
+    failures = [
+        f"{name}: {row['errors']} error responses"
+        for name, row in results.items()
+        if row["errors"]
+    ]
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            failures += [
+                f"regression: {line}"
+                for line in compare(result, json.load(handle), args.max_regression_pct)
+            ]
+    report(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2, sort_keys=True)
+    if path:
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        os.unlink(path)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Login throughput benchmark for the bounded password hashing pool.
+
+Seeds users, then fires a burst of concurrent POST /auth/login requests
+while a probe thread keeps hitting a cheap route (GET /). Reports logins
+per second, 503 sheds, and latency for both logins and the probe, with the
+pool enabled and with hashing inline on the request thread.
+
+Usage:
+    python -m benchmarks.bench_login --users 50 --clients 16 --logins 400
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.app import db
+from backend.app.services.auth_service import AuthService
+from backend.models.user import User
+from benchmarks.common import latency_summary, make_app, report, timed
+
+PASSWORD = "correct horse battery staple"
+
+
+def seed_users(app, count):
+    with app.app_context():
+        password_hash = AuthService.hash_password(PASSWORD)
+        db.session.add_all(
+            User(id=str(uuid.uuid4()), email=f"user{i}@example.com", password_hash=ph)
+            for i, ph in enumerate([password_hash] * count)
+        )
+        db.session.commit()
+
+
+def run(args, workers):
+    handle, path = tempfile.mkstemp(suffix=".db")
+    os.close(handle)
+    app = make_app(
+        args.database_uri or f"sqlite:///{path}",
+        PASSWORD_HASH_ALGORITHM=args.algorithm,
+        PASSWORD_HASH_COST=args.cost,
+        PASSWORD_HASH_WORKERS=workers,
+        PASSWORD_HASH_MAX_QUEUE=args.max_queue,
+    )
+    seed_users(app, args.users)
+    login_samples, probe_samples, statuses = [], [], []
+    done = threading.Event()
+
+    def login(i):
+        client = app.test_client()
+        body = {"email": f"user{i % args.users}@example.com", "password": PASSWORD}
+        with timed(login_samples):
+            statuses.append(client.post("/auth/login", json=body).status_code)
+
+    def probe():
+        client = app.test_client()
+        while not done.is_set():
+            with timed(probe_samples):
+                client.get("/")
+            time.sleep(0.005)
+
+    prober = threading.Thread(target=probe)
+    prober.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        list(pool.map(login, range(args.logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    prober.join()
+    os.unlink(path)
+    ok = statuses.count(200)
+    return {
+        "ok": ok,
+        "shed_503": statuses.count(503),
+        "logins_per_second": round(ok / elapsed, 1),
+        "login": latency_summary(login_samples),
+        "probe": latency_summary(probe_samples),
+        "hasher": (
+            app.extensions["password_hasher"].stats()
+            if "password_hasher" in app.extensions
+            else None
+        ),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default=None)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--algorithm", default="scrypt")
+    parser.add_argument("--cost", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--max-queue", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    report(
+        {
+            "benchmark": "login",
+            "algorithm": args.algorithm,
+            "clients": args.clients,
+            "inline": run(args, workers=0),
+            "pooled": run(args, workers=args.workers),
+        }
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
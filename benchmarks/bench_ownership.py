@@ -0,0 +1,84 @@
+"""
+Benchmark of the ownership check behind draft/annotation/scene access.
+
+Resolves --rows annotations (each four levels below its project) with the
+ownership cache enabled and disabled, and reports microseconds per check.
+Fails if a cached check costs more than --budget-us.
+
+Usage:
+    python -m benchmarks.bench_ownership --rows 2000 --iterations 5
+"""
+
+import argparse
+import sys
+import time
+
+from sqlalchemy import insert
+
+from backend.app import db
+from backend.app.utils.ownership import owns
+from backend.models.annotation import Annotation
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+from benchmarks.common import make_app, report
+
+
+def setup(rows, cache_size):
+    app = make_app(OWNERSHIP_CACHE_SIZE=cache_size)
+    with app.app_context():
+        db.session.add(Project(id="p", user_id="bench-user", title="Book"))
+        db.session.add(Chapter(id="c", project_id="p", title="C", order=1))
+        db.session.add(Scene(id="s", chapter_id="c", title="S", order=1))
+        db.session.execute(
+            insert(Draft), [{"id": f"d{i}", "scene_id": "s"} for i in range(rows)]
+        )
+        db.session.execute(
+            insert(Annotation),
+            [{"id": f"a{i}", "draft_id": f"d{i}"} for i in range(rows)],
+        )
+        db.session.commit()
+    return app
+
+
+def us_per_check(app, rows, iterations):
+    with app.app_context():
+        for i in range(rows):
+            assert owns("annotation", f"a{i}", "bench-user")
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for i in range(rows):
+                owns("annotation", f"a{i}", "bench-user")
+        return (time.perf_counter() - started) / (rows * iterations) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--budget-us", type=float, default=20.0)
+    args = parser.parse_args(argv)
+
+    cached = us_per_check(setup(args.rows, args.rows * 2), args.rows, args.iterations)
+    uncached = us_per_check(setup(args.rows, 0), args.rows, args.iterations)
+    report(
+        {
+            "benchmark": "ownership",
+            "rows": args.rows,
+            "check_us_cached": round(cached, 3),
+            "check_us_uncached": round(uncached, 3),
+            "speedup": round(uncached / cached, 1),
+        }
+    )
+    if cached > args.budget_us:
+        print(
+            f"FAIL: cached ownership check {cached:.1f} us > {args.budget_us}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
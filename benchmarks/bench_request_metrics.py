@@ -0,0 +1,85 @@
+"""
+Benchmark of the per-request cost of request metrics.
+
+Drives GET /stats/projects/<id> (JWT check plus one indexed query) on two
+apps, METRICS_ENABLED on and off, alternating request by request so drift
+in the machine hits both alike, and reports the difference of the median
+latencies and the cost of one /metrics scrape. Fails if the overhead
+exceeds --budget-us.
+
+Usage:
+    python -m benchmarks.bench_request_metrics --requests 5000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from backend.app import db
+from backend.models.project import Project
+from benchmarks.common import auth_header, make_app, report
+
+
+def setup(enabled):
+    app = make_app(METRICS_ENABLED=enabled)
+    with app.app_context():
+        db.session.add(Project(id="proj", user_id="bench-user", title="Book"))
+        db.session.commit()
+    return app, app.test_client(), auth_header(app)
+
+
+def timed_request(client, headers):
+    """Microseconds for one request."""
+    started = time.perf_counter()
+    resp = client.get("/stats/projects/proj", headers=headers)
+    elapsed = (time.perf_counter() - started) * 1e6
+    assert resp.status_code == 200
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--budget-us", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    on, off = setup(True), setup(False)
+    for _ in range(200):
+        timed_request(*on[1:])
+        timed_request(*off[1:])
+    samples = {"on": [], "off": []}
+    for _ in range(args.requests):
+        samples["off"].append(timed_request(*off[1:]))
+        samples["on"].append(timed_request(*on[1:]))
+    enabled_us = statistics.median(samples["on"])
+    disabled_us = statistics.median(samples["off"])
+    overhead_us = round(enabled_us - disabled_us, 3)
+
+    started = time.perf_counter()
+    scrape = on[1].get("/metrics")
+    scrape_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    report(
+        {
+            "benchmark": "request_metrics",
+            "requests": args.requests,
+            "request_us_disabled": round(disabled_us, 3),
+            "request_us_enabled": round(enabled_us, 3),
+            "overhead_us": overhead_us,
+            "overhead_pct": round(overhead_us / disabled_us * 100, 2),
+            "scrape_ms": scrape_ms,
+            "scrape_bytes": len(scrape.data),
+        }
+    )
+    if overhead_us > args.budget_us:
+        print(
+            f"FAIL: metrics add {overhead_us} us per request > {args.budget_us}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Benchmark for full-text search (GET /search).
+
+Seeds one project of roughly `--words` words (default 1M) across scenes,
+drafts and annotations with bulk inserts, so the index is built by the same
+triggers / generated columns that maintain it in production. Then reports
+p50/p95/p99 latency for common, rare, multi-word and phrase queries, and the
+cost of an incremental re-index through PATCH /scenes/<id>. Fails if any
+query's p95 exceeds --budget-ms.
+
+Usage:
+    python -m benchmarks.bench_search --words 1000000 --iterations 50
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from sqlalchemy import insert
+
+from backend.app import db
+from backend.models.annotation import Annotation
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+from benchmarks.common import auth_header, latency_summary, make_app, report, timed
+
+COMMON = (
+    "the rain fell on quiet streets while she waited for a letter that never "
+    "came and the city kept its secrets behind shuttered windows"
+).split()
+QUERIES = {
+    "common": "rain",
+    "rare": "lighthouse",
+    "multi_word": "quiet letter windows",
+    "phrase": '"shuttered windows"',
+    "no_match": "zeppelin",
+}
+
+
+def prose(rng, words):
+    """Common words with an occasional rare one, like real prose."""
+    rare = [f"word{rng.randrange(20000)}" for _ in range(words // 20)]
+    body = rng.choices(COMMON, k=words - len(rare)) + rare
+    rng.shuffle(body)
+    return " ".join(body)
+
+
+def seed(app, words, chapters, scenes):
+    """Insert one project; 80% of words in scenes, the rest in drafts/notes."""
+    rng = random.Random(7)
+    per_scene = max(1, int(words * 0.8) // (chapters * scenes))
+    per_draft = max(1, int(words * 0.15) // (chapters * scenes))
+    with app.app_context():
+        db.session.execute(
+            insert(Project),
+            [{"id": "bench-project", "user_id": "bench-user", "title": "Bench"}],
+        )
+        rows = {Chapter: [], Scene: [], Draft: [], Annotation: []}
+        for c in range(chapters):
+            cid = f"chap-{c}"
+            rows[Chapter].append(
+                {"id": cid, "project_id": "bench-project", "title": cid, "order": c}
+            )
+            for s in range(scenes):
+                sid = f"{cid}-s{s}"
+                content = prose(rng, per_scene)
+                if rng.random() < 0.01:
+                    content += " the lighthouse keeper"
+                rows[Scene].append(
+                    {
+                        "id": sid,
+                        "chapter_id": cid,
+                        "title": f"Scene {s}",
+                        "content": content,
+                        "order": s,
+                    }
+                )
+                rows[Draft].append(
+                    {
+                        "id": f"{sid}-d",
+                        "scene_id": sid,
+                        "content": prose(rng, per_draft),
+                    }
+                )
+                rows[Annotation].append(
+                    {
+                        "id": f"{sid}-a",
+                        "draft_id": f"{sid}-d",
+                        "highlight": prose(rng, 4),
+                        "context": prose(rng, 30),
+                    }
+                )
+        started = time.perf_counter()
+        for model, batch in rows.items():
+            db.session.execute(insert(model), batch)
+        db.session.commit()
+        return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--chapters", type=int, default=40)
+    parser.add_argument("--scenes", type=int, default=25)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    app = make_app(args.database_uri)
+    load_seconds = seed(app, args.words, args.chapters, args.scenes)
+    headers = auth_header(app)
+    client = app.test_client()
+
+    result = {
+        "benchmark": "search",
+        "words": args.words,
+        "scenes": args.chapters * args.scenes,
+        "indexed_load_seconds": round(load_seconds, 3),
+    }
+    failures = []
+    for name, q in QUERIES.items():
+        samples = []
+        for _ in range(args.iterations):
+            with timed(samples):
+                resp = client.get(
+                    "/search",
+                    query_string={"project_id": "bench-project", "q": q},
+                    headers=headers,
+                )
+        assert resp.status_code == 200, resp.get_data(as_text=True)
+        summary = latency_summary(samples)
+        summary["hits"] = len(resp.get_json()["results"])
+        result[name] = summary
+        if summary["p95_ms"] > args.budget_ms:
+            failures.append(f"{name}: p95 {summary['p95_ms']} ms > {args.budget_ms}")
+
+    samples = []
+    for version in range(1, args.iterations + 1):
+        with timed(samples):
+            resp = client.patch(
+                "/scenes/chap-0-s0",
+                json={"base_version": version, "ops": [{"insert": "zeppelin "}]},
+                headers=headers,
+            )
+        assert resp.status_code == 200, resp.get_data(as_text=True)
+    result["patch_reindex"] = latency_summary(samples)
+    resp = client.get(
+        "/search",
+        query_string={"project_id": "bench-project", "q": "zeppelin"},
+        headers=headers,
+    )
+    if [hit["id"] for hit in resp.get_json()["results"]] != ["chap-0-s0"]:
+        failures.append("patched scene was not found by its new text")
+
+    report(result)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Benchmark for list serialization: row encoders vs the paths they replace.
+
+Loads ROWS chapters, scenes and drafts, then encodes each list repeatedly
+with the old code paths (hand-built isoformat() dicts or marshmallow dumps,
+encoded by Flask's stdlib JSON provider) and with the orjson row encoders.
+Fails if an encoder is slower than its baseline or produces different JSON.
+
+Usage:
+    python -m benchmarks.bench_serializer --rows 10000 --iterations 10
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import insert
+
+from backend.app import db
+from backend.app.schemas.draft_schema import DraftSchema
+from backend.app.schemas.scene_schema import SceneSchema
+from backend.app.utils.serializer import CHAPTER_ENCODER, DRAFT_ENCODER, SCENE_ENCODER
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+from benchmarks.common import make_app, report
+
+
+def seed(app, rows):
+    """Insert `rows` chapters, scenes and drafts under one project."""
+    base = datetime(2025, 1, 1)
+    with app.app_context():
+        db.session.add(Project(id="bench-project", user_id="bench-user", title="Bench"))
+        db.session.execute(
+            insert(Chapter),
+            [
+                {
+                    "id": f"chap-{i}",
+                    "project_id": "bench-project",
+                    "title": f"Chapter {i}",
+                    "order": i,
+                    "created_at": base + timedelta(seconds=i),
+                    "updated_at": base + timedelta(seconds=i),
+                }
+                for i in range(rows)
+            ],
+        )
+        db.session.execute(
+            insert(Scene),
+            [
+                {
+                    "id": f"scene-{i}",
+                    "chapter_id": "chap-0",
+                    "title": f"Scene {i}",
+                    "content": "Lorem ipsum dolor sit amet. " * 10,
+                    "order": i,
+                    "created_at": base + timedelta(seconds=i),
+                    "updated_at": base + timedelta(seconds=i),
+                }
+                for i in range(rows)
+            ],
+        )
+        db.session.execute(
+            insert(Draft),
+            [
+                {
+                    "id": f"draft-{i}",
+                    "scene_id": "scene-0",
+                    "content": "Draft text. " * 10,
+                    "created_at": base + timedelta(seconds=i),
+                    "updated_at": base + timedelta(seconds=i),
+                }
+                for i in range(rows)
+            ],
+        )
+        db.session.commit()
+
+
+def chapter_dicts(chapters):
+    """The hand-built dicts chapters.py used to return."""
+    return [
+        {
+            "id": str(c.id),
+            "project_id": str(c.project_id),
+            "title": c.title,
+            "order": c.order,
+            "rank": c.rank,
+            "created_at": c.created_at.isoformat(),
+            "updated_at": c.updated_at.isoformat() if c.updated_at else None,
+        }
+        for c in chapters
+    ]
+
+
+def measure(encode, rows, iterations):
+    """Return (rows per second, encoded bytes) for the best of `iterations`."""
+    best = float("inf")
+    for _ in range(iterations):
+        started = time.perf_counter()
+        body = encode(rows)
+        best = min(best, time.perf_counter() - started)
+    return round(len(rows) / best, 1), body
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    app = make_app(args.database_uri)
+    seed(app, args.rows)
+    stdlib = DefaultJSONProvider(app)
+    scene_schema, draft_schema = SceneSchema(), DraftSchema()
+    cases = {
+        "chapters": (
+            Chapter,
+            lambda rows: stdlib.dumps(chapter_dicts(rows)),
+            CHAPTER_ENCODER.dumps_many,
+        ),
+        "scenes": (
+            Scene,
+            lambda rows: stdlib.dumps(scene_schema.dump(rows, many=True)),
+            SCENE_ENCODER.dumps_many,
+        ),
+        "drafts": (
+            Draft,
+            lambda rows: stdlib.dumps(draft_schema.dump(rows, many=True)),
+            DRAFT_ENCODER.dumps_many,
+        ),
+    }
+    result = {"benchmark": "serializer", "rows": args.rows}
+    failures = []
+    with app.app_context():
+        for name, (model, baseline, encoder) in cases.items():
+            rows = db.session.query(model).all()
+            old_rate, old_body = measure(baseline, rows, args.iterations)
+            new_rate, new_body = measure(encoder, rows, args.iterations)
+            result[name] = {
+                "baseline_rows_per_second": old_rate,
+                "encoder_rows_per_second": new_rate,
+                "speedup": round(new_rate / old_rate, 1),
+            }
+            if json.loads(old_body) != json.loads(new_body):
+                failures.append(f"{name}: encoder output differs from baseline")
+            if new_rate < old_rate:
+                failures.append(f"{name}: encoder slower than baseline")
+    report(result)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Benchmark for GET /timeline/<project_id> on a large project.
+
+Seeds one project with CHAPTERS x SCENES rows, then asserts the route stays
+within its SQL query budget and p99 latency target.
+
+Usage:
+    python -m benchmarks.bench_timeline --chapters 500 --scenes 50
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from backend.app import db
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+from benchmarks.common import (
+    QueryCounter,
+    auth_header,
+    latency_summary,
+    make_app,
+    report,
+    timed,
+)
+
+
+def seed(app, chapters, scenes_per_chapter):
+    """Insert one project with the given number of chapters and scenes."""
+    base = datetime(2025, 1, 1)
+    with app.app_context():
+        db.session.add(Project(id="bench-project", user_id="bench-user", title="Bench"))
+        db.session.execute(
+            insert(Chapter),
+            [
+                {
+                    "id": f"chap-{c}",
+                    "project_id": "bench-project",
+                    "title": f"Chapter {c}",
+                    "order": c,
+                    "created_at": base + timedelta(minutes=c),
+                }
+                for c in range(chapters)
+            ],
+        )
+        db.session.execute(
+            insert(Scene),
+            [
+                {
+                    "id": f"scene-{c}-{s}",
+                    "chapter_id": f"chap-{c}",
+                    "title": f"Scene {s}",
+                    "content": "Lorem ipsum dolor sit amet. " * 20,
+                    "order": s,
+                    "created_at": base + timedelta(minutes=c, seconds=s),
+                }
+                for c in range(chapters)
+                for s in range(scenes_per_chapter)
+            ],
+        )
+        db.session.commit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-uri", default="sqlite:///:memory:")
+    parser.add_argument("--chapters", type=int, default=500)
+    parser.add_argument("--scenes", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--max-queries", type=int, default=2)
+    parser.add_argument("--p99-ms", type=float, default=1500.0)
+    args = parser.parse_args(argv)
+
+    app = make_app(args.database_uri)
+    seed(app, args.chapters, args.scenes)
+    headers = auth_header(app)
+    client = app.test_client()
+    samples = []
+    with app.app_context():
+        with QueryCounter(db.engine) as counter:
+            rv = client.get("/timeline/bench-project", headers=headers)
+        queries = counter.count
+    assert rv.status_code == 200, rv.status_code
+    for _ in range(args.iterations):
+        with timed(samples):
+            client.get("/timeline/bench-project", headers=headers)
+
+    result = {
+        "benchmark": "timeline",
+        "chapters": args.chapters,
+        "scenes_per_chapter": args.scenes,
+        "queries_per_request": queries,
+        "latency": latency_summary(samples),
+    }
+    report(result)
+    failures = []
+    if queries > args.max_queries:
+        failures.append(f"query budget exceeded: {queries} > {args.max_queries}")
+    if result["latency"]["p99_ms"] > args.p99_ms:
+        failures.append(
+            f"p99 latency {result['latency']['p99_ms']}ms > {args.p99_ms}ms target"
+        )
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Shared helpers for backend benchmarks: app setup, query counting and stats.
+"""
+
+import json
+import math
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+
+
+def make_app(database_uri="sqlite:///:memory:", **config):
+    """Create an app bound to a fresh schema for benchmarking."""
+    overrides = {"TESTING": True, "SQLALCHEMY_DATABASE_URI": database_uri}
+    overrides.update(config)
+    app = create_app(overrides)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def auth_header(app, identity="bench-user"):
+    """Return an Authorization header accepted by the protected routes."""
+    with app.app_context():
+        token = AuthService.generate_token(identity)
+    return {"Authorization": f"Bearer {token}"}
+
+
+class QueryCounter:
+    """
+    Count SQL statements executed on an engine, and the time spent in them,
+    while active.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+        self.seconds = 0.0
+        self._started = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+        self._started.append(time.perf_counter())
+
+    def _after_cursor_execute(self, *args):
+        if self._started:
+            self.seconds += time.perf_counter() - self._started.pop()
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(self.engine, "after_cursor_execute", self._after_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self.engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    @property
+    def milliseconds(self):
+        return round(self.seconds * 1000, 3)
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@contextmanager
+def timed(samples):
+    """Append the elapsed wall time of the block, in milliseconds, to samples."""
+    start = time.perf_counter()
+    yield
+    samples.append((time.perf_counter() - start) * 1000)
+
+
+def latency_summary(samples):
+    """Summarise latency samples (milliseconds) as p50/p95/p99/max."""
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "max_ms": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def report(result):
+    """Print a benchmark result as JSON."""
+    print(json.dumps(result, indent=2, sort_keys=True))
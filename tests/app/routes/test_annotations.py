@@ -5,6 +5,10 @@ Unit tests for GET/POST /annotations/ endpoint.
 import pytest
 from backend.app import create_app, db
 from backend.models.annotation import Annotation
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
 from flask_jwt_extended import create_access_token, JWTManager
 
 
@@ -15,11 +19,31 @@ def client():
     with app.test_client() as client:
         with app.app_context():
             db.create_all()
+            _seed_drafts("testuser", ["draft-uuid", "draft-a", "draft-b"])
+            _seed_drafts("otheruser", ["other-draft"])
         yield client
         with app.app_context():
             db.drop_all()
 
 
+def _seed_drafts(user_id, draft_ids):
+    """Drafts of a scene inside a project owned by user_id."""
+    db.session.add(Project(id=f"{user_id}-project", user_id=user_id, title="P"))
+    db.session.add(
+        Chapter(
+            id=f"{user_id}-chapter", project_id=f"{user_id}-project", title="C", order=1
+        )
+    )
+    db.session.add(
+        Scene(
+            id=f"{user_id}-scene", chapter_id=f"{user_id}-chapter", title="S", order=1
+        )
+    )
+    for draft_id in draft_ids:
+        db.session.add(Draft(id=draft_id, scene_id=f"{user_id}-scene", content=""))
+    db.session.commit()
+
+
 @pytest.fixture
 def auth_header(client):
     app = client.application
@@ -63,3 +87,48 @@ def test_post_annotation_empty_highlight(client, auth_header):
     rv = client.post("/annotations/", json=data, headers=auth_header)
     assert rv.status_code == 201
     assert rv.get_json()["highlight"] == ""
+
+
+def test_get_annotations_paginated_and_filtered(client, auth_header):
+    """Normal case: draft_id filter with keyset pages of one."""
+    from datetime import datetime, timedelta
+
+    base = datetime(2025, 1, 1)
+    with client.application.app_context():
+        for i, draft_id in enumerate(["draft-a", "draft-b", "draft-a", "draft-a"]):
+            db.session.add(
+                Annotation(
+                    id=f"ann-{i}",
+                    draft_id=draft_id,
+                    highlight=f"HL {i}",
+                    created_at=base + timedelta(seconds=i),
+                )
+            )
+        db.session.commit()
+    rv = client.get("/annotations/?draft_id=draft-a&limit=2", headers=auth_header)
+    assert rv.status_code == 200
+    assert [a["id"] for a in rv.get_json()] == ["ann-0", "ann-2"]
+    cursor = rv.headers["X-Next-Cursor"]
+    rv = client.get(
+        f"/annotations/?draft_id=draft-a&limit=2&cursor={cursor}", headers=auth_header
+    )
+    assert [a["id"] for a in rv.get_json()] == ["ann-3"]
+    assert "X-Next-Cursor" not in rv.headers
+    rv = client.get("/annotations/?stream=1&draft_id=draft-b", headers=auth_header)
+    assert [a["id"] for a in rv.get_json()] == ["ann-1"]
+
+
+def test_annotations_of_other_users_are_hidden(client, auth_header):
+    """Failure case: another user's draft is 404 and its annotations are not listed."""
+    with client.application.app_context():
+        db.session.add(Annotation(id="theirs", draft_id="other-draft"))
+        db.session.add(Annotation(id="mine", draft_id="draft-uuid"))
+        db.session.commit()
+    rv = client.get("/annotations/?draft_id=other-draft", headers=auth_header)
+    assert rv.status_code == 404
+    rv = client.post(
+        "/annotations/", json={"draft_id": "other-draft"}, headers=auth_header
+    )
+    assert rv.status_code == 404
+    rv = client.get("/annotations/", headers=auth_header)
+    assert [a["id"] for a in rv.get_json()] == ["mine"]
@@ -73,3 +73,37 @@ def test_login_missing_fields(test_client):
     resp = test_client.post("/auth/login", json={"email": ""})
     assert resp.status_code == 400
     assert resp.get_json()["error"] == "Validation error"
+
+
+def test_login_rehashes_outdated_hash(test_client, create_user):
+    """Normal case: a hash made with an old algorithm is upgraded on login."""
+    app = test_client.application
+    app.config.update(PASSWORD_HASH_ALGORITHM="pbkdf2", PASSWORD_HASH_COST=1000)
+    user = create_user("user@example.com", "password123")
+    assert user.password_hash.startswith("pbkdf2:sha256:1000$")
+    app.config.update(PASSWORD_HASH_ALGORITHM="scrypt", PASSWORD_HASH_COST=1024)
+    resp = test_client.post(
+        "/auth/login", json={"email": "user@example.com", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    db.session.refresh(user)
+    assert user.password_hash.startswith("scrypt:1024:8:1$")
+    assert not AuthService.needs_rehash(user.password_hash)
+
+
+def test_login_busy_returns_503(test_client, create_user, monkeypatch):
+    """Failure case: a saturated hashing pool sheds load with 503."""
+    from backend.app.services.password_hasher import HasherBusy
+
+    create_user("user@example.com", "password123")
+    hasher = test_client.application.extensions["password_hasher"]
+
+    def busy(fn, *args):
+        raise HasherBusy("full")
+
+    monkeypatch.setattr(hasher, "run", busy)
+    resp = test_client.post(
+        "/auth/login", json={"email": "user@example.com", "password": "password123"}
+    )
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
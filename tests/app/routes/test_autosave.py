@@ -5,6 +5,10 @@ Unit tests for POST /autosave endpoint.
 import pytest
 from backend.app import create_app, db
 from backend.models.autosave_version import AutosaveVersion
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
 from flask_jwt_extended import create_access_token, JWTManager
 
 
@@ -15,6 +19,23 @@ def client():
     with app.test_client() as client:
         with app.app_context():
             db.create_all()
+            for user, suffix in (("testuser", "uuid"), ("otheruser", "other")):
+                db.session.add(Project(id=f"p-{suffix}", user_id=user, title="P"))
+                db.session.add(
+                    Chapter(
+                        id=f"c-{suffix}", project_id=f"p-{suffix}", title="C", order=1
+                    )
+                )
+                db.session.add(
+                    Scene(
+                        id=f"scene-{suffix}",
+                        chapter_id=f"c-{suffix}",
+                        title="S",
+                        order=1,
+                    )
+                )
+                db.session.add(Draft(id=f"draft-{suffix}", scene_id=f"scene-{suffix}"))
+            db.session.commit()
         yield client
         with app.app_context():
             db.drop_all()
@@ -74,3 +95,140 @@ def test_post_autosave_deduplication(client, auth_header):
     # Should return same content and scene_id
     assert rv2.get_json()["scene_id"] == "scene-uuid"
     assert rv2.get_json()["content"] == "Deduped content."
+
+
+def test_get_autosave_rebuilds_delta_version(client, auth_header):
+    """Normal case: a delta-stored version is returned with full content."""
+    base = "A long scene. " * 100
+    rv1 = client.post(
+        "/autosave/",
+        json={"scene_id": "scene-uuid", "content": base},
+        headers=auth_header,
+    )
+    rv2 = client.post(
+        "/autosave/",
+        json={"scene_id": "scene-uuid", "content": base + "One more line."},
+        headers=auth_header,
+    )
+    assert rv2.status_code == 201
+    with client.application.app_context():
+        stored = db.session.get(AutosaveVersion, rv2.get_json()["id"])
+        assert stored.content is None
+        assert stored.delta is not None
+    rv = client.get(f"/autosave/{rv2.get_json()['id']}", headers=auth_header)
+    assert rv.status_code == 200
+    assert rv.get_json()["content"] == base + "One more line."
+    rv = client.get(f"/autosave/{rv1.get_json()['id']}", headers=auth_header)
+    assert rv.get_json()["content"] == base
+
+
+def test_get_autosave_not_found(client, auth_header):
+    """Failure case: unknown version id returns 404."""
+    rv = client.get("/autosave/doesnotexist", headers=auth_header)
+    assert rv.status_code == 404
+    assert "error" in rv.get_json()
+
+
+def test_post_autosave_dedupe_never_reads_content(client, auth_header):
+    """Edge case: the duplicate check compares hashes without loading text."""
+    import re
+    from sqlalchemy import event
+
+    data = {"scene_id": "scene-uuid", "content": "Long text. " * 500}
+    assert client.post("/autosave/", json=data, headers=auth_header).status_code == 201
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with client.application.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        rv = client.post("/autosave/", json=data, headers=auth_header)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert rv.status_code == 200
+    assert rv.get_json()["content"] == data["content"]
+    assert len(statements) == 1
+    assert not re.search(r"autosave_versions\.content\b(?!_)", statements[0])
+
+
+def test_autosave_history_of_other_users_scene_is_hidden(client, auth_header):
+    """Failure case: another user's scene or draft history is a 404."""
+    app = client.application
+    with app.app_context():
+        token = create_access_token(identity="otheruser")
+    other_header = {"Authorization": f"Bearer {token}"}
+    rv = client.post(
+        "/autosave/",
+        json={"scene_id": "scene-other", "content": "Private prose."},
+        headers=other_header,
+    )
+    version_id = rv.get_json()["id"]
+    for url in (
+        "/autosave/?scene_id=scene-other",
+        "/autosave/?draft_id=draft-other",
+        f"/autosave/{version_id}",
+    ):
+        rv = client.get(url, headers=auth_header)
+        assert rv.status_code == 404, url
+        assert "Private prose." not in rv.get_data(as_text=True)
+    assert (
+        client.get(f"/autosave/{version_id}", headers=other_header).status_code == 200
+    )
+
+
+def test_post_autosave_to_other_users_scene(client, auth_header):
+    """Failure case: saving into another user's scene or draft is a 404."""
+    for payload in (
+        {"scene_id": "scene-other", "content": "Intrusion."},
+        {"draft_id": "draft-other", "content": "Intrusion."},
+        {"scene_id": "scene-uuid", "draft_id": "draft-other", "content": "Intrusion."},
+    ):
+        rv = client.post("/autosave/", json=payload, headers=auth_header)
+        assert rv.status_code == 404, payload
+    with client.application.app_context():
+        assert AutosaveVersion.query.count() == 0
+
+
+def test_post_autosave_batch(client, auth_header):
+    """Normal case: one request stores every frame and acknowledges each in order."""
+    base = "The harbour lights came on one by one. " * 20
+    frames = [
+        {"scene_id": "scene-uuid", "content": base},
+        {"scene_id": "scene-uuid", "content": base + "Then the rain."},
+        {"scene_id": "scene-uuid", "content": base + "Then the rain."},
+        {"draft_id": "draft-uuid", "content": "Draft text."},
+    ]
+    rv = client.post("/autosave/batch", json={"frames": frames}, headers=auth_header)
+    assert rv.status_code == 200
+    acks = rv.get_json()["frames"]
+    assert [ack["status"] for ack in acks] == [
+        "created",
+        "created",
+        "duplicate",
+        "created",
+    ]
+    assert acks[2]["id"] == acks[1]["id"]
+    with client.application.app_context():
+        second = db.session.get(AutosaveVersion, acks[1]["id"])
+        assert second.delta is not None and second.chain_index == 1
+    rv = client.get(f"/autosave/{acks[1]['id']}", headers=auth_header)
+    assert rv.get_json()["content"] == base + "Then the rain."
+
+
+def test_post_autosave_batch_failures(client, auth_header):
+    """Failure case: a bad or foreign frame rejects the whole batch."""
+    owned = {"scene_id": "scene-uuid", "content": "Mine."}
+    for body, status in (
+        ({"frames": []}, 400),
+        ({"frames": [owned, {"scene_id": "scene-uuid"}]}, 400),
+        ({"frames": [owned, {"content": "No ids."}]}, 400),
+        ({"frames": [owned] * 101}, 400),
+        ({"frames": [owned, {"draft_id": "draft-other", "content": "Not mine."}]}, 404),
+    ):
+        rv = client.post("/autosave/batch", json=body, headers=auth_header)
+        assert rv.status_code == status, body
+    with client.application.app_context():
+        assert AutosaveVersion.query.count() == 0
@@ -5,6 +5,7 @@ Unit tests for GET/POST/PUT /chapters endpoints.
 import pytest
 from backend.app import create_app, db
 from backend.app.services.auth_service import AuthService
+from backend.app.utils.rank import encode_position
 from backend.models.user import User
 from backend.models.project import Project
 from backend.models.chapter import Chapter
@@ -33,21 +34,9 @@ def test_client():
 
 
 @pytest.fixture
-def auth_header_and_project():
-    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
-    with app.app_context():
-        from backend.models import (
-            User,
-            Project,
-            Chapter,
-            Scene,
-            Draft,
-            Annotation,
-            AutosaveVersion,
-            Export,
-        )
-
-        db.create_all()
+def auth_header_and_project(test_client):
+    # Reason: Seed the client's own database so the project is owned by the caller
+    with test_client.application.app_context():
         user = User(
             id=str(uuid.uuid4()),
             email="chapteruser@example.com",
@@ -83,7 +72,8 @@ def test_create_chapter_success(test_client, auth_header_and_project):
     assert resp.status_code == 201
     result = resp.get_json()
     assert result["title"] == "Chapter 1"
-    assert result["order"] == 1
+    assert result["rank"] == encode_position(1)
+    assert "order" not in result
     # Confirm chapter is created
     with test_client.application.app_context():
         chapter = db.session.query(Chapter).filter_by(project_id=project_id).first()
@@ -117,7 +107,7 @@ def test_update_chapter_success(test_client, auth_header_and_project):
     assert resp.status_code == 200
     result = resp.get_json()
     assert result["title"] == "New Title"
-    assert result["order"] == 2
+    assert result["rank"] == encode_position(2)
 
 
 def test_update_chapter_not_found(test_client, auth_header_and_project):
@@ -143,3 +133,20 @@ def test_update_chapter_invalid_input(test_client, auth_header_and_project):
     resp = test_client.put(f"/chapters/{cid}", json={"title": ""}, headers=headers)
     assert resp.status_code == 400
     assert resp.get_json()["error"] == "Validation error"
+
+
+def test_create_chapter_in_other_users_project(test_client, auth_header_and_project):
+    """Failure case: creating a chapter in another user's project is a 404."""
+    headers, _, _ = auth_header_and_project
+    other_project_id = str(uuid.uuid4())
+    with test_client.application.app_context():
+        db.session.add(
+            Project(id=other_project_id, user_id="other-user", title="Other")
+        )
+        db.session.commit()
+    data = {"project_id": other_project_id, "title": "Chapter 1", "order": 1}
+    resp = test_client.post("/chapters/", json=data, headers=headers)
+    assert resp.status_code == 404
+    assert resp.get_json()["error"] == "Project not found"
+    with test_client.application.app_context():
+        assert Chapter.query.count() == 0
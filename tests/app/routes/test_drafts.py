@@ -4,7 +4,10 @@ Unit tests for GET/POST /drafts/ endpoint.
 
 import pytest
 from backend.app import create_app, db
+from backend.models.chapter import Chapter
 from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
 from flask_jwt_extended import create_access_token, JWTManager
 
 
@@ -15,11 +18,28 @@ def client():
     with app.test_client() as client:
         with app.app_context():
             db.create_all()
+            _seed_scenes("testuser", ["scene-uuid", "scene-a", "scene-b"])
+            _seed_scenes("otheruser", ["other-scene"])
         yield client
         with app.app_context():
             db.drop_all()
 
 
+def _seed_scenes(user_id, scene_ids):
+    """Scenes inside a project owned by user_id."""
+    db.session.add(Project(id=f"{user_id}-project", user_id=user_id, title="P"))
+    db.session.add(
+        Chapter(
+            id=f"{user_id}-chapter", project_id=f"{user_id}-project", title="C", order=1
+        )
+    )
+    for i, scene_id in enumerate(scene_ids):
+        db.session.add(
+            Scene(id=scene_id, chapter_id=f"{user_id}-chapter", title="S", order=i)
+        )
+    db.session.commit()
+
+
 @pytest.fixture
 def auth_header(client):
     app = client.application
@@ -58,3 +78,82 @@ def test_post_draft_empty_content(client, auth_header):
     rv = client.post("/drafts/", json=data, headers=auth_header)
     assert rv.status_code == 201
     assert rv.get_json()["content"] == ""
+
+
+def _seed_drafts(app, count, scene_id="scene-uuid"):
+    from datetime import datetime, timedelta
+
+    base = datetime(2025, 1, 1)
+    with app.app_context():
+        for i in range(count):
+            db.session.add(
+                Draft(
+                    id=f"{scene_id}-draft-{i:03d}",
+                    scene_id=scene_id,
+                    content=f"Draft {i}",
+                    created_at=base + timedelta(seconds=i // 2),
+                )
+            )
+        db.session.commit()
+
+
+def test_get_drafts_keyset_pagination(client, auth_header):
+    """Normal case: following X-Next-Cursor walks every draft exactly once."""
+    _seed_drafts(client.application, 7)
+    seen = []
+    cursor = None
+    for _ in range(10):
+        url = "/drafts/?limit=3" + (f"&cursor={cursor}" if cursor else "")
+        rv = client.get(url, headers=auth_header)
+        assert rv.status_code == 200
+        seen.extend(d["id"] for d in rv.get_json())
+        cursor = rv.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == [f"scene-uuid-draft-{i:03d}" for i in range(7)]
+
+
+def test_get_drafts_filter_by_scene(client, auth_header):
+    """Normal case: scene_id filter limits results to one scene."""
+    _seed_drafts(client.application, 2, scene_id="scene-a")
+    _seed_drafts(client.application, 3, scene_id="scene-b")
+    rv = client.get("/drafts/?scene_id=scene-b", headers=auth_header)
+    assert rv.status_code == 200
+    assert {d["scene_id"] for d in rv.get_json()} == {"scene-b"}
+    assert len(rv.get_json()) == 3
+
+
+def test_get_drafts_stream(client, auth_header):
+    """Normal case: stream mode returns every draft as one JSON array."""
+    _seed_drafts(client.application, 5)
+    rv = client.get("/drafts/?stream=true", headers=auth_header)
+    assert rv.status_code == 200
+    assert rv.is_streamed
+    assert [d["id"] for d in rv.get_json()] == [
+        f"scene-uuid-draft-{i:03d}" for i in range(5)
+    ]
+
+
+def test_get_drafts_invalid_pagination(client, auth_header):
+    """Failure case: bad limit or cursor returns 400."""
+    assert client.get("/drafts/?limit=0", headers=auth_header).status_code == 400
+    assert client.get("/drafts/?limit=abc", headers=auth_header).status_code == 400
+    rv = client.get("/drafts/?cursor=not-a-cursor", headers=auth_header)
+    assert rv.status_code == 400
+    assert "error" in rv.get_json()
+
+
+def test_drafts_of_other_users_are_hidden(client, auth_header):
+    """Failure case: another user's scene is 404 and its drafts are not listed."""
+    _seed_drafts(client.application, 2, scene_id="other-scene")
+    _seed_drafts(client.application, 1)
+    rv = client.get("/drafts/?scene_id=other-scene", headers=auth_header)
+    assert rv.status_code == 404
+    rv = client.post(
+        "/drafts/",
+        json={"scene_id": "other-scene", "content": "x"},
+        headers=auth_header,
+    )
+    assert rv.status_code == 404
+    rv = client.get("/drafts/", headers=auth_header)
+    assert [d["scene_id"] for d in rv.get_json()] == ["scene-uuid"]
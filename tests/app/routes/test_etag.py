@@ -0,0 +1,142 @@
+"""
+Unit tests for ETag / If-None-Match handling on the list and timeline routes.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+URLS = (
+    "/projects/",
+    "/chapters/?project_id=proj",
+    "/scenes/?chapter_id=c1",
+    "/timeline/proj",
+)
+
+
+@pytest.fixture
+def app():
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "RANK_REBALANCE_ASYNC": False,
+        }
+    )
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.add(Chapter(id="c1", project_id="proj", title="Ch", order=1))
+        for s in (1, 2):
+            db.session.add(Scene(id=f"s{s}", chapter_id="c1", title="Sc", order=s))
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+def _headers(app, user_id="user-1", etag=None):
+    with app.app_context():
+        token = AuthService.generate_token(user_id)
+    headers = {"Authorization": f"Bearer {token}"}
+    if etag:
+        headers["If-None-Match"] = f'"{etag}"'
+    return headers
+
+
+def _statements(app, request):
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        resp = request()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return resp, statements
+
+
+@pytest.mark.parametrize("url", URLS)
+def test_matching_etag_returns_304_without_loading_rows(app, url):
+    """Normal case: a matching If-None-Match answers 304 from one aggregate."""
+    client = app.test_client()
+    first = client.get(url, headers=_headers(app))
+    assert first.status_code == 200
+    etag = first.get_etag()[0]
+    assert etag
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    resp, statements = _statements(
+        app, lambda: client.get(url, headers=_headers(app, etag=etag))
+    )
+    assert resp.status_code == 304
+    assert resp.get_data() == b""
+    assert resp.get_etag()[0] == etag
+    assert len(statements) < 3
+    assert all("count(" in s.lower() or "where" in s.lower() for s in statements)
+
+
+@pytest.mark.parametrize("url", URLS)
+def test_stale_etag_returns_full_body(app, url):
+    """Edge case: a non-matching validator gets a 200 with the body."""
+    client = app.test_client()
+    resp = client.get(url, headers=_headers(app, etag="stale"))
+    assert resp.status_code == 200
+    assert resp.get_json()
+
+
+def test_etag_changes_on_update_insert_and_reorder(app):
+    """Normal case: writes to the collection invalidate its ETag."""
+    client = app.test_client()
+    headers = _headers(app)
+
+    def etags():
+        return {url: client.get(url, headers=headers).get_etag()[0] for url in URLS}
+
+    before = etags()
+    assert etags() == before
+
+    client.put("/scenes/s1", json={"title": "Renamed"}, headers=headers)
+    after_update = etags()
+    assert after_update["/scenes/?chapter_id=c1"] != before["/scenes/?chapter_id=c1"]
+    assert after_update["/timeline/proj"] != before["/timeline/proj"]
+
+    client.post(
+        "/scenes/reorder",
+        json={"moves": [{"id": "s2", "before": "s1"}]},
+        headers=headers,
+    )
+    after_reorder = etags()
+    assert (
+        after_reorder["/scenes/?chapter_id=c1"]
+        != after_update["/scenes/?chapter_id=c1"]
+    )
+
+    with app.app_context():
+        db.session.add(Chapter(id="c2", project_id="proj", title="Two", order=2))
+        db.session.commit()
+    after_insert = etags()
+    assert (
+        after_insert["/chapters/?project_id=proj"]
+        != after_reorder["/chapters/?project_id=proj"]
+    )
+    assert after_insert["/timeline/proj"] != after_reorder["/timeline/proj"]
+
+
+def test_etag_differs_per_user(app):
+    """Edge case: two users with empty lists never share a validator."""
+    client = app.test_client()
+    one = client.get("/projects/", headers=_headers(app, "user-2"))
+    two = client.get("/projects/", headers=_headers(app, "user-3"))
+    assert one.get_json() == two.get_json() == []
+    assert one.get_etag()[0] != two.get_etag()[0]
+    assert "Authorization" in one.headers["Vary"]
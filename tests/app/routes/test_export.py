@@ -12,8 +12,14 @@ from datetime import datetime
 
 
 @pytest.fixture
-def client():
-    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+def client(tmp_path):
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "DOCS_EXPORT_PATH": str(tmp_path / "exports"),
+        }
+    )
     JWTManager(app)
     with app.test_client() as client:
         with app.app_context():
@@ -88,3 +94,135 @@ def test_post_export_no_project(client, auth_header):
     rv = client.post("/export/doesnotexist", json=data, headers=auth_header)
     assert rv.status_code == 404
     assert "error" in rv.get_json()
+
+
+def test_post_export_other_users_project(client, auth_header):
+    """Failure case: another user's project is not exported."""
+    with client.application.app_context():
+        db.session.add(Project(id="proj-theirs", user_id="other-user", title="Theirs"))
+        db.session.commit()
+    rv = client.post(
+        "/export/proj-theirs", json={"export_type": "docx"}, headers=auth_header
+    )
+    assert rv.status_code == 404
+    with client.application.app_context():
+        assert Export.query.count() == 0
+
+
+def _seed_manuscript(app):
+    from backend.models.chapter import Chapter
+    from backend.models.scene import Scene
+
+    with app.app_context():
+        db.session.add(Project(id="proj-book", user_id="user-uuid", title="The Book"))
+        db.session.add(Chapter(id="c2", project_id="proj-book", title="Two", order=2))
+        db.session.add(Chapter(id="c1", project_id="proj-book", title="One", order=1))
+        db.session.add(Chapter(id="c3", project_id="proj-book", title="Empty", order=3))
+        db.session.add(
+            Scene(
+                id="s2",
+                chapter_id="c1",
+                title="Second scene",
+                content="Later & <tagged>.",
+                order=2,
+            )
+        )
+        db.session.add(
+            Scene(
+                id="s1",
+                chapter_id="c1",
+                title="First scene",
+                content="It began.\n\nThen it rained.",
+                order=1,
+            )
+        )
+        db.session.add(
+            Scene(id="s3", chapter_id="c2", title="Third", content=None, order=1)
+        )
+        db.session.commit()
+
+
+def test_post_export_docx_full_manuscript(client, auth_header):
+    """Normal case: docx contains every chapter and scene in order."""
+    import io
+    from docx import Document
+
+    _seed_manuscript(client.application)
+    rv = client.post(
+        "/export/proj-book", json={"export_type": "docx"}, headers=auth_header
+    )
+    assert rv.status_code == 200
+    document = Document(io.BytesIO(rv.data))
+    paragraphs = [(p.style.name, p.text) for p in document.paragraphs]
+    assert paragraphs == [
+        ("Title", "The Book"),
+        ("Heading 1", "One"),
+        ("Heading 2", "First scene"),
+        ("Normal", "It began."),
+        ("Normal", "Then it rained."),
+        ("Heading 2", "Second scene"),
+        ("Normal", "Later & <tagged>."),
+        ("Heading 1", "Two"),
+        ("Heading 2", "Third"),
+        ("Heading 1", "Empty"),
+    ]
+
+
+def test_post_export_pdf_full_manuscript(client, auth_header):
+    """Normal case: a long manuscript renders to a multi-page pdf."""
+    import re
+    from backend.models.chapter import Chapter
+    from backend.models.scene import Scene
+
+    with client.application.app_context():
+        db.session.add(Project(id="proj-long", user_id="user-uuid", title="Long"))
+        db.session.add(Chapter(id="c1", project_id="proj-long", title="One", order=1))
+        db.session.add(
+            Scene(
+                id="s1",
+                chapter_id="c1",
+                title="Scene",
+                content="A line of prose that keeps going.\n" * 300,
+                order=1,
+            )
+        )
+        db.session.commit()
+    rv = client.post(
+        "/export/proj-long", json={"export_type": "pdf"}, headers=auth_header
+    )
+    assert rv.status_code == 200
+    assert rv.mimetype == "application/pdf"
+    assert rv.data.startswith(b"%PDF")
+    assert len(re.findall(rb"/Type /Page[^s]", rv.data)) > 1
+
+
+def test_post_export_cache_hit_and_invalidation(client, auth_header):
+    """Normal case: repeat exports hit the cache until the manuscript changes."""
+    from backend.models.scene import Scene
+
+    _seed_manuscript(client.application)
+    first = client.post(
+        "/export/proj-book", json={"export_type": "docx"}, headers=auth_header
+    )
+    second = client.post(
+        "/export/proj-book", json={"export_type": "docx"}, headers=auth_header
+    )
+    assert first.headers["X-Export-Cache"] == "miss"
+    assert second.headers["X-Export-Cache"] == "hit"
+    assert second.data == first.data
+    with client.application.app_context():
+        scene = db.session.get(Scene, "s1")
+        scene.content = "Rewritten."
+        db.session.commit()
+    third = client.post(
+        "/export/proj-book", json={"export_type": "docx"}, headers=auth_header
+    )
+    assert third.headers["X-Export-Cache"] == "miss"
+    with client.application.app_context():
+        hits = [
+            e.cache_hit
+            for e in Export.query.filter_by(project_id="proj-book").order_by(
+                Export.created_at
+            )
+        ]
+    assert hits == [False, True, False]
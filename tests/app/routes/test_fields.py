@@ -0,0 +1,178 @@
+"""
+Unit tests for ?fields= sparse fieldsets and deferred content loading.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.services.autosave_service import AutosaveService
+from backend.app.utils.rank import encode_position
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.add(Chapter(id="c1", project_id="proj", title="Ch", order=1))
+        for s in (1, 2, 3):
+            db.session.add(
+                Scene(
+                    id=f"s{s}",
+                    chapter_id="c1",
+                    title=f"Scene {s}",
+                    content="x" * 10000,
+                    order=s,
+                )
+            )
+            db.session.add(Draft(id=f"d{s}", scene_id="s1", content="draft " * 500))
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _reads(column, statements):
+    """True if any statement selects exactly this column (not a prefix)."""
+    pattern = re.compile(re.escape(column) + r"\b")
+    return any(pattern.search(statement) for statement in statements)
+
+
+def _selects(app, request):
+    """Run request and return (response, SELECT statements executed)."""
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        resp = request()
+        resp.get_data()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return resp, statements
+
+
+def test_scene_fields_skip_content(app, auth_header):
+    """Normal case: a sidebar fieldset neither loads nor returns content."""
+    client = app.test_client()
+    resp, selects = _selects(
+        app,
+        lambda: client.get(
+            "/scenes/?chapter_id=c1&fields=id,title,rank", headers=auth_header
+        ),
+    )
+    assert resp.status_code == 200
+    assert resp.get_json()[0] == {
+        "id": "s1",
+        "rank": encode_position(1),
+        "title": "Scene 1",
+    }
+    assert not _reads("scenes.content", selects)
+    full = client.get("/scenes/?chapter_id=c1", headers=auth_header)
+    assert len(resp.get_data()) * 50 < len(full.get_data())
+    assert full.get_json()[0]["content"] == "x" * 10000
+
+
+def test_fieldsets_change_the_etag(app, auth_header):
+    """Edge case: different fieldsets never share a validator."""
+    client = app.test_client()
+    sparse = client.get("/chapters/?project_id=proj&fields=id", headers=auth_header)
+    full = client.get("/chapters/?project_id=proj", headers=auth_header)
+    assert sparse.get_json() == [{"id": "c1"}]
+    assert sparse.get_etag()[0] != full.get_etag()[0]
+    projects = client.get("/projects/?fields=title", headers=auth_header)
+    assert projects.get_json() == [{"title": "Book"}]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/projects/?fields=id,secret",
+        "/chapters/?project_id=proj&fields=content",
+        "/scenes/?chapter_id=c1&fields=nope",
+        "/drafts/?fields=id,password",
+        "/annotations/?fields=body",
+        "/autosave/?scene_id=s1&fields=delta",
+    ],
+)
+def test_unknown_fields_rejected(app, auth_header, url):
+    """Failure case: unknown field names return 400."""
+    resp = app.test_client().get(url, headers=auth_header)
+    assert resp.status_code == 400
+    assert "Unknown fields" in resp.get_json()["error"]
+
+
+def test_draft_pages_and_stream_defer_content(app, auth_header):
+    """Normal case: paginated and streamed drafts honour fields."""
+    client = app.test_client()
+    resp, selects = _selects(
+        app,
+        lambda: client.get(
+            "/drafts/?fields=id,created_at&limit=2", headers=auth_header
+        ),
+    )
+    assert [set(d) for d in resp.get_json()] == [{"id", "created_at"}] * 2
+    assert "X-Next-Cursor" in resp.headers
+    assert not _reads("drafts.content", selects)
+    streamed, selects = _selects(
+        app,
+        lambda: client.get("/drafts/?fields=id&stream=true", headers=auth_header),
+    )
+    assert sorted(d["id"] for d in streamed.get_json()) == ["d1", "d2", "d3"]
+    assert not _reads("drafts.content", selects)
+
+
+def test_autosave_history_rebuilds_content_only_when_asked(app, auth_header):
+    """Normal case: version lists skip the text unless content is requested."""
+    client = app.test_client()
+    texts = ["Once upon a time.", "Once upon a time, there.", "Once upon a dream."]
+    for text in texts:
+        with app.app_context():
+            version = AutosaveService.save_snapshot(
+                text,
+                scene_id="s1",
+                previous=AutosaveService.latest(scene_id="s1"),
+            )
+            assert version is not None
+    meta, selects = _selects(
+        app,
+        lambda: client.get(
+            "/autosave/?scene_id=s1&fields=id,saved_at", headers=auth_header
+        ),
+    )
+    assert meta.status_code == 200
+    assert [set(v) for v in meta.get_json()] == [{"id", "saved_at"}] * 3
+    assert not _reads("autosave_versions.content", selects)
+    assert not _reads("autosave_versions.delta", selects)
+    full, selects = _selects(
+        app, lambda: client.get("/autosave/?scene_id=s1", headers=auth_header)
+    )
+    assert [v["content"] for v in full.get_json()] == texts[::-1]
+    assert len(selects) <= 2
+
+
+def test_autosave_history_requires_target(app, auth_header):
+    """Failure case: listing versions needs scene_id or draft_id."""
+    resp = app.test_client().get("/autosave/", headers=auth_header)
+    assert resp.status_code == 400
@@ -0,0 +1,269 @@
+"""
+Unit tests for POST /import/ endpoint.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.utils.rank import encode_position
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+MARKDOWN = """# Chapter One
+
+## Arrival
+The train was late.
+
+## Departure
+She left at dawn.
+
+# Chapter Two
+Text before any scene heading.
+"""
+
+
+@pytest.fixture
+def app():
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "IMPORT_BATCH_SIZE": 2,
+        }
+    )
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _tree(app, project_id):
+    with app.app_context():
+        chapters = (
+            Chapter.query.filter_by(project_id=project_id).order_by(Chapter.rank).all()
+        )
+        return [
+            (
+                c.title,
+                [
+                    (s.title, s.content)
+                    for s in Scene.query.filter_by(chapter_id=c.id).order_by(Scene.rank)
+                ],
+            )
+            for c in chapters
+        ]
+
+
+def test_import_markdown(app, auth_header):
+    """Normal case: '#' chapters and '##' scenes become a new project."""
+    resp = app.test_client().post(
+        "/import/?format=markdown&title=Novel",
+        data=MARKDOWN,
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    result = resp.get_json()
+    assert result["chapters"] == 2 and result["scenes"] == 3
+    assert _tree(app, result["project_id"]) == [
+        (
+            "Chapter One",
+            [("Arrival", "The train was late."), ("Departure", "She left at dawn.")],
+        ),
+        ("Chapter Two", [("Scene 1", "Text before any scene heading.")]),
+    ]
+    with app.app_context():
+        project = db.session.get(Project, result["project_id"])
+        assert (project.title, project.user_id) == ("Novel", "user-1")
+
+
+def test_import_fountain_by_content_type(app, auth_header):
+    """Normal case: Fountain sections and scene headings; title page sets title."""
+    script = (
+        "Title: The Heist\nAuthor: Someone\n\n# Act One\n\n"
+        "INT. BANK - DAY\n\nA guard yawns.\n\n.FLASHBACK\n\nYears earlier.\n"
+    )
+    resp = app.test_client().post(
+        "/import/",
+        data=script,
+        content_type="text/x-fountain",
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    result = resp.get_json()
+    assert result["format"] == "fountain"
+    tree = _tree(app, result["project_id"])
+    assert tree[0][0] == "Act One"
+    assert [title for title, _ in tree[0][1]] == ["INT. BANK - DAY", "FLASHBACK"]
+    with app.app_context():
+        assert db.session.get(Project, result["project_id"]).title == "The Heist"
+
+
+def test_import_plain_text_separators(app, auth_header):
+    """Normal case: 'Chapter N' lines and '* * *' breaks split the text."""
+    text = "Chapter 1\nPart of me stayed.\n* * *\nLater.\nCHAPTER TWO: End\nFin.\n"
+    resp = app.test_client().post("/import/", data=text, headers=auth_header)
+    assert resp.status_code == 201
+    tree = _tree(app, resp.get_json()["project_id"])
+    assert tree == [
+        ("Chapter 1", [("Scene 1", "Part of me stayed."), ("Scene 2", "Later.")]),
+        ("CHAPTER TWO: End", [("Scene 1", "Fin.")]),
+    ]
+
+
+def test_import_batches_inserts_in_one_transaction(app, auth_header):
+    """Edge case: rows go out in multi-row INSERT batches with a single commit."""
+    body = "".join(f"# C{c}\n" + "## S\nx\n" * 5 for c in range(3))
+    with app.app_context():
+        engine = db.engine
+    statements, commits = [], []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.startswith("INSERT INTO scenes"):
+            statements.append(many)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+    try:
+        resp = app.test_client().post(
+            "/import/?format=markdown", data=body, headers=auth_header
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert resp.status_code == 201
+    assert resp.get_json()["scenes"] == 15
+    # Reason: IMPORT_BATCH_SIZE=2 -> 8 batched statements for 15 scenes
+    assert len(statements) == 8 and all(statements[:-1])
+    assert len(commits) == 1
+
+
+def test_import_appends_to_existing_project(app, auth_header):
+    """Normal case: project_id appends chapters after the existing ones."""
+    with app.app_context():
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.add(Chapter(id="c1", project_id="proj", title="Old", order=4))
+        db.session.commit()
+    resp = app.test_client().post(
+        "/import/?format=markdown&project_id=proj",
+        data="# New\nText.\n",
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    assert [title for title, _ in _tree(app, "proj")] == ["Old", "New"]
+
+
+def test_import_appends_after_moved_chapters(app, auth_header):
+    """Edge case: appends follow the last rank, even after a reorder."""
+    with app.app_context():
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        for c in (1, 2, 3):
+            db.session.add(
+                Chapter(id=f"c{c}", project_id="proj", title=f"C{c}", order=c)
+            )
+        db.session.commit()
+    client = app.test_client()
+    resp = client.post(
+        "/chapters/reorder", json={"moves": [{"id": "c1"}]}, headers=auth_header
+    )
+    assert resp.status_code == 200
+    for title in ("New", "Newer"):
+        resp = client.post(
+            "/import/?format=markdown&project_id=proj",
+            data=f"# {title}\nText.\n",
+            headers=auth_header,
+        )
+        assert resp.status_code == 201
+    titles = [title for title, _ in _tree(app, "proj")]
+    assert titles == ["C2", "C3", "C1", "New", "Newer"]
+
+
+def test_import_appended_ranks_stay_bounded(app, auth_header):
+    """Edge case: thousands of appended chapters get fixed-width ranks, in order."""
+    app.config.update(IMPORT_BATCH_SIZE=500)
+    with app.app_context():
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.add(Chapter(id="c1", project_id="proj", title="Old", order=1))
+        db.session.commit()
+    body = "".join(f"# Part {i}\nText.\n" for i in range(3000))
+    resp = app.test_client().post(
+        "/import/?format=markdown&project_id=proj", data=body, headers=auth_header
+    )
+    assert resp.status_code == 201
+    assert resp.get_json()["rebalancing"] == []
+    with app.app_context():
+        ranks = [c.rank for c in Chapter.query.filter(Chapter.id != "c1")]
+        assert {len(rank) for rank in ranks} == {2 * len(encode_position(1))}
+        titles = [
+            c.title
+            for c in Chapter.query.filter_by(project_id="proj").order_by(Chapter.rank)
+        ]
+    assert titles == ["Old"] + [f"Part {i}" for i in range(3000)]
+
+
+def test_import_rebalances_long_appended_ranks(app, auth_header):
+    """Edge case: appended ranks past RANK_REBALANCE_LENGTH are renumbered."""
+    app.config.update(RANK_REBALANCE_LENGTH=1)
+    with app.app_context():
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.add(Chapter(id="c1", project_id="proj", title="Old", order=1))
+        db.session.commit()
+    body = "".join(f"# Part {i}\nText.\n" for i in range(10))
+    resp = app.test_client().post(
+        "/import/?format=markdown&project_id=proj", data=body, headers=auth_header
+    )
+    assert resp.status_code == 201
+    assert resp.get_json()["rebalancing"] == ["proj"]
+    app.extensions["rank_rebalancer"].wait()
+    titles = [title for title, _ in _tree(app, "proj")]
+    assert titles == ["Old"] + [f"Part {i}" for i in range(10)]
+    with app.app_context():
+        assert max(len(c.rank) for c in Chapter.query) == len(encode_position(1))
+
+
+def test_import_rejects_other_users_project(app, auth_header):
+    """Failure case: appending to another user's project is a 404."""
+    with app.app_context():
+        db.session.add(Project(id="proj", user_id="user-2", title="Theirs"))
+        db.session.commit()
+    resp = app.test_client().post(
+        "/import/?format=markdown&project_id=proj",
+        data="# Evil\nText.\n",
+        headers=auth_header,
+    )
+    assert resp.status_code == 404
+    with app.app_context():
+        assert Chapter.query.count() == 0
+
+
+def test_import_failures(app, auth_header):
+    """Failure case: bad format, empty body, unknown project and size limit."""
+    client = app.test_client()
+    assert (
+        client.post("/import/?format=docx", data="x", headers=auth_header).status_code
+        == 400
+    )
+    resp = client.post("/import/", data="\n\n", headers=auth_header)
+    assert resp.status_code == 400
+    assert (
+        client.post(
+            "/import/?project_id=nope", data="Text", headers=auth_header
+        ).status_code
+        == 404
+    )
+    app.config["IMPORT_MAX_BYTES"] = 4
+    assert (
+        client.post("/import/", data="Too long", headers=auth_header).status_code == 413
+    )
+    with app.app_context():
+        assert Project.query.count() == 0
+        assert Chapter.query.count() == 0
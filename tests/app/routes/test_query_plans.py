@@ -0,0 +1,369 @@
+"""
+Query-plan and query-budget regression tests against seeded data.
+
+Every statement a route issues is EXPLAINed, and the test fails if a large
+table is read with a sequential scan. Every endpoint also declares the most
+SQL statements one request may issue (the query_budget marker), so an N+1
+fails here before it reaches production.
+
+Runs on in-memory SQLite by default; set QUERY_PLAN_DATABASE_URL to a
+PostgreSQL URL to check the production planner instead.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.annotation import Annotation
+from backend.models.autosave_version import AutosaveVersion
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+from backend.models.user import User
+
+DATABASE_URL = os.environ.get("QUERY_PLAN_DATABASE_URL", "sqlite:///:memory:")
+USERS = 50
+PROJECTS_PER_USER = 20
+CHAPTERS_PER_PROJECT = 2
+SCENES_PER_CHAPTER = 2
+DRAFTS_PER_SCENE = 1
+ANNOTATIONS_PER_DRAFT = 2
+LARGE_TABLES = {
+    "projects",
+    "chapters",
+    "scenes",
+    "drafts",
+    "annotations",
+    "autosave_versions",
+}
+CONTENT_HASH = AutosaveService.content_hash("Text.")
+# Reason: POST /chapters/ validates a 36-character project id
+UUID_PROJECT = "00000000-0000-4000-8000-000000000000"
+EXPLAINABLE = re.compile(r"^\s*(SELECT|UPDATE|DELETE|INSERT INTO .* SELECT|WITH)", re.I)
+
+
+def _seed():
+    """Bulk-insert a few thousand rows per hot table."""
+    base = datetime(2025, 1, 1)
+    users, projects, chapters, scenes = [], [], [], []
+    drafts, annotations, autosaves = [], [], []
+    for u in range(USERS):
+        users.append({"id": f"user-{u}", "email": f"u{u}@x.io", "password_hash": "x"})
+        for p in range(PROJECTS_PER_USER):
+            pid = f"proj-{u}-{p}"
+            at = base + timedelta(minutes=len(projects))
+            projects.append(
+                {"id": pid, "user_id": f"user-{u}", "title": pid, "created_at": at}
+            )
+            for c in range(CHAPTERS_PER_PROJECT):
+                cid = f"{pid}-c{c}"
+                chapters.append(
+                    {
+                        "id": cid,
+                        "project_id": pid,
+                        "title": cid,
+                        "order": c,
+                        "created_at": at,
+                    }
+                )
+                for s in range(SCENES_PER_CHAPTER):
+                    sid = f"{cid}-s{s}"
+                    scenes.append(
+                        {
+                            "id": sid,
+                            "chapter_id": cid,
+                            "title": sid,
+                            "content": "Text.",
+                            "order": s,
+                            "created_at": at,
+                        }
+                    )
+                    autosaves.append(
+                        {
+                            "id": f"{sid}-v0",
+                            "scene_id": sid,
+                            "content": "Text.",
+                            "content_hash": CONTENT_HASH,
+                            "saved_at": at,
+                        }
+                    )
+                    for d in range(DRAFTS_PER_SCENE):
+                        did = f"{sid}-d{d}"
+                        drafts.append(
+                            {
+                                "id": did,
+                                "scene_id": sid,
+                                "content": "Draft.",
+                                "created_at": at,
+                            }
+                        )
+                        for a in range(ANNOTATIONS_PER_DRAFT):
+                            annotations.append(
+                                {
+                                    "id": f"{did}-a{a}",
+                                    "draft_id": did,
+                                    "context": "ctx",
+                                    "highlight": "hl",
+                                    "created_at": at,
+                                }
+                            )
+    projects.append(
+        {"id": UUID_PROJECT, "user_id": "user-0", "title": "New", "created_at": base}
+    )
+    for model, rows in (
+        (User, users),
+        (Project, projects),
+        (Chapter, chapters),
+        (Scene, scenes),
+        (Draft, drafts),
+        (Annotation, annotations),
+        (AutosaveVersion, autosaves),
+    ):
+        db.session.execute(insert(model), rows)
+    db.session.commit()
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(text("ANALYZE"))
+        db.session.commit()
+
+
+def sequential_scans(connection, statement, parameters):
+    """Return the large tables read by a sequential scan in statement's plan."""
+    if connection.dialect.name == "postgresql":
+        row = connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        ).scalar()
+        plan = row if isinstance(row, list) else json.loads(row)
+        scans, stack = set(), [plan[0]["Plan"]]
+        while stack:
+            node = stack.pop()
+            if node["Node Type"] == "Seq Scan":
+                scans.add(node["Relation Name"])
+            stack.extend(node.get("Plans", []))
+    else:
+        rows = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+        scans = set()
+        for row in rows:
+            match = re.match(r"SCAN (\w+)(.*)", row[-1])
+            if match and "USING" not in match.group(2):
+                scans.add(match.group(1))
+    return scans & LARGE_TABLES
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": DATABASE_URL,
+            "DOCS_EXPORT_PATH": str(tmp_path_factory.mktemp("exports")),
+            "EXPORT_CACHE_ENABLED": False,
+        }
+    )
+    with app.app_context():
+        db.create_all()
+        _seed()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture(scope="module")
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-0")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def route(method, url, body=None, budget=None):
+    """A parametrized request with its SQL statement budget."""
+    return pytest.param(
+        method, url, body, marks=pytest.mark.query_budget(budget), id=f"{method} {url}"
+    )
+
+
+ROUTES = [
+    route("GET", "/projects/", budget=2),
+    route("PUT", "/projects/proj-0-0", {"title": "Renamed"}, budget=3),
+    route("GET", "/chapters/?project_id=proj-0-0", budget=3),
+    route("PUT", "/chapters/proj-0-0-c0", {"title": "Renamed"}, budget=4),
+    route("GET", "/scenes/?chapter_id=proj-0-0-c0", budget=3),
+    route("PUT", "/scenes/proj-0-0-c0-s0", {"title": "Renamed"}, budget=4),
+    route(
+        "PATCH",
+        "/scenes/proj-0-0-c0-s1",
+        {"base_version": 1, "ops": [{"insert": "Edited. "}]},
+        budget=5,
+    ),
+    route(
+        "POST",
+        "/scenes/reorder",
+        {"moves": [{"id": "proj-0-0-c0-s0", "after": "proj-0-0-c0-s1"}]},
+        budget=4,
+    ),
+    route(
+        "POST",
+        "/chapters/reorder",
+        {"moves": [{"id": "proj-0-0-c1", "before": "proj-0-0-c0"}]},
+        budget=4,
+    ),
+    route("GET", "/drafts/", budget=1),
+    route("GET", "/drafts/?scene_id=proj-0-0-c0-s0", budget=2),
+    route("GET", "/drafts/?stream=true", budget=1),
+    route("GET", "/annotations/", budget=1),
+    route("GET", "/annotations/?draft_id=proj-0-0-c0-s0-d0", budget=2),
+    route("GET", "/timeline/proj-0-0", budget=4),
+    route(
+        "POST",
+        "/autosave/",
+        {"scene_id": "proj-0-0-c0-s0", "content": "Text."},
+        budget=5,
+    ),
+    route(
+        "POST",
+        "/autosave/",
+        {"scene_id": "proj-0-0-c0-s1", "content": "Edited."},
+        budget=5,
+    ),
+    route(
+        "POST",
+        "/autosave/batch",
+        {
+            "frames": [
+                {"scene_id": "proj-0-0-c0-s0", "content": "Text."},
+                {"scene_id": "proj-0-0-c0-s1", "content": "Edited."},
+                {"scene_id": "proj-0-0-c0-s1", "content": "Edited again."},
+            ]
+        },
+        budget=10,
+    ),
+    route("GET", "/autosave/proj-0-0-c0-s0-v0", budget=2),
+    route("GET", "/autosave/?scene_id=proj-0-0-c0-s0", budget=3),
+    route("GET", "/scenes/?chapter_id=proj-0-0-c0&fields=id,title,rank", budget=3),
+    route("GET", "/search?project_id=proj-0-0&q=text", budget=5),
+    route("GET", "/stats/projects/proj-0-0", budget=2),
+    route("GET", "/stats/chapters/proj-0-0-c0", budget=2),
+    route("GET", "/stats/scenes/proj-0-0-c0-s0", budget=2),
+    route("PUT", "/scenes/proj-0-0-c1-s0", {"content": "Rewritten text."}, budget=7),
+    route("POST", "/export/proj-0-0", {"export_type": "pdf"}, budget=4),
+    route(
+        "POST",
+        "/auth/login",
+        {"email": "u0@x.io", "password": "wrong-password"},
+        budget=10,
+    ),
+]
+
+
+# Reason: Insert-only or query-free routes have nothing to EXPLAIN, only a budget
+BUDGET_ONLY_ROUTES = [
+    route("GET", "/", budget=0),
+    route("POST", "/projects/", {"title": "New"}, budget=2),
+    route(
+        "POST",
+        "/chapters/",
+        {"project_id": UUID_PROJECT, "title": "New", "order": 9},
+        budget=3,
+    ),
+    route(
+        "POST",
+        "/scenes/",
+        {"chapter_id": "proj-0-0-c0", "title": "New", "content": "Text.", "order": 9},
+        budget=5,
+    ),
+    route("POST", "/drafts/", {"scene_id": "proj-0-0-c0-s0", "content": "D"}, budget=3),
+    route(
+        "POST",
+        "/annotations/",
+        {"draft_id": "proj-0-0-c0-s0-d0", "context": "c", "highlight": "h"},
+        budget=3,
+    ),
+    route(
+        "POST",
+        "/auth/register",
+        {"email": "new@x.io", "password": "secret-pw"},
+        budget=3,
+    ),
+    route(
+        "POST",
+        "/import/?format=markdown",
+        "# A\n## S1\nText.\n## S2\nMore.\n",
+        budget=5,
+    ),
+    route("GET", "/autosave/buffer", budget=0),
+    route("GET", "/health/pool", budget=0),
+    route("GET", "/metrics", budget=0),
+]
+
+
+def _request(app, auth_header, method, url, body):
+    data = {"data": body} if isinstance(body, str) else {"json": body}
+    # Reason: Budgets are measured with a cold ownership cache, the worst case
+    app.extensions["ownership_cache"].clear()
+    resp = app.test_client().open(url, method=method, headers=auth_header, **data)
+    # Reason: Streamed responses only query while the body is consumed
+    resp.get_data()
+    return resp
+
+
+@pytest.mark.parametrize("method,url,body", ROUTES)
+def test_route_has_no_sequential_scans(app, auth_header, method, url, body):
+    """Regression: hot-path queries are served from indexes, not table scans."""
+    with app.app_context():
+        engine = db.engine
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and EXPLAINABLE.match(statement):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        resp = _request(app, auth_header, method, url, body)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert resp.status_code < 500
+    assert captured, f"{method} {url} issued no queries"
+    offenders = []
+    with engine.connect() as connection:
+        for statement, parameters in captured:
+            scans = sequential_scans(connection, statement, parameters)
+            if scans:
+                offenders.append(f"{sorted(scans)}: {statement}")
+    assert not offenders, "Sequential scans:\n" + "\n".join(offenders)
+
+
+def test_checker_detects_sequential_scan(app):
+    """Edge case: an unindexed filter is reported, so the suite is not vacuous."""
+    with app.app_context():
+        with db.engine.connect() as connection:
+            statement = "SELECT id FROM drafts WHERE content = 'x'"
+            assert sequential_scans(connection, statement, ()) == {"drafts"}
+
+
+@pytest.mark.parametrize("method,url,body", BUDGET_ONLY_ROUTES)
+def test_route_stays_within_query_budget(app, auth_header, method, url, body):
+    """Regression: routes with nothing to EXPLAIN still keep their budget."""
+    assert _request(app, auth_header, method, url, body).status_code < 400
+
+
+def test_every_endpoint_has_a_query_budget(app):
+    """Regression: a new endpoint fails here until it declares a budget."""
+    adapter = app.url_map.bind("localhost")
+    budgeted = set()
+    for param in ROUTES + BUDGET_ONLY_ROUTES:
+        method, url, _ = param.values
+        assert param.marks[0].args[0] is not None, f"{method} {url} has no budget"
+        budgeted.add(adapter.match(url.split("?")[0], method)[0])
+    endpoints = {rule.endpoint for rule in app.url_map.iter_rules()} - {"static"}
+    assert endpoints - budgeted == set()
@@ -0,0 +1,214 @@
+"""
+Unit tests for POST /scenes/reorder and POST /chapters/reorder.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+
+def _make_app(**config):
+    overrides = {
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "RANK_REBALANCE_ASYNC": False,
+    }
+    overrides.update(config)
+    app = create_app(overrides)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        for c in (1, 2):
+            db.session.add(Chapter(id=f"c{c}", project_id="proj", title="Ch", order=c))
+        for s in range(1, 5):
+            db.session.add(Scene(id=f"s{s}", chapter_id="c1", title="Sc", order=s))
+        db.session.commit()
+    return app
+
+
+@pytest.fixture
+def app():
+    app = _make_app()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _scene_ids(client, headers, chapter_id="c1"):
+    resp = client.get(f"/scenes/?chapter_id={chapter_id}", headers=headers)
+    return [scene["id"] for scene in resp.get_json()]
+
+
+def test_reorder_scenes_single_update(app, auth_header):
+    """Normal case: N moves are written with exactly one UPDATE statement."""
+    with app.app_context():
+        engine = db.engine
+    updates = []
+
+    def count_updates(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            updates.append(statement)
+
+    client = app.test_client()
+    moves = [
+        {"id": "s4", "before": "s1"},
+        {"id": "s2", "after": "s3"},
+        {"id": "s1"},
+    ]
+    event.listen(engine, "before_cursor_execute", count_updates)
+    try:
+        resp = client.post(
+            "/scenes/reorder", json={"moves": moves}, headers=auth_header
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_updates)
+    assert resp.status_code == 200
+    assert len(updates) == 1
+    assert {item["id"] for item in resp.get_json()["items"]} == {"s1", "s2", "s4"}
+    assert _scene_ids(client, auth_header) == ["s4", "s3", "s2", "s1"]
+
+
+def test_reorder_scene_into_other_chapter(app, auth_header):
+    """Normal case: a move may change the scene's chapter."""
+    client = app.test_client()
+    resp = client.post(
+        "/scenes/reorder",
+        json={"moves": [{"id": "s2", "chapter_id": "c2"}]},
+        headers=auth_header,
+    )
+    assert resp.status_code == 200
+    assert resp.get_json()["items"][0]["chapter_id"] == "c2"
+    assert _scene_ids(client, auth_header, "c2") == ["s2"]
+    assert _scene_ids(client, auth_header) == ["s1", "s3", "s4"]
+
+
+def test_reorder_chapters(app, auth_header):
+    """Normal case: chapters are reordered and listed by rank."""
+    client = app.test_client()
+    resp = client.post(
+        "/chapters/reorder",
+        json={"moves": [{"id": "c2", "before": "c1"}]},
+        headers=auth_header,
+    )
+    assert resp.status_code == 200
+    listed = client.get("/chapters/?project_id=proj", headers=auth_header)
+    assert [c["id"] for c in listed.get_json()] == ["c2", "c1"]
+
+
+def test_reorder_invalid_moves(app, auth_header):
+    """Failure case: unknown ids 404; non-sibling anchors and bad bodies 400."""
+    client = app.test_client()
+    for body, status in (
+        ({"moves": [{"id": "missing"}]}, 404),
+        ({"moves": [{"id": "s1", "after": "c1"}]}, 404),
+        ({"moves": [{"id": "s1", "chapter_id": "nope"}]}, 404),
+        ({"moves": [{"id": "s1", "chapter_id": "c2", "after": "s2"}]}, 400),
+        ({"moves": []}, 400),
+        ({}, 400),
+    ):
+        resp = client.post("/scenes/reorder", json=body, headers=auth_header)
+        assert resp.status_code == status, body
+    assert _scene_ids(client, auth_header) == ["s1", "s2", "s3", "s4"]
+
+
+def test_reorder_rejects_other_users_rows(app, auth_header):
+    """Failure case: moved ids, anchors and target chapters must all be owned."""
+    with app.app_context():
+        db.session.add(Project(id="mp", user_id="user-2", title="Other"))
+        db.session.add(Chapter(id="mc", project_id="mp", title="Ch", order=1))
+        db.session.add(Scene(id="ms", chapter_id="mc", title="Sc", order=1))
+        db.session.commit()
+        token = AuthService.generate_token("user-2")
+    other_header = {"Authorization": f"Bearer {token}"}
+    client = app.test_client()
+    for url, body, headers in (
+        (
+            "/scenes/reorder",
+            {"moves": [{"id": "s1", "chapter_id": "mc"}]},
+            other_header,
+        ),
+        ("/scenes/reorder", {"moves": [{"id": "s1", "chapter_id": "mc"}]}, auth_header),
+        ("/scenes/reorder", {"moves": [{"id": "ms", "before": "s1"}]}, other_header),
+        ("/chapters/reorder", {"moves": [{"id": "c2", "before": "c1"}]}, other_header),
+    ):
+        resp = client.post(url, json=body, headers=headers)
+        assert resp.status_code == 404, body
+    assert _scene_ids(client, auth_header) == ["s1", "s2", "s3", "s4"]
+    assert _scene_ids(client, other_header, "mc") == ["ms"]
+
+
+def test_reorder_renumbers_duplicate_legacy_orders(app, auth_header):
+    """Edge case: siblings sharing a legacy order are renumbered on demand."""
+    with app.app_context():
+        db.session.add(Scene(id="s5", chapter_id="c1", title="Dup", order=2))
+        db.session.commit()
+    client = app.test_client()
+    assert _scene_ids(client, auth_header) == ["s1", "s2", "s5", "s3", "s4"]
+    resp = client.post(
+        "/scenes/reorder",
+        json={"moves": [{"id": "s4", "after": "s2"}]},
+        headers=auth_header,
+    )
+    assert resp.status_code == 200
+    assert _scene_ids(client, auth_header) == ["s1", "s2", "s4", "s5", "s3"]
+
+
+def test_legacy_order_update_maps_to_rank(app, auth_header):
+    """Edge case: PUT with an integer order still positions the scene."""
+    client = app.test_client()
+    resp = client.put("/scenes/s1", json={"order": 10}, headers=auth_header)
+    assert resp.status_code == 200
+    assert _scene_ids(client, auth_header) == ["s2", "s3", "s4", "s1"]
+
+
+def test_long_ranks_are_rebalanced(auth_header):
+    """Edge case: ranks past RANK_REBALANCE_LENGTH are renumbered after commit."""
+    app = _make_app(RANK_REBALANCE_LENGTH=8)
+    client = app.test_client()
+    for _ in range(6):
+        resp = client.post(
+            "/scenes/reorder",
+            json={"moves": [{"id": "s4", "after": "s1"}, {"id": "s3", "after": "s1"}]},
+            headers=auth_header,
+        )
+        assert resp.status_code == 200
+    with app.app_context():
+        ranks = [
+            scene.rank for scene in Scene.query.order_by(Scene.rank, Scene.id).all()
+        ]
+        assert max(len(rank) for rank in ranks) <= 8
+        assert app.extensions["rank_rebalancer"].rebalanced > 0
+    assert _scene_ids(client, auth_header) == ["s1", "s3", "s4", "s2"]
+
+
+def test_background_rebalancer(tmp_path, auth_header):
+    """Normal case: the async rebalancer renumbers a parent off the request."""
+    app = _make_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'ranks.db'}",
+        RANK_REBALANCE_ASYNC=True,
+        RANK_REBALANCE_LENGTH=6,
+    )
+    client = app.test_client()
+    resp = client.post(
+        "/scenes/reorder",
+        json={"moves": [{"id": "s4", "after": "s1"}]},
+        headers=auth_header,
+    )
+    assert resp.get_json()["rebalancing"] == ["c1"]
+    app.extensions["rank_rebalancer"].wait()
+    with app.app_context():
+        scenes = Scene.query.order_by(Scene.rank).all()
+        assert [s.id for s in scenes] == ["s1", "s4", "s2", "s3"]
+        assert [s.order for s in scenes] == [1, 2, 3, 4]
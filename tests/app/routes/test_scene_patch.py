@@ -0,0 +1,140 @@
+"""
+Unit tests for PATCH /scenes/<scene_id> text-operation edits.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+TEXT = "It was a dark and stormy night. " * 1250
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.add(Chapter(id="c1", project_id="proj", title="Ch", order=1))
+        db.session.add(
+            Scene(id="s1", chapter_id="c1", title="Storm", content=TEXT, order=1)
+        )
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _content(app):
+    with app.app_context():
+        return db.session.get(Scene, "s1").content
+
+
+def test_patch_applies_ops_and_bumps_version(app, auth_header):
+    """Normal case: a one-word edit to a 40KB scene uploads a few bytes."""
+    with app.app_context():
+        engine = db.engine
+    updates = []
+
+    def count_updates(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            updates.append(statement)
+
+    body = {
+        "base_version": 1,
+        "ops": [{"retain": 9}, {"delete": 4}, {"insert": "bright"}],
+    }
+    event.listen(engine, "before_cursor_execute", count_updates)
+    try:
+        resp = app.test_client().patch("/scenes/s1", json=body, headers=auth_header)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_updates)
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["version"] == 2
+    assert data["length"] == len(TEXT) + 2
+    # Reason: One scene write plus one delta rollup each for chapter and project
+    assert sum(u.startswith("UPDATE scenes") for u in updates) == 1
+    assert len(updates) == 3
+    assert len(resp.get_data()) < 200
+    assert _content(app) == "It was a bright and stormy night. " + TEXT[32:]
+
+
+def test_stale_base_version_conflicts(app, auth_header):
+    """Failure case: a patch against an old version returns 409 unchanged."""
+    client = app.test_client()
+    first = {"base_version": 1, "ops": [{"insert": "A"}]}
+    resp = client.patch("/scenes/s1", json=first, headers=auth_header)
+    assert resp.status_code == 200
+    resp = client.patch("/scenes/s1", json=first, headers=auth_header)
+    assert resp.status_code == 409
+    assert resp.get_json()["version"] == 2
+    assert _content(app) == "A" + TEXT
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"base_version": 1, "ops": [{"retain": len(TEXT) + 1}]},
+        {"base_version": 1, "ops": [{"delete": 0}]},
+        {"base_version": 1, "ops": [{"retain": 1, "insert": "x"}]},
+        {"base_version": 1, "ops": [{"move": 3}]},
+        {"base_version": 1, "ops": []},
+        {"ops": [{"insert": "x"}]},
+    ],
+)
+def test_invalid_patches_rejected(app, auth_header, body):
+    """Failure case: malformed or out-of-range ops return 400."""
+    resp = app.test_client().patch("/scenes/s1", json=body, headers=auth_header)
+    assert resp.status_code == 400
+    assert _content(app) == TEXT
+
+
+def test_patch_unknown_scene(app, auth_header):
+    """Failure case: unknown scene returns 404."""
+    resp = app.test_client().patch(
+        "/scenes/missing",
+        json={"base_version": 1, "ops": [{"insert": "x"}]},
+        headers=auth_header,
+    )
+    assert resp.status_code == 404
+
+
+def test_patch_other_users_scene(app):
+    """Failure case: patching another user's scene is a 404 and changes nothing."""
+    with app.app_context():
+        token = AuthService.generate_token("user-2")
+    resp = app.test_client().patch(
+        "/scenes/s1",
+        json={"base_version": 1, "ops": [{"insert": "PWNED "}]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 404
+    assert _content(app) == TEXT
+
+
+def test_put_content_bumps_version(app, auth_header):
+    """Edge case: full-text PUTs move the version so old patch bases go stale."""
+    client = app.test_client()
+    resp = client.put("/scenes/s1", json={"content": "New"}, headers=auth_header)
+    assert resp.get_json()["version"] == 2
+    resp = client.put("/scenes/s1", json={"title": "Calm"}, headers=auth_header)
+    assert resp.get_json()["version"] == 2
+    stale = client.patch(
+        "/scenes/s1",
+        json={"base_version": 1, "ops": [{"insert": "x"}]},
+        headers=auth_header,
+    )
+    assert stale.status_code == 409
@@ -32,15 +32,13 @@ from backend.models.chapter import Chapter
 from backend.models.user import User
 from backend.models.project import Project
 from backend.app.services.auth_service import AuthService
+from backend.app.utils.rank import encode_position
 
 
 @pytest.fixture
-def auth_header_and_project():
-    from backend.app import create_app
-
-    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
-    with app.app_context():
-        db.create_all()
+def auth_header_and_project(test_client):
+    # Reason: Seed the client's own database so the project is owned by the caller
+    with test_client.application.app_context():
         user = User(
             id=str(uuid.uuid4()),
             email="sceneuser@example.com",
@@ -128,7 +126,8 @@ def test_update_scene_success(test_client, auth_header_and_project, chapter_for_
     resp = test_client.put(f"/scenes/{scene_id}", json=data, headers=headers)
     assert resp.status_code == 200
     assert resp.json["title"] == "New Title"
-    assert resp.json["order"] == 2
+    assert resp.json["rank"] == encode_position(2)
+    assert "order" not in resp.json
 
 
 @pytest.mark.usefixtures("auth_header_and_project")
@@ -158,3 +157,21 @@ def test_update_scene_invalid_input(
     )
     assert resp.status_code == 400
     assert "order" in resp.json
+
+
+def test_other_users_chapter_is_hidden(test_client, auth_header_and_project):
+    """Failure case: listing or creating scenes in another user's chapter is a 404."""
+    headers, _, _ = auth_header_and_project
+    with test_client.application.app_context():
+        db.session.add(Project(id="other-p", user_id="other-user", title="Other"))
+        db.session.add(
+            Chapter(id="other-c", project_id="other-p", title="Other", order=1)
+        )
+        db.session.commit()
+    resp = test_client.get("/scenes/?chapter_id=other-c", headers=headers)
+    assert resp.status_code == 404
+    data = {"chapter_id": "other-c", "title": "Scene 1", "order": 1}
+    resp = test_client.post("/scenes/", json=data, headers=headers)
+    assert resp.status_code == 404
+    with test_client.application.app_context():
+        assert Scene.query.count() == 0
@@ -0,0 +1,189 @@
+"""
+Unit tests for GET /search full-text search.
+"""
+
+import pytest
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.models.annotation import Annotation
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            [
+                Project(id="proj", user_id="user-1", title="Book"),
+                Project(id="other", user_id="user-1", title="Other"),
+                Project(id="theirs", user_id="user-2", title="Theirs"),
+                Chapter(id="c1", project_id="proj", title="Ch", order=1),
+                Chapter(id="c2", project_id="other", title="Ch", order=1),
+                Scene(
+                    id="s1",
+                    chapter_id="c1",
+                    title="Lighthouse",
+                    content="The keeper climbed the stairs of the lighthouse.",
+                    order=1,
+                ),
+                Scene(
+                    id="s2",
+                    chapter_id="c1",
+                    title="Harbour",
+                    content="Boats rocked in the harbour; a lighthouse blinked.",
+                    order=2,
+                ),
+                Scene(
+                    id="s3",
+                    chapter_id="c2",
+                    title="Elsewhere",
+                    content="Another lighthouse in another book.",
+                    order=1,
+                ),
+                Draft(id="d1", scene_id="s1", content="The keeper slept <b>badly</b>."),
+                Annotation(
+                    id="a1", draft_id="d1", highlight="keeper", context="Who is he?"
+                ),
+            ]
+        )
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _search(app, auth_header, query):
+    return app.test_client().get(
+        f"/search?project_id=proj&{query}", headers=auth_header
+    )
+
+
+def _ids(resp):
+    return [(hit["type"], hit["id"]) for hit in resp.get_json()["results"]]
+
+
+def test_search_ranks_hits_with_highlighted_snippets(app, auth_header):
+    """Normal case: title matches outrank body matches; snippets mark terms."""
+    resp = _search(app, auth_header, "q=lighthouse")
+    assert resp.status_code == 200
+    results = resp.get_json()["results"]
+    assert [hit["id"] for hit in results] == ["s1", "s2"]
+    assert results[0]["score"] > results[1]["score"]
+    assert "<mark>lighthouse</mark>" in results[1]["snippet"]
+    assert results[0]["type"] == "scene" and results[0]["scene_id"] == "s1"
+
+
+def test_search_covers_drafts_and_annotations(app, auth_header):
+    """Normal case: one query returns scene, draft and annotation hits."""
+    resp = _search(app, auth_header, "q=keeper")
+    assert sorted(_ids(resp)) == [
+        ("annotation", "a1"),
+        ("draft", "d1"),
+        ("scene", "s1"),
+    ]
+    annotation = next(h for h in resp.get_json()["results"] if h["id"] == "a1")
+    assert (annotation["scene_id"], annotation["draft_id"]) == ("s1", "d1")
+    resp = _search(app, auth_header, "q=keeper&types=draft")
+    assert _ids(resp) == [("draft", "d1")]
+
+
+def test_search_stems_and_escapes_snippets(app, auth_header):
+    """Edge case: terms are stemmed ('climbing' finds 'climbed'); HTML escaped."""
+    resp = _search(app, auth_header, "q=climbing")
+    assert _ids(resp) == [("scene", "s1")]
+    resp = _search(app, auth_header, "q=badly&types=draft")
+    snippet = resp.get_json()["results"][0]["snippet"]
+    assert "&lt;b&gt;<mark>badly</mark>&lt;/b&gt;" in snippet
+
+
+def test_index_follows_writes(app, auth_header):
+    """Normal case: updates, patches, deletes and imports index immediately."""
+    client = app.test_client()
+    client.put(
+        "/scenes/s2", json={"content": "Fog over the pier."}, headers=auth_header
+    )
+    assert _ids(_search(app, auth_header, "q=lighthouse")) == [("scene", "s1")]
+    assert _ids(_search(app, auth_header, "q=pier")) == [("scene", "s2")]
+    client.patch(
+        "/scenes/s2",
+        json={"base_version": 2, "ops": [{"insert": "Gulls. "}]},
+        headers=auth_header,
+    )
+    assert _ids(_search(app, auth_header, "q=gulls")) == [("scene", "s2")]
+    with app.app_context():
+        db.session.delete(db.session.get(Annotation, "a1"))
+        db.session.delete(db.session.get(Draft, "d1"))
+        db.session.commit()
+    assert ("draft", "d1") not in _ids(_search(app, auth_header, "q=keeper"))
+    resp = client.post(
+        "/import/?format=markdown",
+        data="# One\n## Cove\nSmugglers.\n",
+        headers=auth_header,
+    )
+    project_id = resp.get_json()["project_id"]
+    resp = client.get(
+        f"/search?project_id={project_id}&q=smugglers", headers=auth_header
+    )
+    assert [hit["title"] for hit in resp.get_json()["results"]] == ["Cove"]
+
+
+def test_search_quotes_operators(app, auth_header):
+    """Edge case: FTS syntax in q is matched as text, never parsed."""
+    client = app.test_client()
+    for q in ["keeper OR harbour", "NEAR(keeper", "title:keeper", "keep*", '"a']:
+        resp = client.get(
+            "/search", query_string={"project_id": "proj", "q": q}, headers=auth_header
+        )
+        assert resp.status_code == 200, q
+    resp = client.get(
+        "/search",
+        query_string={"project_id": "proj", "q": "keeper OR harbour"},
+        headers=auth_header,
+    )
+    assert _ids(resp) == []
+    resp = client.get(
+        "/search",
+        query_string={"project_id": "proj", "q": '"the keeper climbed"'},
+        headers=auth_header,
+    )
+    assert _ids(resp) == [("scene", "s1")]
+
+
+def test_search_is_scoped_to_project(app, auth_header):
+    """Failure case: other projects' text never leaks; foreign project is 404."""
+    resp = app.test_client().get(
+        "/search?project_id=other&q=lighthouse", headers=auth_header
+    )
+    assert _ids(resp) == [("scene", "s3")]
+    resp = app.test_client().get(
+        "/search?project_id=theirs&q=lighthouse", headers=auth_header
+    )
+    assert resp.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["q=", "q=%20!!", "q=x&limit=0", "q=x&limit=101", "q=x&limit=a", "q=x&types=foo"],
+)
+def test_search_rejects_bad_params(app, auth_header, query):
+    """Failure case: empty queries, bad limits and unknown types return 400."""
+    assert _search(app, auth_header, query).status_code == 400
+
+
+def test_search_requires_project_id(app, auth_header):
+    """Failure case: project_id is required."""
+    resp = app.test_client().get("/search?q=keeper", headers=auth_header)
+    assert resp.status_code == 400
@@ -0,0 +1,207 @@
+"""
+Unit tests for stored scene statistics and GET /stats/* rollups.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.services.stats_service import StatsService
+from backend.app.utils import text_stats
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+ONE = 'The rain fell.\n"Come in," she said.'
+TWO = "Later that night the storm passed over the harbour."
+
+
+@pytest.fixture
+def app():
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "RANK_REBALANCE_ASYNC": False,
+        }
+    )
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            [
+                Project(id="proj", user_id="user-1", title="Book"),
+                Project(id="sequel", user_id="user-1", title="Sequel"),
+                Chapter(id="c1", project_id="proj", title="One", order=1),
+                Chapter(id="c2", project_id="proj", title="Two", order=2),
+                Chapter(id="c3", project_id="sequel", title="Three", order=1),
+            ]
+        )
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create(client, auth_header, chapter_id, content, order=1):
+    resp = client.post(
+        "/scenes/",
+        json={
+            "chapter_id": chapter_id,
+            "title": "S",
+            "content": content,
+            "order": order,
+        },
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    return resp.get_json()["id"]
+
+
+def _stats(client, auth_header, kind, row_id):
+    resp = client.get(f"/stats/{kind}/{row_id}", headers=auth_header)
+    assert resp.status_code == 200
+    data = resp.get_json()
+    return {field: data[field] for field in text_stats.STAT_FIELDS}
+
+
+def _sum(*texts):
+    total = dict(text_stats.EMPTY)
+    for text in texts:
+        text_stats.add(total, text_stats.compute(text))
+    return total
+
+
+def test_create_and_update_roll_up(app, auth_header):
+    """Normal case: scene, chapter and project figures follow every edit."""
+    client = app.test_client()
+    s1 = _create(client, auth_header, "c1", ONE)
+    s2 = _create(client, auth_header, "c2", TWO, order=2)
+    assert _stats(client, auth_header, "scenes", s1) == text_stats.compute(ONE)
+    assert _stats(client, auth_header, "chapters", "c1") == _sum(ONE)
+    assert _stats(client, auth_header, "projects", "proj") == _sum(ONE, TWO)
+    assert _stats(client, auth_header, "projects", "proj")["dialogue_count"] == 1
+
+    client.put(f"/scenes/{s1}", json={"content": "Short."}, headers=auth_header)
+    client.patch(
+        f"/scenes/{s2}",
+        json={"base_version": 1, "ops": [{"insert": "Much "}]},
+        headers=auth_header,
+    )
+    assert _stats(client, auth_header, "chapters", "c1") == _sum("Short.")
+    assert _stats(client, auth_header, "chapters", "c2") == _sum("Much " + TWO)
+    assert _stats(client, auth_header, "projects", "proj") == _sum(
+        "Short.", "Much " + TWO
+    )
+
+
+def test_rollups_are_deltas_not_rescans(app, auth_header):
+    """Edge case: edits never read sibling scenes; title edits write nothing."""
+    client = app.test_client()
+    s1 = _create(client, auth_header, "c1", ONE)
+    _create(client, auth_header, "c1", TWO, order=2)
+    with app.app_context():
+        engine = db.engine
+        before = db.session.get(Chapter, "c1").updated_at
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        client.put(
+            f"/scenes/{s1}", json={"content": ONE + " More."}, headers=auth_header
+        )
+        edit = list(statements)
+        statements.clear()
+        client.put(f"/scenes/{s1}", json={"title": "Renamed"}, headers=auth_header)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert not any("sum(" in s.lower() for s in edit)
+    assert sum(s.startswith("UPDATE chapters") for s in edit) == 1
+    assert sum(s.startswith("UPDATE projects") for s in edit) == 1
+    assert not any(
+        s.startswith(("UPDATE chapters", "UPDATE projects")) for s in statements
+    )
+    with app.app_context():
+        assert db.session.get(Chapter, "c1").updated_at == before
+
+
+def test_stats_endpoint_reads_one_row(app, auth_header):
+    """Normal case: once ownership is cached, stats are one lookup without text."""
+    client = app.test_client()
+    _create(client, auth_header, "c1", ONE * 1000)
+    _stats(client, auth_header, "projects", "proj")
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        _stats(client, auth_header, "projects", "proj")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert len(statements) == 1
+    assert "content" not in statements[0] and "scenes" not in statements[0]
+
+
+def test_import_and_move_roll_up(app, auth_header):
+    """Normal case: bulk imports and cross-chapter moves keep totals exact."""
+    client = app.test_client()
+    resp = client.post(
+        "/import/?format=markdown",
+        data=f"# A\n## S1\n{ONE}\n## S2\n{TWO}\n# B\n## S3\nEnd.\n",
+        headers=auth_header,
+    )
+    project_id = resp.get_json()["project_id"]
+    assert _stats(client, auth_header, "projects", project_id) == _sum(ONE, TWO, "End.")
+
+    s1 = _create(client, auth_header, "c1", ONE)
+    resp = client.post(
+        "/scenes/reorder",
+        json={"moves": [{"id": s1, "chapter_id": "c3"}]},
+        headers=auth_header,
+    )
+    assert resp.status_code == 200
+    assert _stats(client, auth_header, "chapters", "c1") == text_stats.EMPTY
+    assert _stats(client, auth_header, "chapters", "c3") == _sum(ONE)
+    assert _stats(client, auth_header, "projects", "proj") == text_stats.EMPTY
+    assert _stats(client, auth_header, "projects", "sequel") == _sum(ONE)
+
+
+def test_rebuild_backfills_rows(app, auth_header):
+    """Edge case: rows written outside the API are counted by rebuild()."""
+    with app.app_context():
+        db.session.add(
+            Scene(id="raw", chapter_id="c1", title="R", content=TWO, order=1)
+        )
+        db.session.commit()
+    client = app.test_client()
+    assert _stats(client, auth_header, "projects", "proj") == text_stats.EMPTY
+    with app.app_context():
+        assert StatsService.rebuild(batch_size=1) == 1
+        db.session.commit()
+    assert _stats(client, auth_header, "scenes", "raw") == _sum(TWO)
+    assert _stats(client, auth_header, "projects", "proj") == _sum(TWO)
+    assert _stats(client, auth_header, "projects", "sequel") == text_stats.EMPTY
+
+
+def test_stats_not_found(app, auth_header):
+    """Failure case: unknown or foreign rows return 404."""
+    with app.app_context():
+        db.session.add(Project(id="theirs", user_id="user-2", title="Theirs"))
+        db.session.commit()
+    client = app.test_client()
+    for url in ("/stats/projects/theirs", "/stats/chapters/nope", "/stats/scenes/nope"):
+        assert client.get(url, headers=auth_header).status_code == 404
@@ -34,7 +34,7 @@ def auth_header(client):
 def test_get_timeline_normal(client, auth_header):
     """Normal case: timeline with chapters and scenes."""
     with client.application.app_context():
-        project = Project(id="proj-uuid", user_id="user-uuid", title="My Project")
+        project = Project(id="proj-uuid", user_id="testuser", title="My Project")
         db.session.add(project)
         chapter = Chapter(
             id="chap-uuid",
@@ -71,7 +71,7 @@ def test_get_timeline_no_project(client, auth_header):
 def test_get_timeline_empty(client, auth_header):
     """Edge case: project with no chapters/scenes."""
     with client.application.app_context():
-        project = Project(id="proj-empty", user_id="user-uuid", title="Empty Project")
+        project = Project(id="proj-empty", user_id="testuser", title="Empty Project")
         db.session.add(project)
         db.session.commit()
     rv = client.get("/timeline/proj-empty", headers=auth_header)
@@ -79,3 +79,67 @@ def test_get_timeline_empty(client, auth_header):
     data = rv.get_json()
     assert data["project_id"] == "proj-empty"
     assert data["timeline"] == []
+
+
+# Reason: Ownership check, project lookup, ETag aggregate and the joined tree query
+@pytest.mark.query_budget(4)
+def test_get_timeline_constant_queries(client, auth_header):
+    """Edge case: query count does not grow with the number of chapters."""
+    from datetime import timedelta
+
+    base = datetime(2025, 1, 1)
+    with client.application.app_context():
+        db.session.add(Project(id="proj-big", user_id="testuser", title="Big"))
+        for c in range(10):
+            db.session.add(
+                Chapter(
+                    id=f"chap-{c}",
+                    project_id="proj-big",
+                    title=f"Chapter {c}",
+                    order=c,
+                    created_at=base + timedelta(minutes=c),
+                )
+            )
+            for s in (2, 1, 0):
+                db.session.add(
+                    Scene(
+                        id=f"scene-{c}-{s}",
+                        chapter_id=f"chap-{c}",
+                        title=f"Scene {s}",
+                        order=s,
+                        created_at=base + timedelta(minutes=c, seconds=s),
+                    )
+                )
+        db.session.add(
+            Chapter(
+                id="chap-empty",
+                project_id="proj-big",
+                title="Empty",
+                order=99,
+                created_at=base + timedelta(hours=1),
+            )
+        )
+        db.session.commit()
+    rv = client.get("/timeline/proj-big", headers=auth_header)
+    assert rv.status_code == 200
+    timeline = rv.get_json()["timeline"]
+    assert [c["chapter_id"] for c in timeline] == [f"chap-{c}" for c in range(10)] + [
+        "chap-empty"
+    ]
+    assert [s["scene_id"] for s in timeline[0]["scenes"]] == [
+        "scene-0-0",
+        "scene-0-1",
+        "scene-0-2",
+    ]
+    assert timeline[-1]["scenes"] == []
+
+
+def test_get_timeline_of_other_users_project(client, auth_header):
+    """Failure case: another user's project is a 404 with no ETag."""
+    with client.application.app_context():
+        db.session.add(Project(id="proj-other", user_id="otheruser", title="Secret"))
+        db.session.commit()
+    rv = client.get("/timeline/proj-other", headers=auth_header)
+    assert rv.status_code == 404
+    assert "ETag" not in rv.headers
+    assert "Secret" not in rv.get_data(as_text=True)
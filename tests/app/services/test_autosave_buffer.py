@@ -0,0 +1,179 @@
+"""
+Unit tests for the write-coalescing AutosaveBuffer.
+"""
+
+import pytest
+from backend.app import create_app, db
+from backend.app.services.autosave_buffer import AutosaveBuffer
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.autosave_version import AutosaveVersion
+from backend.models.chapter import Chapter
+from backend.models.project import Project
+from backend.models.scene import Scene
+from flask_jwt_extended import create_access_token, JWTManager
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+@pytest.fixture
+def buffer(app):
+    buffer = AutosaveBuffer(app, flush_interval=60, max_pending=10, capacity=3)
+    yield buffer
+    buffer.close()
+
+
+def test_submit_coalesces_per_target(app, buffer):
+    """Normal case: only the newest snapshot per target is written."""
+    buffer.submit("v1", scene_id="scene-a")
+    buffer.submit("v2", scene_id="scene-a")
+    buffer.submit("v3", scene_id="scene-a")
+    buffer.submit("draft text", draft_id="draft-a")
+    assert buffer.flush() == 2
+    stats = buffer.stats()
+    assert stats["coalesced"] == 2
+    assert stats["flushed"] == 2
+    assert stats["pending"] == 0
+    latest = AutosaveService.latest(scene_id="scene-a")
+    assert AutosaveService.get_content(latest) == "v3"
+    assert AutosaveVersion.query.count() == 2
+
+
+def test_flush_encodes_deltas_and_deduplicates(app, buffer):
+    """Normal case: later flushes chain deltas; unchanged content is skipped."""
+    text = "A paragraph of the scene.\n" * 50
+    buffer.submit(text, scene_id="scene-a")
+    buffer.flush()
+    buffer.submit(text + "New line.\n", scene_id="scene-a")
+    buffer.flush()
+    buffer.submit(text + "New line.\n", scene_id="scene-a")
+    assert buffer.flush() == 0
+    assert buffer.stats()["deduplicated"] == 1
+    latest = AutosaveService.latest(scene_id="scene-a")
+    assert not latest.is_keyframe
+    assert AutosaveService.get_content(latest) == text + "New line.\n"
+
+
+def test_submit_drops_when_full(app, buffer):
+    """Edge case: new targets beyond capacity are dropped, existing coalesce."""
+    for i in range(3):
+        assert buffer.submit("text", scene_id=f"scene-{i}")
+    assert not buffer.submit("text", scene_id="scene-overflow")
+    assert buffer.submit("newer", scene_id="scene-0")
+    stats = buffer.stats()
+    assert stats["dropped"] == 1
+    assert stats["pending"] == 3
+
+
+def test_flush_survives_any_error(app, buffer, monkeypatch):
+    """Failure case: a non-database error keeps the batch queued for retry."""
+    buffer.submit("kept", scene_id="scene-a")
+
+    def fail(targets):
+        raise RuntimeError("boom")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(AutosaveService, "latest_for_targets", fail)
+        assert buffer.flush() == 0
+    stats = buffer.stats()
+    assert stats["flush_errors"] == 1
+    assert stats["pending"] == 1
+    assert buffer.flush() == 1
+    assert AutosaveService.get_content(AutosaveService.latest("scene-a")) == "kept"
+
+
+def test_flush_restarts_unreadable_chain(app, buffer):
+    """Edge case: a delta whose keyframe is gone is followed by a keyframe."""
+    db.session.add(
+        AutosaveVersion(
+            scene_id="scene-a", delta="[]", keyframe_id="missing", chain_index=1
+        )
+    )
+    db.session.commit()
+    buffer.submit("recovered", scene_id="scene-a")
+    buffer.submit("other", scene_id="scene-b")
+    assert buffer.flush() == 2
+    latest = AutosaveService.latest(scene_id="scene-a")
+    assert latest.is_keyframe and latest.content == "recovered"
+    assert buffer.stats()["flush_errors"] == 0
+
+
+def test_close_flushes_when_durable(app):
+    """Normal case: durable shutdown writes pending snapshots."""
+    buffer = AutosaveBuffer(app, flush_interval=60, flush_on_shutdown=True)
+    buffer.submit("final words", scene_id="scene-a")
+    buffer.close()
+    assert AutosaveVersion.query.count() == 1
+    assert buffer.stats()["flushed"] == 1
+
+
+def test_close_drops_when_not_durable(app):
+    """Edge case: non-durable shutdown counts pending snapshots as dropped."""
+    buffer = AutosaveBuffer(app, flush_interval=60, flush_on_shutdown=False)
+    buffer.submit("lost words", scene_id="scene-a")
+    buffer.close()
+    assert AutosaveVersion.query.count() == 0
+    assert buffer.stats()["dropped"] == 1
+
+
+def test_latest_for_targets_uses_newest_version(app):
+    """Normal case: batch lookup returns the newest version per target."""
+    first = AutosaveService.save_snapshot("one", scene_id="scene-a")
+    second = AutosaveService.save_snapshot("two", scene_id="scene-a", previous=first)
+    other = AutosaveService.save_snapshot("draft", draft_id="draft-a")
+    latest = AutosaveService.latest_for_targets(
+        [("scene-a", None), ("draft-a", None), (None, "draft-a")]
+    )
+    assert latest[("scene-a", None)].id == second.id
+    assert latest[(None, "draft-a")].id == other.id
+    assert ("draft-a", None) not in latest
+
+
+def test_autosave_route_queues_when_buffer_enabled():
+    """Normal case: with the buffer enabled POST /autosave/ returns 202."""
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "AUTOSAVE_BUFFER_ENABLED": True,
+            "AUTOSAVE_BUFFER_FLUSH_INTERVAL": 60,
+        }
+    )
+    JWTManager(app)
+    buffer = app.extensions["autosave_buffer"]
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="project-a", user_id="testuser", title="P"))
+        db.session.add(
+            Chapter(id="chapter-a", project_id="project-a", title="C", order=1)
+        )
+        db.session.add(Scene(id="scene-a", chapter_id="chapter-a", title="S", order=1))
+        db.session.commit()
+        token = create_access_token(identity="testuser")
+        headers = {"Authorization": f"Bearer {token}"}
+        client = app.test_client()
+        rv = client.post(
+            "/autosave/",
+            json={"scene_id": "scene-a", "content": "Queued."},
+            headers=headers,
+        )
+        assert rv.status_code == 202
+        assert rv.get_json()["queued"] is True
+        rv = client.post(
+            "/autosave/batch",
+            json={"frames": [{"scene_id": "scene-a", "content": "Queued again."}]},
+            headers=headers,
+        )
+        assert rv.status_code == 202
+        assert rv.get_json()["frames"] == [{"status": "queued"}]
+        rv = client.get("/autosave/buffer", headers=headers)
+        assert rv.get_json()["pending"] == 1
+        buffer.close()
+        assert AutosaveVersion.query.count() == 1
+        db.drop_all()
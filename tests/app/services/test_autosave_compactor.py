@@ -0,0 +1,215 @@
+"""
+Unit tests for autosave retention tiers and the AutosaveCompactor job.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import time
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.autosave_compactor import (
+    AutosaveCompactor,
+    parse_retention,
+    retained_ids,
+)
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.autosave_version import AutosaveVersion
+
+NOW = datetime(2025, 3, 1, 12, 0, 0)
+TIERS = "10m:0,1h:5m,*:30m"
+
+
+@pytest.fixture
+def app():
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "AUTOSAVE_KEYFRAME_INTERVAL": 4,
+            "AUTOSAVE_RETENTION": TIERS,
+            "AUTOSAVE_COMPACTION_BATCH_SIZE": 10,
+        }
+    )
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+def _save_history(minutes, scene_id="scene-1"):
+    """One autosave per minute for `minutes`, ending at NOW."""
+    text = "Once upon a time.\n" * 50
+    previous = previous_content = None
+    history = {}
+    for i in range(minutes):
+        text = text + f"Line {i}.\n"
+        previous = AutosaveService.save_snapshot(
+            text,
+            scene_id=scene_id,
+            previous=previous,
+            previous_content=previous_content,
+        )
+        previous.saved_at = NOW - timedelta(minutes=minutes - 1 - i)
+        db.session.commit()
+        previous_content = text
+        history[previous.id] = (previous.saved_at, text)
+    return history
+
+
+def test_parse_retention():
+    """Normal case: durations with units; '*' is an unbounded last tier."""
+    assert parse_retention("1h:0,1d:10m,*:1d") == [
+        (3600, 0),
+        (86400, 600),
+        (None, 86400),
+    ]
+    assert parse_retention([("30d", "1d")]) == [(2592000, 86400)]
+    for bad in ("", "1h", "x:1", "*:1d,1h:0", "1d:0,1h:0"):
+        with pytest.raises(ValueError):
+            parse_retention(bad)
+
+
+def test_retained_ids_keeps_last_version_per_bucket():
+    """Normal case: all recent versions, then the newest one per bucket."""
+    versions = [
+        SimpleNamespace(id=f"v{m}", saved_at=NOW - timedelta(minutes=m))
+        for m in (200, 190, 45, 42, 41, 5, 1)
+    ]
+    keep = retained_ids(versions, parse_retention(TIERS), NOW)
+    # Reason: 11:15, 11:18 and 11:19 share a 5-minute bucket; 8:40 and 8:50 a 30m one
+    assert keep == {"v190", "v41", "v5", "v1"}
+
+
+def test_retained_ids_drops_beyond_last_tier():
+    """Edge case: without '*' old versions go, but the newest always stays."""
+    versions = [
+        SimpleNamespace(id="old", saved_at=NOW - timedelta(days=40)),
+        SimpleNamespace(id="newest", saved_at=NOW - timedelta(days=35)),
+    ]
+    assert retained_ids(versions, parse_retention("30d:1d"), NOW) == {"newest"}
+
+
+def test_compact_thins_history_and_survivors_rebuild(app):
+    """Normal case: tiers applied, every surviving version still rebuilds."""
+    history = _save_history(180)
+    result = AutosaveCompactor.from_config(app).compact(now=NOW)
+    db.session.expire_all()
+    survivors = AutosaveVersion.query.all()
+    assert result["rows_deleted"] == len(history) - len(survivors) > 100
+    assert result["chars_reclaimed"] > 0
+    for version in survivors:
+        saved_at, text = history[version.id]
+        assert AutosaveService.get_content(version) == text
+    ages = sorted((NOW - v.saved_at).total_seconds() / 60 for v in survivors)
+    assert [a for a in ages if a < 10] == list(range(10))
+    assert len([a for a in ages if 10 <= a < 60]) <= 11
+    assert len([a for a in ages if a >= 60]) <= 5
+    assert AutosaveService.latest(scene_id="scene-1").saved_at == NOW
+
+
+def test_compact_is_idempotent_and_batched(app):
+    """Edge case: commits every batch; a second run deletes nothing."""
+    _save_history(120)
+    commits = []
+    event.listen(db.session, "after_commit", lambda session: commits.append(1))
+    compactor = AutosaveCompactor.from_config(app)
+    first = compactor.compact(now=NOW)
+    assert first["rows_deleted"] > 0
+    assert len(commits) >= first["rows_deleted"] // 10
+    assert compactor.compact(now=NOW)["rows_deleted"] == 0
+    assert compactor.stats()["runs"] == 2
+
+
+def test_compact_never_touches_newest_chain(app):
+    """Edge case: an idle target's newest chain stays as writers left it."""
+    history = _save_history(12)
+    latest = AutosaveService.latest(scene_id="scene-1")
+    chain = latest.keyframe_id or latest.id
+    before = {
+        v.id: (v.keyframe_id, v.chain_index, v.delta)
+        for v in AutosaveVersion.query.all()
+        if (v.keyframe_id or v.id) == chain
+    }
+    AutosaveCompactor(app, tiers="1m:1d").compact(now=NOW + timedelta(days=3))
+    db.session.expire_all()
+    after = {
+        v.id: (v.keyframe_id, v.chain_index, v.delta)
+        for v in AutosaveVersion.query.all()
+    }
+    assert {k: after[k] for k in before} == before
+    assert set(after) - set(before) == set()
+    assert len(history) > len(after)
+
+
+def test_compact_skips_unreadable_chain(app):
+    """Failure case: a corrupt delta fails its target only; others compact."""
+    _save_history(60, scene_id="scene-1")
+    healthy = _save_history(60, scene_id="scene-2")
+    broken = (
+        AutosaveVersion.query.filter_by(scene_id="scene-1")
+        .filter(AutosaveVersion.delta.isnot(None))
+        .order_by(AutosaveVersion.saved_at)
+        .first()
+    )
+    broken.delta = "[999999]"
+    db.session.commit()
+    result = AutosaveCompactor.from_config(app).compact(now=NOW)
+    assert result["errors"] == 1
+    assert result["targets"] == 2
+    remaining = AutosaveVersion.query.filter_by(scene_id="scene-2").count()
+    assert 0 < remaining < len(healthy)
+
+
+def test_compact_cli_reports_reclaimed_rows(app):
+    """Normal case: `flask autosave compact` prints the rows reclaimed."""
+    _save_history(30)
+    result = app.test_cli_runner().invoke(
+        args=["autosave", "compact", "--retention", "1m:0,*:1d"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("Reclaimed ")
+    assert AutosaveVersion.query.count() < 30
+
+
+def test_scheduler_runs_in_background(app):
+    """Normal case: with an interval set, compaction runs on its own thread."""
+    _save_history(30)
+    compactor = AutosaveCompactor(app, tiers="1m:0,*:1d", interval=0.05)
+    compactor.start()
+    try:
+        deadline = time.monotonic() + 5
+        while compactor.stats()["runs"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        compactor.close()
+    assert compactor.stats()["runs"] >= 1
+    assert compactor.stats()["rows_deleted"] > 0
+
+
+def test_scheduler_survives_a_failed_run(app, monkeypatch):
+    """Failure case: an unexpected error is counted and the next run proceeds."""
+    _save_history(30)
+    compactor = AutosaveCompactor(app, tiers="1m:0,*:1d", interval=0.05)
+    compact = compactor.compact
+    calls = []
+
+    def flaky(now=None):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return compact(now)
+
+    monkeypatch.setattr(compactor, "compact", flaky)
+    compactor.start()
+    try:
+        deadline = time.monotonic() + 5
+        while compactor.stats()["runs"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        compactor.close()
+    assert compactor.stats()["errors"] == 1
+    assert compactor.stats()["rows_deleted"] > 0
@@ -0,0 +1,143 @@
+"""
+Unit tests for AutosaveService keyframe/delta storage.
+"""
+
+import pytest
+from backend.app import create_app, db
+from backend.app.services.autosave_service import AutosaveService
+from backend.models.autosave_version import AutosaveVersion
+
+
+@pytest.fixture
+def app():
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "AUTOSAVE_KEYFRAME_INTERVAL": 4,
+        }
+    )
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+def _save_history(count, scene_id="scene-uuid"):
+    text = "Once upon a time.\n" * 200
+    previous = previous_content = None
+    versions = []
+    for i in range(count):
+        text = text + f"Line {i}.\n"
+        previous = AutosaveService.save_snapshot(
+            text,
+            scene_id=scene_id,
+            previous=previous,
+            previous_content=previous_content,
+        )
+        previous_content = text
+        versions.append((previous.id, text))
+    return versions
+
+
+def test_save_snapshot_stores_deltas_between_keyframes(app):
+    """Normal case: every Nth version is a keyframe, the rest are deltas."""
+    versions = _save_history(9)
+    rows = [db.session.get(AutosaveVersion, vid) for vid, _ in versions]
+    assert [r.chain_index for r in rows] == [0, 1, 2, 3, 0, 1, 2, 3, 0]
+    assert [r.is_keyframe for r in rows] == [i % 4 == 0 for i in range(9)]
+    assert all(r.content is None for r in rows if not r.is_keyframe)
+    assert rows[5].keyframe_id == rows[4].id
+
+
+def test_get_content_rebuilds_every_version(app):
+    """Normal case: any version is rebuilt exactly from its chain."""
+    for vid, text in _save_history(10):
+        version = db.session.get(AutosaveVersion, vid)
+        assert AutosaveService.get_content(version) == text
+
+
+def test_large_rewrite_starts_new_keyframe(app):
+    """Edge case: a delta as large as the text is stored as a keyframe."""
+    first = AutosaveService.save_snapshot("a" * 100, scene_id="scene-uuid")
+    second = AutosaveService.save_snapshot(
+        "b" * 100, scene_id="scene-uuid", previous=first
+    )
+    assert second.is_keyframe
+    assert second.content == "b" * 100
+
+
+def test_reencode_history_folds_full_copies(app):
+    """Normal case: legacy full-text rows are re-encoded into chains."""
+    from datetime import datetime, timedelta
+
+    base = datetime(2025, 1, 1)
+    texts = [("Chapter one text.\n" * 100) + f"edit {i}\n" for i in range(6)]
+    for i, text in enumerate(texts):
+        db.session.add(
+            AutosaveVersion(
+                id=f"legacy-{i}",
+                scene_id="scene-uuid",
+                content=text,
+                saved_at=base + timedelta(seconds=30 * i),
+            )
+        )
+    db.session.commit()
+    rows, before, after = AutosaveService.reencode_history(scene_id="scene-uuid")
+    db.session.commit()
+    assert rows == 6
+    assert after < before / 2
+    for i, text in enumerate(texts):
+        version = db.session.get(AutosaveVersion, f"legacy-{i}")
+        assert AutosaveService.get_content(version) == text
+    AutosaveService.reencode_history(scene_id="scene-uuid", interval=1)
+    db.session.commit()
+    assert AutosaveVersion.query.filter(AutosaveVersion.delta.isnot(None)).count() == 0
+
+
+def test_reencode_cli_command(app):
+    """Normal case: `flask autosave reencode` reports re-encoded rows."""
+    db.session.add(AutosaveVersion(id="v1", scene_id="scene-uuid", content="abc"))
+    db.session.commit()
+    result = app.test_cli_runner().invoke(args=["autosave", "reencode"])
+    assert result.exit_code == 0
+    assert "Re-encoded 1 versions across 1 targets" in result.output
+
+
+def test_save_snapshot_conditional_insert_blocks_racing_duplicate(app):
+    """Edge case: two workers that both missed the dedupe check insert once."""
+    first = AutosaveService.save_snapshot(
+        "same text", scene_id="scene-uuid", dedupe=True
+    )
+    second = AutosaveService.save_snapshot(
+        "same text", scene_id="scene-uuid", dedupe=True
+    )
+    assert first is not None
+    assert second is None
+    assert AutosaveVersion.query.count() == 1
+    assert first.content_hash == AutosaveService.content_hash("same text")
+
+
+def test_save_snapshot_dedupe_compares_latest_only(app):
+    """Edge case: reverting to an earlier text within the window is saved."""
+    a = AutosaveService.save_snapshot("text A", scene_id="scene-uuid", dedupe=True)
+    b = AutosaveService.save_snapshot(
+        "text B", scene_id="scene-uuid", previous=a, dedupe=True
+    )
+    again = AutosaveService.save_snapshot(
+        "text A", scene_id="scene-uuid", previous=b, dedupe=True
+    )
+    assert again is not None
+    assert AutosaveService.get_content(AutosaveService.latest("scene-uuid")) == "text A"
+
+
+def test_autosave_dedupe_indexes_exist(app):
+    """Normal case: (target, saved_at) indexes back the latest-version lookup."""
+    from sqlalchemy import inspect
+
+    indexes = {
+        index["name"]: index["column_names"]
+        for index in inspect(db.engine).get_indexes("autosave_versions")
+    }
+    assert indexes["ix_autosave_versions_scene_saved_at"] == ["scene_id", "saved_at"]
+    assert indexes["ix_autosave_versions_draft_saved_at"] == ["draft_id", "saved_at"]
@@ -0,0 +1,85 @@
+"""
+Unit tests for the ExportCache disk cache.
+"""
+
+import io
+import os
+import time
+
+from backend.app.services.export_cache import ExportCache
+
+
+def test_put_get_roundtrip(tmp_path):
+    """Normal case: a stored export is returned by path on the next get."""
+    cache = ExportCache(str(tmp_path), max_bytes=1024, max_age=60)
+    assert cache.get("proj", "pdf", "abc") is None
+    cache.put("proj", "pdf", "abc", io.BytesIO(b"%PDF-data"))
+    path = cache.get("proj", "pdf", "abc")
+    with open(path, "rb") as fh:
+        assert fh.read() == b"%PDF-data"
+    assert cache.get("proj", "docx", "abc") is None
+
+
+def test_evict_lru_over_size_limit(tmp_path):
+    """Edge case: least recently used entries are evicted first."""
+    cache = ExportCache(str(tmp_path), max_bytes=1024, max_age=3600)
+    for i, name in enumerate(["a", "b", "c"]):
+        cache.put("proj", "pdf", name, io.BytesIO(b"x" * 10))
+        os.utime(cache.path("proj", "pdf", name), (time.time() - 100 + i,) * 2)
+    # Reason: Touch "a" so it becomes most recently used
+    cache.get("proj", "pdf", "a")
+    cache.max_bytes = 25
+    assert cache.evict() == 1
+    assert cache.get("proj", "pdf", "a") is not None
+    assert cache.get("proj", "pdf", "b") is None
+    assert cache.get("proj", "pdf", "c") is not None
+
+
+def test_expired_entries_are_removed(tmp_path):
+    """Edge case: entries older than max_age miss and are deleted."""
+    cache = ExportCache(str(tmp_path), max_bytes=1024, max_age=60)
+    cache.put("proj", "docx", "old", io.BytesIO(b"doc"))
+    path = cache.path("proj", "docx", "old")
+    os.utime(path, (time.time() - 120,) * 2)
+    assert cache.get("proj", "docx", "old") is None
+    assert not os.path.exists(path)
+
+
+def test_put_failure_is_ignored(tmp_path):
+    """Failure case: an unwritable cache directory does not raise."""
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    cache = ExportCache(str(blocker / "exports"), max_bytes=1024, max_age=60)
+    stream = io.BytesIO(b"data")
+    cache.put("proj", "pdf", "abc", stream)
+    assert stream.tell() == 0
+    assert cache.get("proj", "pdf", "abc") is None
+
+
+def test_open_file_survives_eviction(tmp_path, monkeypatch):
+    """Edge case: an open hit stays readable; a file gone before open misses."""
+    cache = ExportCache(str(tmp_path), max_bytes=1024, max_age=60)
+    cache.put("proj", "pdf", "abc", io.BytesIO(b"%PDF-data"))
+    with cache.open_file("proj", "pdf", "abc") as fh:
+        os.remove(cache.path("proj", "pdf", "abc"))
+        assert fh.read() == b"%PDF-data"
+    # Reason: Simulate eviction between the freshness check and the open
+    monkeypatch.setattr(cache, "get", lambda *args: str(tmp_path / "evicted.pdf"))
+    assert cache.open_file("proj", "pdf", "abc") is None
+
+
+def test_put_failure_removes_temp_file(tmp_path):
+    """Failure case: a copy that fails midway leaves no .tmp file behind."""
+
+    class BrokenStream(io.BytesIO):
+        def read(self, *args):
+            if self.tell():
+                raise OSError("disk full")
+            return super().read(4)
+
+    cache = ExportCache(str(tmp_path), max_bytes=1024, max_age=60)
+    stream = BrokenStream(b"%PDF-data")
+    cache.put("proj", "pdf", "abc", stream)
+    assert stream.tell() == 0
+    assert os.listdir(tmp_path) == []
+    assert cache.get("proj", "pdf", "abc") is None
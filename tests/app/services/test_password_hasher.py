@@ -0,0 +1,68 @@
+"""
+Unit tests for the bounded password hashing pool.
+"""
+
+import threading
+
+import pytest
+
+from backend.app.services.password_hasher import (
+    HasherBusy,
+    PasswordHasher,
+    hash_method,
+)
+
+
+def test_run_returns_result():
+    """Normal case: jobs run on the pool and their result is returned."""
+    hasher = PasswordHasher(workers=2, max_queue=2)
+    assert hasher.run(lambda a, b: a + b, 2, 3) == 5
+    stats = hasher.stats()
+    assert stats["completed"] == 1
+    assert stats["in_flight"] == 0
+    hasher.shutdown()
+
+
+def test_run_rejects_when_saturated():
+    """Failure case: jobs beyond workers + max_queue raise HasherBusy."""
+    hasher = PasswordHasher(workers=1, max_queue=0, timeout=5)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    result = []
+    worker = threading.Thread(target=lambda: result.append(hasher.run(block)))
+    worker.start()
+    started.wait(5)
+    with pytest.raises(HasherBusy):
+        hasher.run(lambda: None)
+    release.set()
+    worker.join(5)
+    assert result == ["done"]
+    assert hasher.stats()["rejected"] == 1
+    # Reason: The slot is released once the blocking job finishes
+    assert hasher.run(lambda: "ok") == "ok"
+    hasher.shutdown()
+
+
+def test_run_times_out():
+    """Edge case: a job slower than the timeout raises HasherBusy."""
+    hasher = PasswordHasher(workers=1, max_queue=0, timeout=0.05)
+    release = threading.Event()
+    with pytest.raises(HasherBusy):
+        hasher.run(release.wait, 5)
+    release.set()
+    hasher.shutdown()
+    assert hasher.stats()["timeouts"] == 1
+
+
+def test_hash_method():
+    """Normal case: algorithm and cost map to werkzeug method strings."""
+    assert hash_method() == "scrypt:32768:8:1"
+    assert hash_method("pbkdf2", 1000) == "pbkdf2:sha256:1000"
+    with pytest.raises(ValueError):
+        hash_method("md5")
@@ -0,0 +1,121 @@
+"""
+Unit tests for pool settings from config and live pool statistics.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.utils.db_pool import engine_options
+
+POSTGRES = "postgresql://writer_user:writer_pass@db:5432/writer_db"
+
+
+@pytest.fixture
+def file_app(tmp_path):
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'pool.db'}",
+            "DB_POOL_SIZE": 1,
+            "DB_MAX_OVERFLOW": 0,
+            "DB_POOL_TIMEOUT": 1,
+        }
+    )
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_engine_options_from_config():
+    """Normal case: DB_POOL_* values become QueuePool engine options."""
+    options = engine_options(
+        {
+            "SQLALCHEMY_DATABASE_URI": POSTGRES,
+            "DB_POOL_SIZE": 8,
+            "DB_MAX_OVERFLOW": 2,
+            "DB_POOL_TIMEOUT": 5,
+            "DB_POOL_RECYCLE": 600,
+            "DB_POOL_PRE_PING": False,
+            "DB_STATEMENT_TIMEOUT_MS": 15000,
+        }
+    )
+    assert options == {
+        "poolclass": QueuePool,
+        "pool_size": 8,
+        "max_overflow": 2,
+        "pool_timeout": 5,
+        "pool_recycle": 600,
+        "pool_pre_ping": False,
+        "connect_args": {"options": "-c statement_timeout=15000"},
+    }
+
+
+def test_pgbouncer_profile_and_sqlite_memory():
+    """Edge case: pgbouncer sends no startup options; in-memory SQLite is untouched."""
+    options = engine_options(
+        {
+            "SQLALCHEMY_DATABASE_URI": POSTGRES,
+            "DB_POOL_PROFILE": "pgbouncer",
+            "DB_STATEMENT_TIMEOUT_MS": 15000,
+        }
+    )
+    assert options == {"poolclass": NullPool}
+    assert engine_options({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"}) == {}
+    with pytest.raises(ValueError):
+        engine_options({"SQLALCHEMY_DATABASE_URI": POSTGRES, "DB_POOL_PROFILE": "x"})
+
+
+def test_pool_stats_track_occupancy_and_waits(file_app):
+    """Normal case: checked-out count and the wait for a busy pool are reported."""
+    stats = file_app.extensions["db_pool"]
+    held = db.engine.connect()
+    assert stats.snapshot(db.engine.pool)["checked_out"] == 1
+
+    def release():
+        time.sleep(0.1)
+        held.close()
+
+    releaser = threading.Thread(target=release)
+    releaser.start()
+    with db.engine.connect():
+        pass
+    releaser.join()
+    snapshot = stats.snapshot(db.engine.pool)
+    assert snapshot["pool_class"] == "QueuePool"
+    assert snapshot["size"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["checkouts"] == snapshot["checkins"] >= 2
+    assert snapshot["wait_ms_max"] >= 80
+    assert snapshot["timeouts"] == 0
+
+
+def test_pool_timeout_is_counted(file_app):
+    """Failure case: a checkout that times out is counted and still raises."""
+    stats = file_app.extensions["db_pool"]
+    with db.engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            db.engine.connect()
+    snapshot = stats.snapshot(db.engine.pool)
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_ms_max"] >= 900
+
+
+def test_pool_endpoint(file_app):
+    """Normal case: GET /health/pool returns this worker's pool figures."""
+    client = file_app.test_client()
+    assert client.get("/health/pool").status_code == 401
+    token = AuthService.generate_token("user-1")
+    resp = client.get("/health/pool", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["profile"] == "default"
+    for key in ("checked_out", "overflow", "wait_ms_p95", "connects", "pid"):
+        assert key in data
@@ -0,0 +1,159 @@
+"""
+Unit tests for the cached ownership resolver used by access checks.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.utils.ownership import (
+    Ownership,
+    OwnershipCache,
+    invalidate_on_commit,
+    owns,
+    owns_all,
+    resolve,
+)
+from backend.models.annotation import Annotation
+from backend.models.chapter import Chapter
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+        for user in ("user-1", "user-2"):
+            db.session.add(Project(id=f"{user}-p", user_id=user, title="P"))
+            db.session.add(
+                Chapter(id=f"{user}-c", project_id=f"{user}-p", title="C", order=1)
+            )
+        db.session.add(Project(id="user-1-q", user_id="user-1", title="Q"))
+        db.session.add(
+            Chapter(id="user-1-d", project_id="user-1-q", title="D", order=1)
+        )
+        db.session.add(Scene(id="s1", chapter_id="user-1-c", title="S", order=1))
+        db.session.add(Draft(id="d1", scene_id="s1", content=""))
+        db.session.add(Annotation(id="a1", draft_id="d1"))
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+def _count_statements(app, fn):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = fn()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_resolve_walks_the_chain_once(app):
+    """Normal case: one join query resolves an annotation; repeats are cached."""
+    ownership, queries = _count_statements(app, lambda: resolve("annotation", "a1"))
+    assert queries == 1
+    assert ownership.user_id == "user-1"
+    assert ownership.project_id == "user-1-p"
+    assert ownership.ancestors == ("d1", "s1", "user-1-c", "user-1-p")
+    allowed, queries = _count_statements(
+        app, lambda: owns("annotation", "a1", "user-1")
+    )
+    assert allowed and queries == 0
+    with app.app_context():
+        assert not owns("annotation", "a1", "user-2")
+        assert not owns("scene", "missing", "user-1")
+        assert owns("project", "user-2-p", "user-2")
+
+
+def test_scene_move_invalidates_scene_and_descendants(app):
+    """Edge case: moving a scene to another project re-resolves it and its drafts."""
+    with app.app_context():
+        assert owns("scene", "s1", "user-1") and owns("draft", "d1", "user-1")
+        assert owns("chapter", "user-1-c", "user-1")
+        token = AuthService.generate_token("user-1")
+    resp = app.test_client().post(
+        "/scenes/reorder",
+        json={"moves": [{"id": "s1", "chapter_id": "user-1-d"}]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 200
+    cache = app.extensions["ownership_cache"]
+    assert cache.stats()["invalidations"] == 2
+    with app.app_context():
+        assert resolve("scene", "s1").project_id == "user-1-q"
+        assert resolve("draft", "d1").ancestors == ("s1", "user-1-d", "user-1-q")
+        # Reason: Unrelated entries survive the move
+        assert ("chapter", "user-1-c") in cache._entries
+
+
+def test_invalidation_waits_for_commit(app):
+    """Edge case: pending invalidations apply on commit and vanish on rollback."""
+    cache = app.extensions["ownership_cache"]
+    with app.app_context():
+        resolve("scene", "s1")
+        invalidate_on_commit(["s1"])
+        db.session.rollback()
+        assert len(cache) == 1
+        invalidate_on_commit(["s1"])
+        db.session.commit()
+        assert len(cache) == 0
+
+
+def test_owns_all_checks_a_batch_in_one_query(app):
+    """Normal case: cached rows cost nothing; the rest share one query."""
+    with app.app_context():
+        assert owns("chapter", "user-1-c", "user-1")
+    allowed, queries = _count_statements(
+        app, lambda: owns_all("chapter", ["user-1-c", "user-1-d"], "user-1")
+    )
+    assert allowed and queries == 1
+    with app.app_context():
+        assert not owns_all("chapter", ["user-1-c", "user-2-c"], "user-1")
+        assert not owns_all("chapter", ["user-1-d", "missing"], "user-1")
+        assert owns_all("scene", [], "user-2")
+
+
+def test_cache_is_bounded_and_ignores_stale_puts():
+    """Edge case: LRU eviction, TTL, and no put after a racing invalidation."""
+    cache = OwnershipCache(maxsize=2, ttl=60)
+    entry = Ownership("u", "p", ("p",))
+    for key in ("a", "b", "c"):
+        cache.put(("chapter", key), entry, cache.generation, now=1000)
+    assert cache.get(("chapter", "a"), now=1000) is None
+    assert cache.get(("chapter", "c"), now=1059) is entry
+    assert cache.get(("chapter", "c"), now=1060) is None
+    generation = cache.generation
+    cache.invalidate(["p"])
+    cache.put(("chapter", "d"), entry, generation, now=1000)
+    assert len(cache) == 0
+
+
+def test_cache_disabled():
+    """Failure case: OWNERSHIP_CACHE_SIZE=0 queries every time but still checks."""
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "OWNERSHIP_CACHE_SIZE": 0,
+        }
+    )
+    assert "ownership_cache" not in app.extensions
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="p", user_id="user-1", title="P"))
+        db.session.commit()
+        assert owns("project", "p", "user-1")
+        assert not owns("project", "p", "user-2")
@@ -0,0 +1,64 @@
+"""
+Unit tests for the query_budget marker and fixture in tests/conftest.py.
+"""
+
+import pytest
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.models.draft import Draft
+from backend.models.project import Project
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.add_all([Draft(scene_id="s", content="x") for _ in range(3)])
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+# Reason: Ownership check plus lookup, then the lookup alone once ownership is cached
+@pytest.mark.query_budget(2)
+def test_marker_counts_each_request_separately(app, auth_header):
+    """Normal case: a two- and a one-statement request fit a budget of two each."""
+    client = app.test_client()
+    client.get("/stats/projects/proj", headers=auth_header)
+    client.get("/stats/projects/proj", headers=auth_header)
+    with app.app_context():
+        # Reason: The test's own queries between requests are not counted
+        assert db.session.query(Draft).count() == 3
+        db.session.get(Project, "proj")
+
+
+def test_fixture_fails_over_budget_and_lists_statements(app, auth_header, query_budget):
+    """Failure case: exceeding the budget fails with the request's statements."""
+    client = app.test_client()
+    with pytest.raises(pytest.fail.Exception) as failure:
+        with query_budget(0):
+            client.get("/stats/projects/proj", headers=auth_header)
+    message = str(failure.value)
+    assert "GET /stats/projects/proj issued 2 SQL statements (budget 0)" in message
+    assert "1. SELECT" in message
+
+
+def test_fixture_counts_streamed_bodies(app, auth_header, query_budget):
+    """Edge case: statements run while a streamed body is read are counted."""
+    client = app.test_client()
+    with pytest.raises(pytest.fail.Exception):
+        with query_budget(0):
+            client.get("/drafts/?stream=true", headers=auth_header).get_data()
+    with query_budget(1):
+        client.get("/drafts/?stream=true", headers=auth_header).get_data()
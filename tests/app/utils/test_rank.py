@@ -0,0 +1,47 @@
+"""
+Unit tests for lexicographic rank keys.
+"""
+
+import random
+
+import pytest
+
+from backend.app.utils.rank import encode_position, rank_between
+
+
+def test_encode_position_sorts_like_integers():
+    """Normal case: encoded positions sort like the integers, negatives first."""
+    positions = [-1000, -1, 0, 1, 2, 10, 35, 36, 1000000]
+    keys = [encode_position(p) for p in positions]
+    assert keys == sorted(keys)
+    assert len(set(map(len, keys))) == 1
+
+
+def test_rank_between_random_inserts_stay_ordered():
+    """Normal case: repeated inserts always land strictly between neighbours."""
+    rng = random.Random(7)
+    ranks = [encode_position(1), encode_position(2)]
+    for _ in range(2000):
+        i = rng.randrange(len(ranks) + 1)
+        lower = ranks[i - 1] if i > 0 else None
+        upper = ranks[i] if i < len(ranks) else None
+        rank = rank_between(lower, upper)
+        assert not rank.endswith("0")
+        ranks.insert(i, rank)
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == len(ranks)
+
+
+def test_rank_between_adjacent_and_open_bounds():
+    """Edge case: adjacent keys and open-ended bounds still leave room."""
+    assert "a" < rank_between("a", "a1") < "a1"
+    assert rank_between(None, "1") < "1"
+    assert rank_between("zz", None) > "zz"
+
+
+def test_rank_between_rejects_inverted_bounds():
+    """Failure case: lower must sort before upper."""
+    with pytest.raises(ValueError):
+        rank_between("b", "a")
+    with pytest.raises(ValueError):
+        encode_position(36**6)
@@ -0,0 +1,123 @@
+"""
+Unit tests for per-endpoint request metrics and the Prometheus /metrics endpoint.
+"""
+
+import pytest
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.utils.request_metrics import Histogram
+from backend.models.draft import Draft
+from backend.models.project import Project
+
+STATS = 'endpoint="stats.project_stats",method="GET"'
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+        db.session.add(Project(id="proj", user_id="user-1", title="Book"))
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def auth_header(app):
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _scrape(client):
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/plain"
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in resp.get_data(as_text=True).splitlines()
+        if not line.startswith("#")
+    }
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Normal case: le buckets are cumulative and end with +Inf."""
+    histogram = Histogram("h", "Help.", ("endpoint",), (1, 5))
+    for value in (0.5, 1, 3, 9):
+        histogram.observe(("a",), value)
+    lines = []
+    histogram.render(lines)
+    assert lines[2:] == [
+        'h_bucket{endpoint="a",le="1"} 2',
+        'h_bucket{endpoint="a",le="5"} 3',
+        'h_bucket{endpoint="a",le="+Inf"} 4',
+        'h_sum{endpoint="a"} 13.5',
+        'h_count{endpoint="a"} 4',
+    ]
+
+
+def test_requests_are_recorded_per_endpoint(app, auth_header):
+    """Normal case: status, latency, sizes and SQL statements per endpoint."""
+    client = app.test_client()
+    for _ in range(2):
+        assert (
+            client.get("/stats/projects/proj", headers=auth_header).status_code == 200
+        )
+    assert client.get("/stats/projects/nope", headers=auth_header).status_code == 404
+    client.get("/no/such/route")
+    metrics = _scrape(client)
+    assert metrics[f'http_requests_total{{{STATS},status="200"}}'] == 2
+    assert metrics[f'http_requests_total{{{STATS},status="404"}}'] == 1
+    assert metrics[f"http_request_duration_seconds_count{{{STATS}}}"] == 3
+    assert metrics[f'http_request_duration_seconds_bucket{{{STATS},le="+Inf"}}'] == 3
+    assert metrics[f"http_response_size_bytes_sum{{{STATS}}}"] > 0
+    # Reason: A cold ownership check plus the lookup, then one statement per request
+    assert metrics[f"db_statements_per_request_sum{{{STATS}}}"] == 4
+    assert metrics[f'db_statements_per_request_bucket{{{STATS},le="1"}}'] == 2
+    assert metrics[f"db_statement_seconds_per_request_sum{{{STATS}}}"] > 0
+    unmatched = 'endpoint="unmatched",method="GET",status="404"'
+    assert metrics[f"http_requests_total{{{unmatched}}}"] == 1
+    assert "db_pool_checkouts_total" in metrics
+
+
+def test_streamed_response_measured_until_closed(app, auth_header):
+    """Edge case: streamed bodies count their bytes and the SQL run while streaming."""
+    with app.app_context():
+        db.session.add_all([Draft(scene_id="s", content="x" * 100) for _ in range(5)])
+        db.session.commit()
+    client = app.test_client()
+    resp = client.get("/drafts/?stream=true", headers=auth_header)
+    body = resp.get_data()
+    resp.close()
+    labels = 'endpoint="drafts.get_drafts",method="GET"'
+    metrics = _scrape(client)
+    assert metrics[f"http_response_size_bytes_sum{{{labels}}}"] == len(body)
+    assert metrics[f"db_statements_per_request_sum{{{labels}}}"] >= 1
+
+
+def test_queries_outside_requests_are_not_counted(app, auth_header):
+    """Edge case: statements run outside a request are never attributed to one."""
+    client = app.test_client()
+    client.get("/stats/projects/proj", headers=auth_header)
+    with app.app_context():
+        for _ in range(3):
+            db.session.get(Project, "proj")
+            db.session.expire_all()
+    metrics = _scrape(client)
+    assert metrics[f"db_statements_per_request_sum{{{STATS}}}"] == 2
+
+
+def test_metrics_disabled():
+    """Failure case: METRICS_ENABLED=false registers no hooks and hides /metrics."""
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "METRICS_ENABLED": False,
+        }
+    )
+    assert "request_metrics" not in app.extensions
+    assert app.test_client().get("/metrics").status_code == 404
@@ -0,0 +1,103 @@
+"""
+Unit tests for the orjson-backed row encoders and JSON provider.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from flask import jsonify
+
+from backend.app import create_app, db
+from backend.app.schemas.draft_schema import DraftSchema
+from backend.app.schemas.scene_schema import SceneSchema
+from backend.app.utils.pagination import stream_json_array
+from backend.app.utils.serializer import (
+    DRAFT_ENCODER,
+    PROJECT_ENCODER,
+    SCENE_ENCODER,
+    RowEncoder,
+)
+from backend.models.draft import Draft
+from backend.models.project import Project
+from backend.models.scene import Scene
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+def test_encoders_match_schema_dumps():
+    """Normal case: encoded rows equal the marshmallow dumps they replace."""
+    stamp = datetime(2025, 1, 2, 3, 4, 5, 678901)
+    scene = Scene(
+        id="s1",
+        chapter_id="c1",
+        title="Opening",
+        content=None,
+        order=3,
+        rank="i00003i",
+        created_at=stamp,
+        updated_at=datetime(2025, 1, 2),
+    )
+    draft = Draft(id="d1", scene_id="s1", content="x", created_at=stamp)
+    assert json.loads(SCENE_ENCODER.dumps(scene)) == SceneSchema().dump(scene)
+    assert json.loads(DRAFT_ENCODER.dumps_many([draft])) == [DraftSchema().dump(draft)]
+
+
+def test_encoder_matches_hand_built_dicts():
+    """Normal case: project rows encode like the old isoformat() dicts."""
+    project = Project(
+        id="p1",
+        user_id="u1",
+        title="Book",
+        description="",
+        created_at=datetime(2025, 5, 1, 12, 0),
+        updated_at=None,
+    )
+    assert json.loads(PROJECT_ENCODER.dumps(project)) == {
+        "id": "p1",
+        "title": "Book",
+        "description": "",
+        "created_at": project.created_at.isoformat(),
+        "updated_at": None,
+    }
+
+
+def test_single_field_encoder():
+    """Edge case: a one-field encoder still yields a dict per row."""
+    encoder = RowEncoder(["id"])
+    assert encoder.rows([Project(id="p1"), Project(id="p2")]) == [
+        {"id": "p1"},
+        {"id": "p2"},
+    ]
+
+
+def test_jsonify_uses_orjson_with_flask_semantics(app):
+    """Edge case: jsonify keeps sorted keys, int keys and HTTP dates."""
+    with app.test_request_context():
+        resp = jsonify({"b": 1, "a": {0: "x"}, "when": datetime(2025, 1, 1)})
+    assert resp.get_data() == (
+        b'{"a":{"0":"x"},"b":1,"when":"Wed, 01 Jan 2025 00:00:00 GMT"}\n'
+    )
+    with app.test_request_context():
+        with pytest.raises(TypeError):
+            jsonify({"bad": object()})
+
+
+def test_streamed_drafts_are_one_json_array(app):
+    """Normal case: chunked streaming joins encoded chunks into valid JSON."""
+    with app.app_context():
+        for i in range(7):
+            db.session.add(Draft(id=f"d{i}", scene_id="s1", content=str(i)))
+        db.session.commit()
+    with app.test_request_context():
+        resp = stream_json_array(Draft.query, Draft, DRAFT_ENCODER, chunk_size=3)
+        body = b"".join(resp.response)
+    assert [d["id"] for d in json.loads(body)] == [f"d{i}" for i in range(7)]
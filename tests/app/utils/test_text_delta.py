@@ -0,0 +1,52 @@
+"""
+Unit tests for text delta diff/apply helpers.
+"""
+
+import pytest
+from backend.app.utils import text_delta
+
+
+def test_diff_apply_roundtrip():
+    """Normal case: applying a diff reproduces the new text."""
+    old = "It was a dark night.\nThe rain fell.\nShe waited.\n"
+    new = "It was a dark and stormy night.\nThe rain fell.\nHe waited.\n"
+    ops = text_delta.diff(old, new)
+    assert text_delta.apply(old, ops) == new
+
+
+def test_diff_is_compact_for_local_edit():
+    """Normal case: a one-word insert in a long text stays tiny."""
+    old = "word " * 10000
+    new = old[:20000] + "inserted " + old[20000:]
+    ops = text_delta.diff(old, new)
+    assert ops == [20000, "inserted "]
+    assert len(text_delta.dumps(ops)) < 30
+
+
+def test_diff_identical_and_empty():
+    """Edge case: identical texts give no ops, empty texts round-trip."""
+    assert text_delta.diff("same", "same") == []
+    assert text_delta.apply("", text_delta.diff("", "new")) == "new"
+    assert text_delta.apply("old", text_delta.diff("old", "")) == ""
+
+
+def test_apply_rejects_invalid_ops():
+    """Failure case: operations past the end or of unknown type raise."""
+    with pytest.raises(ValueError):
+        text_delta.apply("abc", [5])
+    with pytest.raises(ValueError):
+        text_delta.apply("abc", [-4])
+    with pytest.raises(ValueError):
+        text_delta.apply("abc", [True])
+
+
+def test_from_operations_matches_compact_ops():
+    """Normal case: client operation objects map onto compact ops."""
+    ops = text_delta.from_operations(
+        [{"retain": 4}, {"retain": 2}, {"delete": 3}, {"insert": "ab"}]
+    )
+    assert ops == [6, -3, "ab"]
+    assert text_delta.apply("abcdefghij", ops) == "abcdefabj"
+    for bad in ([{"retain": -1}], [{"insert": ""}], [{"delete": True}], ["x"]):
+        with pytest.raises(ValueError):
+            text_delta.from_operations(bad)
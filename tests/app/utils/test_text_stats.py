@@ -0,0 +1,32 @@
+"""
+Unit tests for scene text statistics helpers.
+"""
+
+from backend.app.utils import text_stats
+
+
+def test_compute_counts():
+    """Normal case: words, characters, paragraphs and dialogue lines."""
+    text = "The rain fell.\n\n\"Come in,\" she said.\n— Thanks.\n  \n'Quiet.'\n"
+    assert text_stats.compute(text) == {
+        "word_count": 10,
+        "char_count": len(text),
+        "paragraph_count": 4,
+        "dialogue_count": 3,
+    }
+
+
+def test_compute_empty():
+    """Edge case: None and empty text count as zero."""
+    assert text_stats.compute(None) == text_stats.EMPTY
+    assert text_stats.compute("") == text_stats.EMPTY
+
+
+def test_difference_and_add():
+    """Normal case: only changed fields appear in a difference."""
+    old = text_stats.compute("One two.")
+    new = text_stats.compute("One two three.")
+    delta = text_stats.difference(new, old)
+    assert delta == {"word_count": 1, "char_count": 6}
+    assert text_stats.add(dict(old), delta) == new
+    assert text_stats.difference(old, old) == {}
@@ -0,0 +1,112 @@
+"""
+Unit tests for the verified-token cache and the cached jwt_required path.
+"""
+
+import time
+
+import pytest
+from flask_jwt_extended import JWTManager, create_access_token, create_refresh_token
+
+from backend.app import create_app, db
+from backend.app.services.auth_service import AuthService
+from backend.app.utils.token_cache import TokenCache
+
+
+@pytest.fixture
+def app():
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+def test_cache_hit_and_ttl():
+    """Normal case: entries are served until the TTL elapses."""
+    cache = TokenCache(maxsize=10, ttl=60)
+    cache.put("tok", {"user_id": "u1"}, now=1000)
+    assert cache.get("tok", now=1059) == {"user_id": "u1"}
+    assert cache.get("tok", now=1060) is None
+    assert len(cache) == 0
+
+
+def test_cache_never_outlives_exp():
+    """Edge case: exp earlier than the TTL bounds the entry lifetime."""
+    cache = TokenCache(maxsize=10, ttl=300)
+    cache.put("tok", {"user_id": "u1", "exp": 1010}, now=1000)
+    assert cache.get("tok", now=1009) is not None
+    assert cache.get("tok", now=1010) is None
+    # Reason: Already-expired payloads are never stored
+    cache.put("old", {"user_id": "u1", "exp": 900}, now=1000)
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Edge case: the cache stays bounded and evicts the LRU token."""
+    cache = TokenCache(maxsize=2, ttl=60)
+    cache.put("a", {"user_id": "a"}, now=0)
+    cache.put("b", {"user_id": "b"}, now=0)
+    cache.get("a", now=1)
+    cache.put("c", {"user_id": "c"}, now=1)
+    assert cache.get("b", now=1) is None
+    assert cache.get("a", now=1) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_protected_route_verifies_token_once(app, monkeypatch):
+    """Normal case: repeated requests with one token decode it once."""
+    calls = []
+    decode = AuthService.decode_token
+
+    def counting_decode(token):
+        calls.append(token)
+        return decode(token)
+
+    monkeypatch.setattr(AuthService, "decode_token", staticmethod(counting_decode))
+    with app.app_context():
+        token = AuthService.generate_token("user-1")
+    client = app.test_client()
+    for _ in range(5):
+        resp = client.get(
+            "/autosave/buffer", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert resp.status_code == 200
+    assert len(calls) == 1
+    assert app.extensions["token_cache"].stats()["hits"] == 4
+
+
+def test_expired_token_not_served_from_cache(app):
+    """Failure case: a cached token is rejected once its exp has passed."""
+    with app.app_context():
+        token = AuthService.generate_token("user-1", expires_in=1)
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/autosave/buffer", headers=headers).status_code == 200
+    time.sleep(1.1)
+    assert client.get("/autosave/buffer", headers=headers).status_code == 401
+
+
+def test_flask_jwt_extended_tokens_share_fast_path(app):
+    """Normal case: access tokens use "sub"; refresh tokens are rejected."""
+    JWTManager(app)
+    with app.app_context():
+        access = create_access_token(identity="user-2")
+        refresh = create_refresh_token(identity="user-2")
+        assert AuthService.verify_token(access)["user_id"] == "user-2"
+        assert AuthService.verify_token(refresh) is None
+    client = app.test_client()
+    resp = client.get("/drafts/", headers={"Authorization": f"Bearer {refresh}"})
+    assert resp.status_code == 401
+
+
+def test_cache_disabled_by_config():
+    """Edge case: AUTH_TOKEN_CACHE_SIZE=0 disables caching."""
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "AUTH_TOKEN_CACHE_SIZE": 0,
+        }
+    )
+    assert "token_cache" not in app.extensions
@@ -0,0 +1,108 @@
+"""
+Shared test helpers: SQL statement budgets per request.
+
+Mark a test with ``@pytest.mark.query_budget(n)`` and it fails when any
+request it makes issues more than n SQL statements; the failure lists the
+offending request's statements. The ``query_budget`` fixture does the same
+for a block inside a test::
+
+    with query_budget(2):
+        client.get("/timeline/proj-1")
+"""
+
+import threading
+
+import pytest
+from flask import has_request_context, request, request_started
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudget:
+    """
+    Counts the SQL statements of each request made on this thread.
+
+    A request's statements are those run inside its request context, from
+    request_started until the next request (or the end of the block), so
+    bodies streamed after the view returns are included and queries the
+    test itself makes between requests are not.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.violations = []
+        self._thread = threading.get_ident()
+        self._label = None
+        self._statements = []
+
+    def __enter__(self):
+        request_started.connect(self._request_started, weak=False)
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+        request_started.disconnect(self._request_started)
+        self._close_request()
+
+    def _request_started(self, sender, **extra):
+        if threading.get_ident() != self._thread:
+            return
+        self._close_request()
+        self._label = f"{request.method} {request.full_path.rstrip('?')}"
+
+    def _before_cursor_execute(self, conn, cursor, statement, *args):
+        if (
+            self._label is not None
+            and threading.get_ident() == self._thread
+            and has_request_context()
+        ):
+            self._statements.append(statement)
+
+    def _close_request(self):
+        if self._label is not None and len(self._statements) > self.budget:
+            self.violations.append((self._label, self._statements))
+        self._label, self._statements = None, []
+
+    def report(self) -> str:
+        lines = []
+        for label, statements in self.violations:
+            lines.append(
+                f"{label} issued {len(statements)} SQL statements "
+                f"(budget {self.budget}):"
+            )
+            lines.extend(f"  {i}. {s}" for i, s in enumerate(statements, 1))
+        return "\n".join(lines)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail if any request in the test issues more than n "
+        "SQL statements",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+    with QueryBudget(*marker.args, **marker.kwargs) as budget:
+        result = yield
+    if budget.violations:
+        pytest.fail(budget.report(), pytrace=False)
+    return result
+
+
+class _BudgetBlock(QueryBudget):
+    def __exit__(self, *exc):
+        super().__exit__(*exc)
+        if self.violations and exc[0] is None:
+            pytest.fail(self.report(), pytrace=False)
+
+
+@pytest.fixture
+def query_budget():
+    """Context manager enforcing a per-request statement budget on a block."""
+    return _BudgetBlock